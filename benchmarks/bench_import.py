@@ -0,0 +1,74 @@
+"""Measure the cold import time of the usports packages, and which heavy dependencies they load.
+
+Each statement runs in a fresh interpreter, so module caches never carry over between runs.
+
+Usage:
+    python benchmarks/bench_import.py --repeat 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import usports",
+    "import usports.basketball",
+    "import usports.utils",
+    "from usports.utils import USportsSession",
+    "from usports.basketball import usports_bball_players",
+    "from usports import fetch_all",
+]
+
+HEAVY_MODULES = ["pandas", "httpx", "bs4"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(statement: str, repeat: int) -> dict:
+    """Median cold import time of `statement` over `repeat` fresh interpreters."""
+    times = []
+    loaded: list[str] = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        result = json.loads(out.stdout)
+        times.append(result["seconds"])
+        loaded = result["loaded"]
+
+    return {"median_seconds": statistics.median(times), "min_seconds": min(times), "loaded": loaded}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per statement")
+    parser.add_argument("--save", help="Write the results as JSON")
+    args = parser.parse_args(argv)
+
+    results = {statement: measure(statement, args.repeat) for statement in STATEMENTS}
+
+    print(f"{'statement':<58}{'median ms':>10}{'min ms':>10}  loaded")
+    for statement, result in results.items():
+        loaded = ", ".join(result["loaded"]) or "-"
+        print(f"{statement:<58}{result['median_seconds'] * 1000:>10.1f}{result['min_seconds'] * 1000:>10.1f}  {loaded}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""Benchmark the players/teams/standings pipelines of every sport against recorded HTML fixtures.
+
+Pages are replayed from a fixture directory (see FixtureStore), so runs are offline and repeatable.
+Each pipeline reports wall time plus per-stage time, call count and peak memory:
+
+- fetch: reading the page (from fixtures)
+- tokenize: HTML parsing into tables (extract_tables)
+- parse_table: the sport's _parse_*_table functions
+- merge: the sport's _merge_* functions
+- convert_types: dtype conversion
+
+Usage:
+    # record fixtures once (needs network)
+    python benchmarks/bench_pipelines.py --fixtures fixtures/ --record
+
+    python benchmarks/bench_pipelines.py --fixtures fixtures/ --save baseline.json
+    python benchmarks/bench_pipelines.py --fixtures fixtures/ --compare baseline.json --tolerance 0.2
+"""
+
+import argparse
+import functools
+import importlib
+import inspect
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from usports.batch import KINDS, SPORTS, BatchKey, _run_job, plan_batch
+from usports.utils import FixtureStore, USportsSession, disable_result_cache
+from usports.utils import helpers as helpers_module
+
+STAGES = ["fetch", "tokenize", "parse_table", "merge", "convert_types"]
+SPORT_MODULES = ["player_stats", "team_stats", "standings"]
+
+
+class StageRecorder:
+    """Accumulates time, calls and peak memory per stage for the pipeline being measured."""
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.seconds: dict[str, float] = defaultdict(float)
+        self.calls: dict[str, int] = defaultdict(int)
+        self.peak_bytes: dict[str, int] = defaultdict(int)
+        self.pipeline_peak = 0
+
+    def _enter(self) -> tuple[int, float]:
+        current = 0
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            self.pipeline_peak = max(self.pipeline_peak, peak)
+            tracemalloc.reset_peak()
+        return current, time.perf_counter()
+
+    def _exit(self, stage: str, current: int, start: float) -> None:
+        self.seconds[stage] += time.perf_counter() - start
+        self.calls[stage] += 1
+        if tracemalloc.is_tracing():
+            _, peak = tracemalloc.get_traced_memory()
+            self.peak_bytes[stage] = max(self.peak_bytes[stage], peak - current)
+            self.pipeline_peak = max(self.pipeline_peak, peak)
+
+    def wrap(self, stage: str, func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                current, start = self._enter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self._exit(stage, current, start)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            current, start = self._enter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._exit(stage, current, start)
+
+        return wrapper
+
+
+def _stage_for(name: str) -> str | None:
+    if name.startswith("_parse_") and name.endswith("_table"):
+        return "parse_table"
+    if name.startswith("_merge_"):
+        return "merge"
+    if name == "convert_types":
+        return "convert_types"
+    return None
+
+
+def instrument(recorder: StageRecorder) -> None:
+    """Wrap the stage functions of the fetch layer and every sport module with the recorder."""
+    helpers_module._fetch_page_text = recorder.wrap("fetch", helpers_module._fetch_page_text)
+    helpers_module.extract_tables = recorder.wrap("tokenize", helpers_module.extract_tables)
+
+    for sport in SPORTS:
+        for submodule in SPORT_MODULES:
+            module = importlib.import_module(f"usports.{sport}.{submodule}")
+            for name, value in list(vars(module).items()):
+                stage = _stage_for(name)
+                if stage is not None and callable(value):
+                    setattr(module, name, recorder.wrap(stage, value))
+
+
+def run_pipeline(session: USportsSession, recorder: StageRecorder, key: BatchKey, repeat: int) -> dict[str, Any]:
+    """
+    Run one pipeline `repeat` times and keep the stage timings of the fastest run, then once
+    more under tracemalloc for peak memory (tracing is too slow to time the runs with).
+    """
+    times = []
+    result: dict[str, Any] = {}
+
+    for _ in range(repeat):
+        recorder.reset()
+        start = time.perf_counter()
+        session.run(_run_job(key))
+        elapsed = time.perf_counter() - start
+
+        times.append(elapsed)
+        if elapsed <= min(times):
+            result["seconds"] = elapsed
+            result["stages"] = {
+                stage: {"seconds": recorder.seconds[stage], "calls": recorder.calls[stage]} for stage in STAGES
+            }
+
+    recorder.reset()
+    tracemalloc.start()
+    try:
+        session.run(_run_job(key))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result["median_seconds"] = statistics.median(times)
+    result["peak_bytes"] = max(peak, recorder.pipeline_peak)
+    for stage in STAGES:
+        result["stages"][stage]["peak_bytes"] = recorder.peak_bytes[stage]
+
+    return result
+
+
+def _format_key(key: BatchKey) -> str:
+    return "/".join(part for part in key if part is not None)
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float, min_delta: float) -> list[str]:
+    """
+    Return the pipelines (and stages) that got slower than the baseline by more than `tolerance`,
+    ignoring slowdowns under `min_delta` seconds (timer noise on tiny stages).
+    """
+
+    def slower(before: float, after: float) -> bool:
+        return after > before * (1 + tolerance) and after - before >= min_delta
+
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        if slower(previous["seconds"], result["seconds"]):
+            regressions.append(f"{name}: {previous['seconds']:.4f}s -> {result['seconds']:.4f}s")
+
+        for stage, figures in result["stages"].items():
+            before = previous["stages"].get(stage, {}).get("seconds", 0.0)
+            if slower(before, figures["seconds"]):
+                regressions.append(f"{name} [{stage}]: {before:.4f}s -> {figures['seconds']:.4f}s")
+
+    return regressions
+
+
+def print_report(results: dict[str, Any]) -> None:
+    header = f"{'pipeline':<38}{'total':>10}{'peak MiB':>10}" + "".join(f"{stage:>14}" for stage in STAGES)
+    print(header)
+    print("-" * len(header))
+    for name, result in results.items():
+        stages = "".join(f"{result['stages'][stage]['seconds']:>14.4f}" for stage in STAGES)
+        print(f"{name:<38}{result['seconds']:>10.4f}{result['peak_bytes'] / 2**20:>10.1f}{stages}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", required=True, help="Fixture directory to replay (or record into)")
+    parser.add_argument("--record", action="store_true", help="Fetch live pages and record them as fixtures")
+    parser.add_argument("--sports", nargs="+", choices=SPORTS)
+    parser.add_argument("--leagues", nargs="+", default=["m", "w"], choices=["m", "w"])
+    parser.add_argument("--kinds", nargs="+", choices=KINDS)
+    parser.add_argument("--seasons", nargs="+", default=["regular"], choices=["regular", "playoffs", "championship"])
+    parser.add_argument("--parser", help="Parser backend: html.parser, lxml or selectolax")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per pipeline; the fastest one is reported")
+    parser.add_argument("--save", help="Write the results as JSON (e.g. a new baseline)")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown before failing (0.2 = 20%%)")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="Ignore slowdowns under this many seconds")
+    args = parser.parse_args(argv)
+
+    disable_result_cache()
+    plan = plan_batch(args.sports, args.leagues, args.kinds, args.seasons)
+
+    if args.record:
+        with USportsSession(fixtures=FixtureStore(args.fixtures, "record")) as session:
+            for key in plan:
+                try:
+                    session.run(_run_job(key))
+                    print(f"recorded {_format_key(key)}")
+                except Exception as e:  # pylint: disable=broad-except
+                    print(f"failed to record {_format_key(key)}: {e}", file=sys.stderr)
+        return 0
+
+    recorder = StageRecorder()
+    instrument(recorder)
+
+    results: dict[str, Any] = {}
+    with USportsSession(fixtures=FixtureStore(args.fixtures, "replay"), parser=args.parser) as session:
+        for key in plan:
+            try:
+                results[_format_key(key)] = run_pipeline(session, recorder, key, max(args.repeat, 1))
+            except Exception as e:  # pylint: disable=broad-except
+                print(f"skipping {_format_key(key)}: {e}", file=sys.stderr)
+
+    print_report(results)
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance, args.min_delta)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions), file=sys.stderr)
+            return 1
+        print(f"\nNo regressions beyond {args.tolerance:.0%}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,9 @@
+import pytest
+
+from .mock_site import MockSite
+
+
+@pytest.fixture
+def site() -> MockSite:
+    """A mock U Sports site; use `site.session()` as the active session."""
+    return MockSite()
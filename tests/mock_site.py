@@ -0,0 +1,67 @@
+"""A mock U Sports site for offline tests: canned pages served through httpx.MockTransport."""
+
+from collections.abc import Callable, Iterable
+
+import httpx
+
+from usports.utils import USportsSession
+
+Response = str | int | Callable[[httpx.Request], httpx.Response]
+
+
+class MockSite:
+    """
+    Serves canned pages by URL fragment and records every request.
+    A route's response is the page body, an HTTP status code, or a handler for full control;
+    URLs matching no route get the default page.
+    """
+
+    def __init__(self, html: str = "") -> None:
+        self.html = html
+        self.requests: list[httpx.Request] = []
+        self.routes: list[tuple[str, Response]] = []
+
+    def route(self, fragment: str, response: Response) -> None:
+        """Serve `response` for URLs containing `fragment` (the latest matching route wins)."""
+        self.routes.insert(0, (fragment, response))
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        response: Response = self.html
+        for fragment, routed in self.routes:
+            if fragment in str(request.url):
+                response = routed
+                break
+
+        if callable(response):
+            return response(request)
+        if isinstance(response, int):
+            return httpx.Response(response)
+        return httpx.Response(200, text=response)
+
+    def session(self, **kwargs) -> USportsSession:
+        return USportsSession(transport=httpx.MockTransport(self.handler), **kwargs)
+
+    def urls(self) -> list[str]:
+        return [str(request.url) for request in self.requests]
+
+
+def stats_table(
+    players: Iterable[tuple[str, str]], columns: int = 30, cell: Callable[[int, int], str] = lambda row, _: str(row)
+) -> str:
+    """
+    A players stats table: a header row, then one row per (name, school) with the rank, name,
+    school and `columns` stat cells given by `cell(row, column)`.
+    """
+    rows = "".join(
+        f"<tr><td>{rank}</td><td>{name}</td><td>{school}</td>"
+        + "".join(f"<td>{cell(rank, column)}</td>" for column in range(columns))
+        + "</tr>"
+        for rank, (name, school) in enumerate(players, 1)
+    )
+    return f"<table><tr><th>Rk</th><th>Name</th></tr>{rows}</table>"
+
+
+def stats_page(*tables: str, padding: int = 0) -> str:
+    """A page holding `tables`, after `padding` layout tables without stats."""
+    return "<html><body>" + "<table><tr><td>-</td></tr></table>" * padding + "".join(tables) + "</body></html>"
@@ -3,8 +3,16 @@
 import pandas as pd
 import pytest
 
-from usports.basketball import usports_bball_players, usports_bball_standings, usports_bball_teams
+from usports.basketball import (
+    usports_bball_leaders,
+    usports_bball_players,
+    usports_bball_standings,
+    usports_bball_teams,
+)
+from usports.basketball.constants import PLAYER_SORT_CATEGORIES
+from usports.utils import select_columns
 
+from .mock_site import stats_page, stats_table
 from .test_data import (
     expected_basketball_players_columns,
     expected_basketball_standings_columns,
@@ -95,3 +103,54 @@ class TestBasketballPlayers:
         for col in stats_exclusive:
             assert col in teams_df.columns, f"Stats missing: {col}"
             assert col not in standings_df.columns, f"Standings shouldn't have: {col}"
+
+
+def _players_page(players: list[tuple[str, str]]) -> str:
+    # games played and started, then 'made-attempted' pairs for every stat
+    table = stats_table(players, columns=12, cell=lambda row, column: str(row) if column < 2 else f"{row}-{2 * row}")
+    return stats_page(*[table] * 3, padding=3)
+
+
+class TestBasketballPlayerPages:
+    """Offline: each sort page lists its own leaders, so every page is needed for the full set of players."""
+
+    @pytest.fixture
+    def players_site(self, site):
+        site.html = _players_page([("Doe J.", "UBC"), ("Roe A.", "UBC")])
+        site.route("sort=oreb", _players_page([("Poe E.", "McGill")]))
+        site.route("sort=pf", _players_page([("Moe B.", "Laval")]))
+        return site
+
+    @pytest.mark.parametrize(
+        "columns", [["minutes_played"], ["total_rebounds", "field_goal_attempted"], ["personal_fouls"]]
+    )
+    def test_columns_select_from_the_full_frame(self, players_site, columns):
+        with players_site.session():
+            expected = select_columns(usports_bball_players("m"), columns)
+        with players_site.session():
+            df = usports_bball_players("m", columns=columns)
+
+        assert len(players_site.requests) == 2 * len(PLAYER_SORT_CATEGORIES)
+        assert len(df) == 4
+        pd.testing.assert_frame_equal(df, expected)
+
+
+class TestBasketballLeaders:
+    """Offline: a leaderboard is the first rows of the one page sorted by its category."""
+
+    def test_leaders_come_from_the_single_sorted_page(self, site):
+        site.html = _players_page([("Doe J.", "UBC"), ("Roe A.", "UBC"), ("Poe E.", "McGill")])
+        with site.session():
+            leaders = usports_bball_leaders("m", "pts", n=2)
+
+        assert len(site.requests) == 1 and site.requests[0].url.params["sort"] == "pts"
+        assert leaders["lastname_initials"].tolist() == ["Doe", "Roe"]
+        assert leaders["field_goal_attempted"].tolist() == [2, 4]
+
+    @pytest.mark.parametrize("category, n", [("nope", 10), ("pts", 0)])
+    def test_invalid_arguments_raise_before_fetching(self, site, category, n):
+        with site.session():
+            with pytest.raises(ValueError):
+                usports_bball_leaders("m", category, n=n)
+
+        assert not site.requests
@@ -0,0 +1,82 @@
+"""Benchmark harness tests (offline, pages recorded from a mock site)."""
+
+import asyncio
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from usports.basketball import usports_bball_standings
+from usports.utils import FixtureStore
+
+from .test_utils import STANDINGS_HTML
+
+ROOT = Path(__file__).parent.parent
+BENCH_PIPELINES = ROOT / "benchmarks" / "bench_pipelines.py"
+
+
+@pytest.fixture(name="bench", scope="module")
+def bench_pipelines():
+    spec = importlib.util.spec_from_file_location("bench_pipelines", BENCH_PIPELINES)
+    module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+    spec.loader.exec_module(module)  # type: ignore[union-attr]
+    return module
+
+
+def _result(seconds: float, parse_seconds: float) -> dict:
+    return {"seconds": seconds, "stages": {"parse_table": {"seconds": parse_seconds}}}
+
+
+class TestBenchPipelines:
+    def test_stage_recorder_times_sync_and_async_calls(self, bench):
+        recorder = bench.StageRecorder()
+
+        async def fetch() -> str:
+            return "page"
+
+        assert recorder.wrap("merge", lambda x: x + 1)(1) == 2
+        assert asyncio.run(recorder.wrap("fetch", fetch)()) == "page"
+        asyncio.run(recorder.wrap("fetch", fetch)())
+
+        assert recorder.calls == {"merge": 1, "fetch": 2}
+        assert recorder.seconds["fetch"] > 0
+
+    def test_compare_reports_only_slowdowns_beyond_tolerance(self, bench):
+        baseline = {"a": _result(1.0, 0.5), "b": _result(1.0, 0.001)}
+        results = {"a": _result(1.5, 0.55), "b": _result(1.1, 0.004), "new": _result(9.0, 9.0)}
+
+        regressions = bench.compare(results, baseline, tolerance=0.2, min_delta=0.005)
+
+        # 'b' parse_table tripled but by less than min_delta; pipelines missing from the baseline are skipped
+        assert regressions == ["a: 1.0000s -> 1.5000s"]
+
+    def test_replayed_pipeline_reports_every_stage(self, site, tmp_path):
+        site.html = STANDINGS_HTML
+        with site.session(fixtures=FixtureStore(tmp_path / "fixtures", "record")):
+            usports_bball_standings("m")
+
+        def run(*args: str) -> subprocess.CompletedProcess:
+            command = [sys.executable, str(BENCH_PIPELINES), "--fixtures", str(tmp_path / "fixtures")]
+            command += ["--sports", "basketball", "--leagues", "m", "--kinds", "standings", "--repeat", "1", *args]
+            env = {**os.environ, "PYTHONPATH": str(ROOT)}
+            return subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True, check=False)
+
+        saved = run("--save", str(tmp_path / "baseline.json"))
+        assert saved.returncode == 0, saved.stderr
+
+        results = json.loads((tmp_path / "baseline.json").read_text())
+        stages = results["basketball/m/standings"]["stages"]
+        assert stages["fetch"]["calls"] == 1 and stages["tokenize"]["calls"] == 1
+        assert stages["parse_table"]["calls"] >= 1 and stages["convert_types"]["calls"] >= 1
+
+        # A baseline that ran in no time at all makes any run a regression
+        for result in results.values():
+            result["seconds"] = 0.0
+        (tmp_path / "fast.json").write_text(json.dumps(results))
+        compared = run("--compare", str(tmp_path / "fast.json"), "--min-delta", "0")
+        assert compared.returncode == 1
+        assert "Regressions" in compared.stderr
@@ -3,8 +3,10 @@
 import pandas as pd
 import pytest
 
-from usports.football import usports_fball_players, usports_fball_standings, usports_fball_teams
+from usports.football import usports_fball_leaders, usports_fball_players, usports_fball_standings, usports_fball_teams
+from usports.football.constants import FBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING, PLAYER_POSITION_TABLES
 
+from .mock_site import stats_page, stats_table
 from .test_data import (
     expected_football_column_names,
     expected_football_players_df_column,
@@ -74,3 +76,39 @@ class TestFootballPlayers:
         for col in numeric_cols:
             if col in df.columns:
                 assert df[col].dtype in ["int64", "float64"], f"{col} should be numeric, got {df[col].dtype}"
+
+
+QUARTERBACKS = [("Doe J.", "Laval"), ("Roe A.", "UBC"), ("Poe E.", "Western")]
+KICKERS = [("Boot K.", "Queen's"), ("Foot L.", "Calgary")]
+# Each position's table lists that position's players
+LEADERS_PAGE = stats_page(
+    *(
+        stats_table(KICKERS if table == PLAYER_POSITION_TABLES["k"] else QUARTERBACKS)
+        for table in range(len(FBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING))
+    )
+)
+
+
+class TestFootballLeaders:
+    """Offline: a leaderboard is the first rows of its position's table on the one page sorted by its category."""
+
+    @pytest.mark.parametrize(
+        "category, position, names",
+        [("pyd", "qb", ["Doe", "Roe"]), ("kpts", "k", ["Boot", "Foot"])],
+    )
+    def test_leaders_come_from_the_single_sorted_page(self, site, category, position, names):
+        site.html = LEADERS_PAGE
+        with site.session():
+            leaders = usports_fball_leaders(category, n=2)
+
+        assert len(site.requests) == 1
+        assert dict(site.requests[0].url.params) == {"pos": position, "sort": category}
+        assert leaders["lastname_initials"].tolist() == names
+
+    @pytest.mark.parametrize("category, n", [("nope", 10), ("pyd", 0)])
+    def test_invalid_arguments_raise_before_fetching(self, site, category, n):
+        with site.session():
+            with pytest.raises(ValueError):
+                usports_fball_leaders(category, n=n)
+
+        assert not site.requests
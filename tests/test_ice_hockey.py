@@ -1,10 +1,19 @@
 """Ice Hockey API tests."""
 
+from pathlib import Path
+
 import pandas as pd
 import pytest
 
-from usports.ice_hockey import usports_ice_hockey_players, usports_ice_hockey_standings, usports_ice_hockey_teams
+from usports.ice_hockey import (
+    usports_ice_hockey_leaders,
+    usports_ice_hockey_players,
+    usports_ice_hockey_standings,
+    usports_ice_hockey_teams,
+)
+from usports.ice_hockey.constants import GOALIES_SORT_CATEGORIES, SKATERS_SORT_CATEGORIES
 
+from .mock_site import stats_page, stats_table
 from .test_data import (
     expected_ice_hockey_players_columns,
     expected_ice_hockey_standings_columns,
@@ -74,3 +83,62 @@ class TestIceHockeyPlayers:
         for col in numeric_cols:
             if col in df.columns:
                 assert df[col].dtype in ["int64", "float64"], f"{col} should be numeric, got {df[col].dtype}"
+
+
+SKATERS = [("Alpha A.", "Carleton"), ("Bravo B.", "UBC")]
+GOALIES = [("Gamma G.", "UBC"), ("Delta D.", "Carleton")]
+# Every players page has both tables; the one not requested lists players the baseline never returned
+SKATER_PAGE = stats_page(stats_table(SKATERS), stats_table([("Echo E.", "Laval")]))
+GOALIE_PAGE = stats_page(stats_table([*SKATERS, ("Charlie C.", "Laval")]), stats_table(GOALIES))
+# usports_ice_hockey_players('m') on these pages, as returned before the single-wave scrape
+BASELINE_FRAME = Path(__file__).parent / "fixtures" / "ice_hockey_players_baseline.json"
+
+
+class TestIceHockeyPlayerPages:
+    """Offline: skater and goalie pages are fetched in one wave, each for its own table."""
+
+    def test_output_matches_the_sequential_scrape(self, site):
+        site.route("pos=sk", SKATER_PAGE)
+        site.route("pos=g", GOALIE_PAGE)
+        with site.session():
+            df = usports_ice_hockey_players("m")
+
+        assert len(site.requests) == len(SKATERS_SORT_CATEGORIES) + len(GOALIES_SORT_CATEGORIES)
+        expected = pd.read_json(BASELINE_FRAME, orient="split")
+        pd.testing.assert_frame_equal(df.reset_index(drop=True), expected, check_dtype=False)
+
+
+class TestIceHockeyLeaders:
+    """Offline: a leaderboard is the first rows of its role's table on the one page sorted by its category."""
+
+    @pytest.mark.parametrize(
+        "category, position, role, names",
+        [("p", "sk", "skater", ["Alpha", "Bravo"]), ("svpt", "g", "goalie", ["Gamma", "Delta"])],
+    )
+    def test_leaders_come_from_the_single_sorted_page(self, site, category, position, role, names):
+        site.route("pos=sk", SKATER_PAGE)
+        site.route("pos=g", GOALIE_PAGE)
+        with site.session():
+            leaders = usports_ice_hockey_leaders("m", category, n=2)
+
+        assert len(site.requests) == 1
+        assert dict(site.requests[0].url.params) == {"sort": category, "pos": position}
+        assert leaders["lastname_initials"].tolist() == names
+        assert (leaders["role"] == role).all()
+
+    def test_rows_dropped_when_cleaning_do_not_count_towards_n(self, site):
+        # A header row of <td> cells and a player without a first name are parsed, then dropped
+        table = stats_table([("Name", "Team"), ("Alpha A.", "Carleton"), ("Solo", "UBC"), *GOALIES])
+        site.html = stats_page(table, stats_table(GOALIES))
+        with site.session():
+            leaders = usports_ice_hockey_leaders("m", "g", n=3)
+
+        assert leaders["lastname_initials"].tolist() == ["Alpha", "Gamma", "Delta"]
+
+    @pytest.mark.parametrize("category, n", [("nope", 10), ("g", 0)])
+    def test_invalid_arguments_raise_before_fetching(self, site, category, n):
+        with site.session():
+            with pytest.raises(ValueError):
+                usports_ice_hockey_leaders("m", category, n=n)
+
+        assert not site.requests
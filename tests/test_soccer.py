@@ -2,9 +2,18 @@
 
 import pandas as pd
 import pytest
+from pandas.errors import EmptyDataError
 
-from usports.soccer import usports_soccer_players, usports_soccer_standings, usports_soccer_teams
+from usports.soccer import (
+    usports_soccer_leaders,
+    usports_soccer_players,
+    usports_soccer_standings,
+    usports_soccer_teams,
+)
+from usports.soccer.constants import FIELD_PLAYER_SORT_CATEGORIES, GOALIE_SORT_CATEGORIES
+from usports.utils import select_columns
 
+from .mock_site import stats_page, stats_table
 from .test_data import (
     expected_soccer_players_columns,
     expected_soccer_standings_columns,
@@ -123,3 +132,106 @@ class TestSoccerPlayers:
                 for col in field_stats_cols:
                     if col in field_players.columns:
                         assert (field_players[col] > 0).any(), f"All field players have zero {col}"
+
+
+FIELD_PLAYERS = [("Smith J.", "Carleton"), ("Lee A.", "UBC")]
+GOALIES = [("Keeper K.", "Carleton")]
+# Field player tables are the three before the last two (goalie) tables
+PLAYERS_PAGE = stats_page(*[stats_table(FIELD_PLAYERS)] * 3, *[stats_table(GOALIES)] * 2)
+
+
+class TestSoccerPlayerPages:
+    """Offline: every player page is fetched in one concurrent wave, and failed pages are skipped."""
+
+    def test_all_pages_are_fetched_and_merged(self, site):
+        site.html = PLAYERS_PAGE
+        with site.session():
+            df = usports_soccer_players("m")
+
+        assert len(site.requests) == len(GOALIE_SORT_CATEGORIES) + len(FIELD_PLAYER_SORT_CATEGORIES)
+        assert df["lastname_initials"].tolist() == ["Keeper", "Smith", "Lee"]
+        assert df["position"].tolist() == ["goalie", "field", "field"]
+
+    def test_a_failed_page_is_skipped(self, site):
+        site.html = PLAYERS_PAGE
+        with site.session():
+            expected = usports_soccer_players("m")
+
+        site.route("pos=sh&sort=sh", 404)
+        site.route("sort=gm", 404)
+        with site.session():
+            df = usports_soccer_players("m")
+
+        pd.testing.assert_frame_equal(df, expected)
+
+    @pytest.mark.parametrize("columns", [["goals"], ["goalie_saves", "position"]])
+    def test_columns_select_from_the_full_frame(self, site, columns):
+        site.html = PLAYERS_PAGE
+        with site.session():
+            expected = select_columns(usports_soccer_players("m"), columns)
+        with site.session():
+            df = usports_soccer_players("m", columns=columns)
+
+        # Goalies are only listed in the goalie tables, which a field player column does not need
+        assert df["lastname_initials"].tolist() == ["Keeper", "Smith", "Lee"]
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_every_page_failing_raises(self, site):
+        site.html = PLAYERS_PAGE
+        site.route("players", 404)
+        with site.session():
+            with pytest.raises(EmptyDataError):
+                usports_soccer_players("m")
+
+
+SCORERS = [("Smith J.", "Carleton"), ("Lee A.", "UBC"), ("Ng B.", "Laval")]
+SHOOTERS = [("Shot S.", "Montreal"), ("Aim A.", "Cape Breton")]
+KEEPERS = [("Keeper K.", "Carleton"), ("Glove G.", "UBC")]
+EXTRA_KEEPERS = [("Wall W.", "Toronto"), ("Save S.", "McGill")]
+LEADERS_PAGE = stats_page(
+    stats_table(SCORERS),
+    stats_table(SHOOTERS),
+    stats_table(SCORERS),
+    stats_table(KEEPERS),
+    stats_table(EXTRA_KEEPERS),
+)
+
+
+class TestSoccerLeaders:
+    """Offline: a leaderboard is the first rows of its position's table on the one page sorted by its category."""
+
+    @pytest.mark.parametrize(
+        "category, position, names",
+        [
+            ("g", "sc", ["Smith", "Lee"]),
+            ("sh", "sh", ["Shot", "Aim"]),
+            ("sv", "g", ["Keeper", "Glove"]),
+            ("gow", "gext", ["Wall", "Save"]),
+        ],
+    )
+    def test_leaders_come_from_the_single_sorted_page(self, site, category, position, names):
+        site.html = LEADERS_PAGE
+        with site.session():
+            leaders = usports_soccer_leaders("m", category, n=2)
+
+        assert len(site.requests) == 1
+        assert dict(site.requests[0].url.params) == {"pos": position, "sort": category}
+        assert leaders["lastname_initials"].tolist() == names
+
+    def test_only_keeper_leaderboards_have_positions(self, site):
+        site.html = LEADERS_PAGE
+        with site.session():
+            keepers = usports_soccer_leaders("m", "sv", n=2)
+            scorers = usports_soccer_leaders("m", "g", n=2)
+
+        assert keepers["position"].tolist() == ["goalie", "goalie"]
+        # Without the goalie pages, goalies on a field leaderboard cannot be told apart
+        assert "position" not in scorers
+
+    @pytest.mark.parametrize("category, n", [("nope", 10), ("g", 0)])
+    def test_invalid_arguments_raise_before_fetching(self, site, category, n):
+        with site.session():
+            with pytest.raises(ValueError):
+                usports_soccer_leaders("m", category, n=n)
+
+        assert not site.requests
@@ -0,0 +1,689 @@
+"""Fetch layer tests (offline, served by a mock transport)."""
+
+import asyncio
+import importlib
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import pandas as pd
+import pytest
+
+from usports import backfill, fetch_all, watch
+from usports.base.exceptions import DataFetchError
+from usports.batch import SPORTS
+from usports.basketball import ausports_bball_standings, usports_bball_standings
+from usports.utils import (
+    FixtureStore,
+    MetricsRecorder,
+    ResponseCache,
+    ResultCache,
+    RetryPolicy,
+    SnapshotStore,
+    USportsSession,
+    compact_frame,
+    convert_types,
+    disable_result_cache,
+    enable_result_cache,
+    extract_tables,
+    fetch_page_html,
+    fetch_page_tables,
+    get_metrics,
+    get_session,
+    memoize_frame,
+    output_options,
+    request_limits,
+    resolve_parser,
+    set_metrics,
+    shared_pages,
+    tables_for_columns,
+)
+
+from .mock_site import MockSite, stats_page, stats_table
+
+PAGE_HTML = """
+<html><body>
+<table>
+  <tr><th>Rk</th><th>Name</th></tr>
+  <tr><td>1</td><td>Doe, J.</td></tr>
+</table>
+<table>
+  <tr><th class="team-name"><a href="#">Carleton</a></th><td>\n\t10</td><td>2</td></tr>
+</table>
+</body></html>
+"""
+
+STANDINGS_HTML = """
+<table>
+  <tr><th>Team</th><th>GP</th><th>W</th><th>L</th><th>T</th><th>Pct</th><th>PF</th><th>PA</th></tr>
+  <tr><th class="team-name"><a href="#">Carleton</a></th>
+    <td>10</td><td>9</td><td>1</td><td>0</td><td>.900</td><td>850</td><td>600</td></tr>
+  <tr><th class="team-name"><a href="#">UBC</a></th>
+    <td>10</td><td>5</td><td>5</td><td>-</td><td>.500</td><td>700</td><td>710</td></tr>
+</table>
+"""
+
+
+@pytest.fixture(name="site")
+def page_site() -> MockSite:
+    """The mock site, serving PAGE_HTML for every URL unless a test says otherwise."""
+    return MockSite(PAGE_HTML)
+
+
+class TestSession:
+    def test_session_is_active_inside_context(self):
+        with USportsSession() as session:
+            assert get_session() is session
+        assert get_session() is not session
+
+    def test_client_is_reused_across_runs(self, site):
+        with site.session() as session:
+
+            async def fetch_client_id() -> int:
+                await fetch_page_html("https://example.com/a")
+                return id(session._get_client())  # pylint: disable=protected-access
+
+            first = session.run(fetch_client_id())
+            second = session.run(fetch_client_id())
+
+        assert first == second
+        assert len(site.requests) == 2
+
+    def test_http2_falls_back_without_h2(self, monkeypatch):
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+        assert USportsSession(http2=True).http2 is False
+
+
+class TestTables:
+    def test_extract_tables_parses_cells_and_team_names(self):
+        tables = extract_tables(PAGE_HTML)
+
+        assert len(tables) == 2
+        assert [row.cells for row in tables[0].rows] == [[], ["1", "Doe, J."]]
+        assert tables[1].rows[0].team_name == "Carleton"
+        assert tables[1].rows[0].cells == ["10", "2"]
+
+    def test_fetch_page_tables_uses_session(self, site):
+        with site.session() as session:
+            tables = session.run(fetch_page_tables("https://example.com/a"))
+
+        assert len(tables) == 2
+        assert len(site.requests) == 1
+
+    @pytest.mark.parametrize("parser", ["lxml", "selectolax"])
+    @pytest.mark.parametrize(
+        "html",
+        [
+            PAGE_HTML,
+            "<table><tr><td>1\r\n</td><td>Doe,\rJ.</td><td>2\x0c0</td></tr></table>",
+            "<table><tr><td>5<script>var x = '<td>9</td>';</script></td><td>a<style>.x{}</style>b</td></tr></table>",
+            "<table><tr><td>1<td>2<tr><td>3</table>",
+            "<table><tr><th class='team-name'><a>UBC</a><td>1</b><td><i>2</td></tr></table>",
+        ],
+        ids=["clean", "whitespace", "script", "unclosed", "malformed"],
+    )
+    def test_fast_parsers_match_html_parser(self, parser, html):
+        pytest.importorskip(parser)
+        assert extract_tables(html, parser) == extract_tables(html, "html.parser")
+
+    def test_unclosed_cells_and_scripts_are_normalized(self):
+        tables = extract_tables("<table><tr><td>1<script>x</script><td>2\r<tr><td>3</table>")
+
+        assert [row.cells for row in tables[0].rows] == [["1", "2"], ["3"]]
+
+    def test_missing_parser_falls_back_to_html_parser(self, monkeypatch):
+        monkeypatch.setattr("importlib.util.find_spec", lambda name: None)
+        assert resolve_parser("lxml") == "html.parser"
+
+    def test_parser_from_environment(self, monkeypatch):
+        monkeypatch.setenv("USPORTS_PARSER", "bogus")
+        with pytest.raises(ValueError):
+            resolve_parser()
+
+
+LAZY_PACKAGES = ["usports", "usports.utils", *(f"usports.{sport}" for sport in SPORTS)]
+
+
+class TestLazyImports:
+    def test_importing_packages_loads_no_heavy_dependencies_or_logging(self):
+        probe = (
+            "import json, logging, sys\n"
+            f"import {', '.join(LAZY_PACKAGES)}\n"
+            "heavy = [m for m in ('pandas', 'httpx', 'bs4') if m in sys.modules]\n"
+            "print(json.dumps([heavy, len(logging.getLogger().handlers)]))"
+        )
+        root = Path(__file__).parent.parent
+        out = subprocess.run([sys.executable, "-c", probe], cwd=root, capture_output=True, text=True, check=True)
+
+        assert json.loads(out.stdout) == [[], 0]
+
+    @pytest.mark.parametrize("package", LAZY_PACKAGES)
+    def test_every_export_resolves(self, package):
+        module = importlib.import_module(package)
+
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+            assert name in dir(module)
+        with pytest.raises(AttributeError):
+            getattr(module, "not_an_export")
+
+    def test_exports_are_cached_on_the_package(self):
+        import usports.basketball  # pylint: disable=import-outside-toplevel
+
+        players = usports.basketball.usports_bball_players
+        assert vars(usports.basketball)["usports_bball_players"] is players
+
+
+class TestConvertTypes:
+    RAW = {
+        "name": ["Doe, J.", "Roe, K.", "Poe, L."],
+        "gp": ["10", "-", ""],
+        "pct": [".500", "nan", "1:30"],
+        "pts": [12, None, "7.9"],
+    }
+    MAPPING = {"name": str, "gp": int, "pct": float, "pts": int, "absent": int}
+
+    def test_placeholders_become_zero(self):
+        df = convert_types(pd.DataFrame(self.RAW), self.MAPPING)
+
+        assert df["gp"].tolist() == [10, 0, 0]
+        assert df["pct"].tolist() == [0.5, 0.0, 0.0]
+        assert df["pts"].tolist() == [12, 0, 7]
+        assert df["gp"].dtype == int and df["pct"].dtype == float
+        assert "absent" not in df
+
+    def test_missing_values_can_be_kept(self):
+        df = convert_types(pd.DataFrame(self.RAW), self.MAPPING, na_value=None)
+
+        assert str(df["gp"].dtype) == "Int64"
+        assert df["gp"].isna().tolist() == [False, True, True]
+        assert df["pct"].isna().tolist() == [False, True, True]
+        assert df["pts"].tolist()[::2] == [12, 7]
+
+    def test_empty_frame(self):
+        df = convert_types(pd.DataFrame({"gp": [], "pct": []}), {"gp": int, "pct": float})
+        assert df.empty and df["gp"].dtype == int
+
+
+class TestColumnProjection:
+    def test_columns_map_to_the_tables_that_carry_them(self):
+        mappings = [{"points": int, "field_goal_made": int}, {"rebounds": int}, {"fouls": int, "points": int}]
+
+        assert tables_for_columns(["rebounds"], mappings) == [1]
+        assert tables_for_columns(["points"], mappings) == [0, 2]
+        derived = {"field_goal_attempted": "field_goal_made"}
+        assert tables_for_columns(["field_goal_attempted"], mappings, derived=derived) == [0]
+        assert tables_for_columns(["team_name"], mappings, base_columns=["team_name"]) == [0]
+        with pytest.raises(ValueError):
+            tables_for_columns(["nope"], mappings)
+
+
+class TestOutputOptions:
+    def test_compact_frame(self):
+        df = pd.DataFrame(
+            {
+                "school": ["Carleton", "UBC", "Carleton"],
+                "games_played": [10, 12, 300],
+                "plus_minus": [-3, 0, 4],
+                "avg": [0.333, 12.1, 1.7],
+                "huge": [1e40, 0.0, 1.0],
+            }
+        )
+        compact = compact_frame(df)
+
+        assert str(compact["school"].dtype) == "category"
+        assert compact["games_played"].dtype == "int16" and compact["plus_minus"].dtype == "int8"
+        assert compact["avg"].dtype == "float32" and compact["huge"].dtype == "float64"
+        assert df["school"].dtype == object
+        pd.testing.assert_frame_equal(compact.astype(df.dtypes.to_dict()), df, rtol=1e-6)
+
+    def test_public_functions_honour_output_options(self, site):
+        site.html = STANDINGS_HTML
+        with site.session():
+            with output_options(compact=True):
+                compact = usports_bball_standings("m")
+            default = usports_bball_standings("m")
+
+        assert str(compact["team_name"].dtype) == "category"
+        assert compact["games_played"].dtype == "int8"
+        assert default["games_played"].dtype == "int64"
+
+    def test_arrow_output(self, site):
+        pa = pytest.importorskip("pyarrow")
+        site.html = STANDINGS_HTML
+        with site.session():
+            with output_options(dtype_backend="pyarrow"):
+                frame = usports_bball_standings("m")
+            with output_options(compact=True, arrow_table=True):
+                table = usports_bball_standings("m")
+
+        assert isinstance(frame["team_name"].dtype, pd.ArrowDtype)
+        assert frame["games_played"].tolist() == [10, 10]
+        assert isinstance(table, pa.Table)
+        assert pa.types.is_dictionary(table.schema.field("team_name").type)
+        assert table.column("total_wins").to_pylist() == [9, 5]
+
+    def test_invalid_dtype_backend(self):
+        with pytest.raises(ValueError):
+            with output_options(dtype_backend="polars"):  # type: ignore[arg-type]
+                pass
+
+
+class TestResponseCache:
+    def test_fresh_entries_skip_the_network(self, site, tmp_path):
+        cache = ResponseCache(tmp_path / "cache.sqlite", ttl=60)
+        with site.session(cache=cache) as session:
+            session.run(fetch_page_tables("https://example.com/a"))
+            session.run(fetch_page_tables("https://example.com/a"))
+
+        assert len(site.requests) == 1
+
+    def test_stale_entries_are_revalidated(self, site, tmp_path):
+        def revalidate(request: httpx.Request) -> httpx.Response:
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=PAGE_HTML, headers={"ETag": '"v1"'})
+
+        site.route("example.com/a", revalidate)
+        cache = ResponseCache(tmp_path / "cache.sqlite", ttl=0)
+        with site.session(cache=cache) as session:
+            first = session.run(fetch_page_tables("https://example.com/a"))
+            second = session.run(fetch_page_tables("https://example.com/a"))
+
+        assert first == second
+        assert [r.headers.get("If-None-Match") for r in site.requests] == [None, '"v1"']
+
+    def test_cache_only_mode_raises_on_miss(self, site, tmp_path):
+        cache = ResponseCache(tmp_path / "cache.sqlite", cache_only=True)
+        with site.session(cache=cache) as session:
+            with pytest.raises(DataFetchError):
+                session.run(fetch_page_tables("https://example.com/a"))
+
+        assert not site.requests
+
+    @pytest.mark.parametrize("use_async", [False, True], ids=["with", "async with"])
+    def test_session_exit_closes_the_cache(self, site, tmp_path, use_async):
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+        session = site.session(cache=cache)
+
+        async def fetch_async() -> None:
+            async with session:
+                await fetch_page_tables("https://example.com/a")
+
+        if use_async:
+            asyncio.run(fetch_async())
+        else:
+            with session:
+                session.run(fetch_page_tables("https://example.com/a"))
+
+        assert cache._conn is None  # pylint: disable=protected-access
+        assert cache.get("https://example.com/a") is not None
+
+
+class TestSnapshotStore:
+    def test_changed_rows_since_last_snapshot(self, tmp_path):
+        store = SnapshotStore(tmp_path / "snapshots.sqlite")
+        before = pd.DataFrame({"team_name": ["A", "B", "C"], "wins": [1, 2, 3]})
+        after = pd.DataFrame({"team_name": ["A", "B", "D"], "wins": [1, 5, 3]})
+
+        first = store.record(before, "basketball", "m", "standings", season="2019-20")
+        again = store.record(before.copy(), "basketball", "m", "standings", season="2019-20")
+        diff = store.record(after, "basketball", "m", "standings", season="2019-20")
+
+        assert first.first and len(first.changed) == 3
+        assert again.unchanged
+        assert diff.changed["team_name"].tolist() == ["B", "D"]
+        assert diff.removed == ["C"]
+
+    def test_tables_are_tracked_separately(self, tmp_path):
+        store = SnapshotStore(tmp_path / "snapshots.sqlite")
+        df = pd.DataFrame({"team_name": ["A"], "wins": [1]})
+        store.record(df, "basketball", "m", "standings", season="2019-20")
+
+        assert store.record(df, "basketball", "w", "standings", season="2019-20").first
+        assert store.last_hash("basketball", "m", "standings", season="2020-21") is None
+
+
+class TestFixtures:
+    def test_recorded_pages_replay_without_network(self, site, tmp_path):
+        with site.session(fixtures=FixtureStore(tmp_path, "record")) as session:
+            recorded = session.run(fetch_page_html("https://example.com/a"))
+
+        # Replay mode must not use the network: the request count stays at the one recorded page
+        with site.session(fixtures=FixtureStore(tmp_path)) as session:
+            replayed = session.run(fetch_page_html("https://example.com/a"))
+
+            with pytest.raises(DataFetchError):
+                session.run(fetch_page_html("https://example.com/unrecorded"))
+
+        assert replayed == recorded
+        assert len(site.requests) == 1
+        assert list(FixtureStore(tmp_path).urls()) == ["https://example.com/a"]
+
+    def test_invalid_mode_raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            FixtureStore(tmp_path, "rewind")  # type: ignore
+
+
+class TestResultCache:
+    def test_memoized_calls_return_independent_copies(self):
+        calls = []
+
+        @memoize_frame
+        def players(league: str, season_option: str = "regular") -> pd.DataFrame:
+            calls.append((league, season_option))
+            return pd.DataFrame({"points": [1, 2]})
+
+        enable_result_cache()
+        try:
+            first = players("m")
+            first.loc[0, "points"] = 99
+            second = players("m", season_option="regular")
+            players("w")
+        finally:
+            disable_result_cache()
+
+        assert calls == [("m", "regular"), ("w", "regular")]
+        assert second["points"].tolist() == [1, 2]
+
+    def test_lru_eviction_by_entries_and_bytes(self):
+        cache = ResultCache(max_entries=2)
+        for key in "abc":
+            cache.set(key, pd.DataFrame({"x": [1]}))
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+
+        small = ResultCache(max_bytes=10)
+        small.set("a", pd.DataFrame({"x": range(100)}))
+        assert len(small) == 0
+
+    def test_ttl_expiry(self):
+        cache = ResultCache(ttl=0)
+        cache.set("a", pd.DataFrame({"x": [1]}))
+        assert cache.get("a") is None
+
+
+class TestAsyncAPI:
+    def test_async_and_sync_functions_return_the_same_frame(self, site):
+        site.html = STANDINGS_HTML
+        session = site.session()
+
+        async def fetch() -> pd.DataFrame:
+            async with session:
+                return await ausports_bball_standings("m")
+
+        async_df = asyncio.run(fetch())
+        with session:
+            sync_df = usports_bball_standings("m")
+
+        pd.testing.assert_frame_equal(async_df, sync_df)
+        assert async_df["team_name"].tolist() == ["Carleton", "UBC"]
+        assert async_df["conference"].tolist() == ["OUA", "CW"]
+        assert len(site.requests) == 2
+
+
+class TestMetrics:
+    def test_stages_report_to_the_active_recorder(self, site):
+        site.html = STANDINGS_HTML
+        recorder = set_metrics(MetricsRecorder())
+        try:
+            with site.session():
+                usports_bball_standings("m")
+        finally:
+            set_metrics(None)
+
+        assert recorder.counters["usports_pages_total"] == {(("source", "network"),): 1}
+        stages = {dict(labels)["stage"] for labels in recorder.summaries["usports_stage_seconds"]}
+        assert stages == {"tokenize", "parse", "convert_types"}
+        rows = {dict(labels)["function"]: n for labels, n in recorder.counters["usports_stage_rows_total"].items()}
+        assert rows["_parse_standings_table"] == 2
+
+        exported = recorder.to_prometheus()
+        assert "# TYPE usports_request_seconds summary" in exported
+        assert 'status="200"} 1\n' in exported
+
+    def test_default_metrics_are_a_no_op(self):
+        assert not get_metrics().enabled
+        assert MetricsRecorder().to_prometheus() == ""
+
+
+class TestBatch:
+    def test_fetch_all_returns_frames_keyed_by_table(self, site):
+        site.html = STANDINGS_HTML
+        with site.session():
+            frames = fetch_all(sports=["basketball"], kinds=["standings"], seasons=["regular", "playoffs"])
+            men = usports_bball_standings("m")
+
+        assert list(frames) == [("basketball", "m", "standings", None), ("basketball", "w", "standings", None)]
+        pd.testing.assert_frame_equal(frames[("basketball", "m", "standings", None)], men)
+        assert len(site.requests) == 3
+
+    def test_shared_pages_fetch_each_page_once(self, site):
+        with site.session() as session:
+
+            async def fetch_twice() -> None:
+                with shared_pages():
+                    await fetch_page_tables("https://example.com/a")
+                    await fetch_page_tables("https://example.com/a")
+
+            session.run(fetch_twice())
+
+        assert len(site.requests) == 1
+
+    def test_first_failure_cancels_the_other_tables(self, site):
+        site.route("mbkb", 404)
+        site.route("wbkb", 500)
+        with site.session(retry=RetryPolicy(max_attempts=100, backoff=0.01, jitter=False)):
+            with pytest.raises(DataFetchError):
+                fetch_all(sports=["basketball"], kinds=["standings"])
+            retried = len(site.requests)
+            time.sleep(0.1)
+
+            # The women's table kept retrying its 500s in the background before it was cancelled
+            assert len(site.requests) == retried
+
+    def test_invalid_sport_raises(self):
+        with pytest.raises(ValueError):
+            fetch_all(sports=["curling"])
+
+
+class TestBackfill:
+    def test_explicit_season_builds_its_urls(self, site):
+        site.html = STANDINGS_HTML
+        with site.session():
+            usports_bball_standings("m", season="2019-20")
+
+        assert site.requests[0].url.path == "/sports/mbkb/2019-20/standings"
+
+    def test_invalid_season_raises(self):
+        with pytest.raises(ValueError):
+            usports_bball_standings("m", season="2019-2020")
+
+    def test_backfill_resumes_from_progress(self, site, tmp_path):
+        tables = {"sports": ["basketball"], "leagues": ["m"], "kinds": ["standings"], "progress": tmp_path / "p.json"}
+        site.html = STANDINGS_HTML
+        with site.session():
+            frames = backfill(["2018-19", "2019-20"], **tables)
+            assert len(site.requests) == 2
+            resumed = backfill(["2018-19", "2019-20", "2020-21"], **tables)
+
+        assert [key[-1] for key in frames] == ["2018-19", "2019-20"]
+        assert list(resumed) == [("basketball", "m", "standings", None, "2020-21")]
+        assert [request.url.path for request in site.requests[2:]] == ["/sports/mbkb/2020-21/standings"]
+
+    def test_sink_receives_tables(self, site):
+        site.html = STANDINGS_HTML
+        received = {}
+        with site.session():
+            frames = backfill(["2019-20"], sports=["football"], kinds=["standings"], sink=received.__setitem__)
+
+        assert frames == {} and list(received) == [("football", None, "standings", None, "2019-20")]
+
+    def test_seasons_in_flight_are_capped(self, site):
+        attempts = []
+
+        def flaky(_request: httpx.Request) -> httpx.Response:
+            attempts.append(1)
+            return httpx.Response(500 if len(attempts) == 1 else 200, text=STANDINGS_HTML)
+
+        site.html = STANDINGS_HTML
+        site.route("mbkb/2018-19", flaky)
+        with site.session(retry=RetryPolicy(max_attempts=2, backoff=0.01, jitter=False)):
+            backfill(["2018-19", "2019-20"], sports=["basketball"], kinds=["standings"], max_seasons=1)
+
+        # 2019-20 only starts once the retried 2018-19 page is done
+        seasons = [request.url.path.split("/")[3] for request in site.requests]
+        assert seasons == ["2018-19"] * 3 + ["2019-20"] * 2
+
+    def test_invalid_max_seasons_raises(self):
+        with pytest.raises(ValueError):
+            backfill(["2019-20"], max_seasons=0)
+
+
+class TestWatch:
+    def test_only_changed_tables_are_reported(self, site):
+        pages = [STANDINGS_HTML, STANDINGS_HTML, STANDINGS_HTML.replace("<td>9</td>", "<td>10</td>")]
+        # Each poll gets the next page, and the last one from then on
+        site.route("standings", lambda _: httpx.Response(200, text=pages[min(len(site.requests), len(pages)) - 1]))
+
+        events = []
+        with site.session():
+            watch(events.append, sports=["basketball"], leagues=["m"], kinds=["standings"], interval=0, max_polls=3)
+
+        assert len(site.requests) == 3
+        assert [len(event.changed) for event in events] == [2, 1]
+        assert events[1].changed["team_name"].tolist() == ["Carleton"]
+        assert events[1].frame["total_wins"].tolist() == [10, 5]
+
+    def test_change_seen_while_another_page_failed_is_reported_later(self, site):
+        skaters = stats_page(stats_table([("Alpha A.", "Carleton")]))
+        goalies = stats_page(stats_table([]), stats_table([("Gamma G.", "UBC")]))
+        site.route("pos=sk", skaters)
+        site.route("pos=g", goalies)
+
+        def page(fragment: str, pages: list[str | int]):
+            # The n-th request for the page gets pages[n - 1], and the last one from then on
+            def handler(_request: httpx.Request) -> httpx.Response:
+                count = sum(fragment in url for url in site.urls())
+                body = pages[min(count, len(pages)) - 1]
+                return httpx.Response(body) if isinstance(body, int) else httpx.Response(200, text=body)
+
+            return handler
+
+        # Pass 2: the goals page gains a skater while the assists page is down (probe and rebuild)
+        gained = stats_page(stats_table([("Alpha A.", "Carleton"), ("Bravo B.", "UBC")]))
+        site.route("sort=g&pos=sk", page("sort=g&pos=sk", [skaters, gained]))
+        site.route("sort=a&pos=sk", page("sort=a&pos=sk", [skaters, 404, 404, skaters]))
+
+        events = []
+        with site.session():
+            watch(events.append, sports=["ice_hockey"], leagues=["m"], kinds=["players"], interval=0, max_polls=3)
+
+        assert [len(event.changed) for event in events] == [2, 1]
+        assert events[1].changed["lastname_initials"].tolist() == ["Bravo"]
+
+    def test_callback_runs_on_the_calling_thread(self, site):
+        site.html = STANDINGS_HTML
+        threads, standings = [], []
+
+        def on_change(_event):
+            threads.append(threading.get_ident())
+            standings.append(usports_bball_standings("w"))
+
+        with site.session():
+            watch(on_change, sports=["basketball"], leagues=["m"], kinds=["standings"], interval=0, max_polls=2)
+
+        assert threads == [threading.get_ident()]
+        assert standings[0]["team_name"].tolist() == ["Carleton", "UBC"]
+
+
+class TestRequestLimits:
+    @staticmethod
+    def fetch_many(session: USportsSession, count: int) -> None:
+        async def fetch_pages() -> None:
+            await asyncio.gather(*(fetch_page_tables(f"https://example.com/{i}") for i in range(count)))
+
+        session.run(fetch_pages())
+
+    def test_concurrency_is_bounded(self):
+        in_flight = peak = 0
+
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, text=PAGE_HTML)
+
+        with USportsSession(transport=httpx.MockTransport(handler)) as session:
+            with request_limits(max_concurrency=3):
+                self.fetch_many(session, 12)
+
+        assert peak == 3
+
+    def test_concurrent_requests_for_same_url_are_coalesced(self, site):
+        with site.session() as session:
+
+            async def fetch_same() -> list:
+                return await asyncio.gather(*(fetch_page_tables("https://example.com/same") for _ in range(5)))
+
+            results = session.run(fetch_same())
+            session.run(fetch_page_tables("https://example.com/same"))
+
+        assert len(site.requests) == 2
+        assert all(tables is results[0] for tables in results)
+
+    def test_rate_limit_spaces_requests_per_host(self, site):
+        with site.session() as session:
+            with request_limits(rate_limit=20.0, burst=1):
+                start = time.monotonic()
+                self.fetch_many(session, 4)
+                elapsed = time.monotonic() - start
+
+        assert len(site.requests) == 4
+        assert elapsed >= 0.14
+
+
+class TestRetry:
+    @staticmethod
+    def flaky_session(responses: list[httpx.Response | Exception], retry: RetryPolicy) -> USportsSession:
+        def handler(_request: httpx.Request) -> httpx.Response:
+            outcome = responses.pop(0) if len(responses) > 1 else responses[0]
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        return USportsSession(transport=httpx.MockTransport(handler), retry=retry)
+
+    def test_transient_errors_are_retried(self):
+        responses = [
+            httpx.Response(502),
+            httpx.ConnectTimeout("timed out"),
+            httpx.Response(200, text=PAGE_HTML),
+        ]
+        with self.flaky_session(responses, RetryPolicy(max_attempts=3, backoff=0.001)) as session:
+            tables = session.run(fetch_page_tables("https://example.com/flaky"))
+
+        assert len(tables) == 2
+
+    def test_gives_up_after_max_attempts(self):
+        with self.flaky_session([httpx.Response(503)], RetryPolicy(max_attempts=2, backoff=0.001)) as session:
+            with pytest.raises(httpx.HTTPStatusError):
+                session.run(fetch_page_html("https://example.com/down"))
+
+    def test_client_errors_are_not_retried(self):
+        responses = [httpx.Response(404), httpx.Response(200, text=PAGE_HTML)]
+        with self.flaky_session(responses, RetryPolicy(max_attempts=3, backoff=0.001)) as session:
+            with pytest.raises(httpx.HTTPStatusError):
+                session.run(fetch_page_html("https://example.com/missing"))
+
+    def test_retry_after_is_respected(self):
+        policy = RetryPolicy(backoff=0.001)
+        assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "2"})) == 2.0
+        assert policy.delay(1, httpx.Response(429, headers={"Retry-After": "3600"})) == policy.max_retry_after
+        assert policy.delay(1, httpx.Response(503)) <= 0.001
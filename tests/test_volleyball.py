@@ -3,8 +3,15 @@
 import pandas as pd
 import pytest
 
-from usports.volleyball import usports_vball_players, usports_vball_standings, usports_vball_teams
+from usports.volleyball import (
+    usports_vball_leaders,
+    usports_vball_players,
+    usports_vball_standings,
+    usports_vball_teams,
+)
+from usports.volleyball.constants import PLAYER_POSITION_TABLES
 
+from .mock_site import stats_page, stats_table
 from .test_data import (
     expected_volleyball_players_columns,
     expected_volleyball_standings_columns,
@@ -102,3 +109,36 @@ class TestVolleyballSportSpecific:
                 assert all(valid_data["sets_played"] >= valid_data["matches_played"]), (
                     "Player sets played should be >= matches played"
                 )
+
+
+HITTERS = [("Doe J.", "Trinity Western"), ("Roe A.", "Alberta"), ("Poe E.", "Laval")]
+LIBEROS = [("Dig D.", "Manitoba"), ("Pass P.", "McMaster")]
+# Offensive, defensive and serve/receive tables; the defensive one lists other players
+LEADERS_PAGE = stats_page(
+    *(stats_table(LIBEROS if table == PLAYER_POSITION_TABLES["df"] else HITTERS) for table in range(3))
+)
+
+
+class TestVolleyballLeaders:
+    """Offline: a leaderboard is the first rows of its position's table on the one page sorted by its category."""
+
+    @pytest.mark.parametrize(
+        "category, position, names",
+        [("k", "of", ["Doe", "Roe"]), ("d", "df", ["Dig", "Pass"])],
+    )
+    def test_leaders_come_from_the_single_sorted_page(self, site, category, position, names):
+        site.html = LEADERS_PAGE
+        with site.session():
+            leaders = usports_vball_leaders("m", category, n=2)
+
+        assert len(site.requests) == 1
+        assert dict(site.requests[0].url.params) == {"pos": position, "sort": category}
+        assert leaders["lastname_initials"].tolist() == names
+
+    @pytest.mark.parametrize("category, n", [("nope", 10), ("k", 0)])
+    def test_invalid_arguments_raise_before_fetching(self, site, category, n):
+        with site.session():
+            with pytest.raises(ValueError):
+                usports_vball_leaders("m", category, n=n)
+
+        assert not site.requests
@@ -9,8 +9,34 @@ Available Modules:
 - ice_hockey: Access ice hockey statistics and standings.
 - volleyball: Access volleyball statistics and standings.
 - soccer: Access soccer statistics and standings.
+- batch: Fetch many sports, leagues and tables in one pass (fetch_all), or many seasons (backfill).
+- watch: Re-poll tables on an interval and report the rows that changed (watch).
 - base: Base exceptions, constants and types.
 - utils: Utility functions for data processing.
+
+Modules are imported on first use, so `import usports` does not load pandas, httpx or bs4.
+Logging is opt-in: call usports.utils.setup_logging() to print the library's log messages.
 """
 
 __version__ = "0.1.0"
+
+from typing import TYPE_CHECKING
+
+from .utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base.constants import season_range
+    from .batch import abackfill, afetch_all, backfill, fetch_all
+    from .watch import ChangeEvent, awatch, watch
+
+__all__ = ["ChangeEvent", "abackfill", "afetch_all", "awatch", "backfill", "fetch_all", "season_range", "watch"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".base.constants": ["season_range"],
+        ".batch": ["abackfill", "afetch_all", "backfill", "fetch_all"],
+        ".watch": ["ChangeEvent", "awatch", "watch"],
+    },
+    submodules=("base", "basketball", "football", "ice_hockey", "soccer", "utils", "volleyball"),
+)
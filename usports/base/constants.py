@@ -1,5 +1,7 @@
 """Shared constants across all sports."""
 
+import re
+
 # Base URL
 BASE_URL = "https://universitysport.prestosports.com/sports"
 
@@ -24,10 +26,67 @@ def get_current_season(sport: str) -> str:
     return WINTER_SEASON
 
 
+def validate_season(season: str) -> str:
+    """Check that `season` names a season like '2019-20' and return it."""
+    match = re.fullmatch(r"(\d{4})-(\d{2})", season)
+    if match is None or (int(match[1]) + 1) % 100 != int(match[2]):
+        raise ValueError(f"Invalid season: {season}. Must be a season like '2019-20'")
+    return season
+
+
+def resolve_season(sport: str, season: str | None = None) -> str:
+    """Return the explicit `season` once validated, or the sport's current season when None."""
+    if season is None:
+        return get_current_season(sport)
+    return validate_season(season)
+
+
+def season_range(first: str, last: str) -> list[str]:
+    """List the seasons from `first` to `last` inclusive, e.g. season_range('2018-19', '2020-21')."""
+    start = int(validate_season(first)[:4])
+    end = int(validate_season(last)[:4])
+    return [f"{year}-{(year + 1) % 100:02d}" for year in range(start, end + 1)]
+
+
 # Parser settings
 BS4_PARSER = "html.parser"
+LXML_PARSER = "lxml"
+SELECTOLAX_PARSER = "selectolax"
+PARSER_ENV_VAR = "USPORTS_PARSER"
+
+# Response cache settings
+DEFAULT_CACHE_PATH = "~/.cache/usports/responses.sqlite"
+DEFAULT_CACHE_TTL = 900  # seconds
+CACHE_PATH_ENV_VAR = "USPORTS_CACHE_PATH"
+CACHE_TTL_ENV_VAR = "USPORTS_CACHE_TTL"
 TIMEOUT = 60000
 
+# Columns that identify a row (a team or a player) in the returned tables, when present
+IDENTITY_COLUMNS = ("team_name", "lastname_initials", "first_name", "school", "role")
+
+# Snapshot store settings
+DEFAULT_SNAPSHOT_PATH = "~/.cache/usports/snapshots.sqlite"
+DEFAULT_WATCH_INTERVAL = 900  # seconds between polling passes
+
+# Request limits
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_BACKFILL_SEASONS = 2  # seasons a backfill fetches at once
+
+# Retry policy for transient fetch failures
+DEFAULT_RETRY_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF = 0.5  # seconds, doubled on each attempt
+DEFAULT_MAX_BACKOFF = 10.0  # seconds
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Record/replay HTML fixtures
+FIXTURE_RECORD = "record"
+FIXTURE_REPLAY = "replay"
+FIXTURES_DIR_ENV_VAR = "USPORTS_FIXTURES_DIR"
+FIXTURES_MODE_ENV_VAR = "USPORTS_FIXTURES_MODE"
+
+# Repeated string columns stored as category in compact output
+CATEGORY_COLUMNS = frozenset({"school", "conference", "team_name", "role", "position"})
+
 OUA = "OUA"
 RSEQ = "RSEQ"
 CW = "CW"
@@ -117,9 +176,9 @@ LEAGUE_CONFERENCE_OVERRIDES = {
 }
 
 
-def get_season_urls(sport: str) -> dict[str, str]:
-    """Get season URL mappings based on sport."""
-    season = get_current_season(sport)
+def get_season_urls(sport: str, season: str | None = None) -> dict[str, str]:
+    """Get season URL mappings based on sport, for `season` or the current season."""
+    season = resolve_season(sport, season)
     return {
         "regular": season,
         "playoffs": f"{season}p",
@@ -1,9 +1,11 @@
 """Functions:
 - usports_bball_players: Fetch player statistics.
+- usports_bball_leaders: Fetch the top players in one stat category.
 - usports_bball_teams: Fetch team statistics.
 - usports_bball_standings: Fetch team standings.
 
 These functions return pandas DataFrames with the requested statistics.
+Each has an async counterpart prefixed with 'a' (e.g. ausports_bball_players) for use inside a running event loop.
 
 Examples:
 >>> from usports.basketball import usports_bball_players, usports_bball_teams, usports_bball_standings
@@ -16,6 +18,8 @@ Examples:
 
 >>> men_standings_df = usports_bball_standings('m') # men's regular season standings
 
+>>> top_scorers_df = usports_bball_leaders('m', 'pts', n=10) # men's top 10 scorers
+
 Author:
     OJ Adeyemi
 
@@ -23,8 +27,41 @@ Date Created:
     February 2025
 """
 
-from .player_stats import usports_bball_players
-from .standings import usports_bball_standings
-from .team_stats import usports_bball_teams
+from typing import TYPE_CHECKING
+
+from usports.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .player_stats import (
+        ausports_bball_leaders,
+        ausports_bball_players,
+        usports_bball_leaders,
+        usports_bball_players,
+    )
+    from .standings import ausports_bball_standings, usports_bball_standings
+    from .team_stats import ausports_bball_teams, usports_bball_teams
+
+__all__ = [
+    "usports_bball_players",
+    "ausports_bball_players",
+    "usports_bball_leaders",
+    "ausports_bball_leaders",
+    "usports_bball_teams",
+    "ausports_bball_teams",
+    "usports_bball_standings",
+    "ausports_bball_standings",
+]
 
-__all__ = ["usports_bball_players", "usports_bball_teams", "usports_bball_standings"]
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".player_stats": [
+            "ausports_bball_leaders",
+            "ausports_bball_players",
+            "usports_bball_leaders",
+            "usports_bball_players",
+        ],
+        ".standings": ["ausports_bball_standings", "usports_bball_standings"],
+        ".team_stats": ["ausports_bball_teams", "usports_bball_teams"],
+    },
+)
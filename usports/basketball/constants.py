@@ -110,3 +110,23 @@ PLAYER_SORT_CATEGORIES = [
     "dq",
     "ato",
 ]
+
+# Player stats table (index in PLAYER_STATS_COLUMNS_TYPE_MAPPING) ranked by each sort category
+PLAYER_SORT_CATEGORY_TABLES = {
+    "pts": 0,
+    "min": 0,
+    "fgp": 0,
+    "fgp3": 0,
+    "fgpt3": 0,
+    "ftpt": 0,
+    "oreb": 1,
+    "dreb": 1,
+    "treb": 1,
+    "ast": 1,
+    "to": 1,
+    "stl": 1,
+    "blk": 1,
+    "pf": 2,
+    "dq": 2,
+    "ato": 2,
+}
@@ -1,33 +1,48 @@
 import asyncio
+import logging
 from typing import Any
 
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
 from pandas.errors import EmptyDataError
 
 from usports.base.constants import (
     BASE_URL,
     BASKETBALL,
     BASKETBALL_PLAYER_STATS_OFFSET,
-    BS4_PARSER,
     PLAYER_SEASON_TOTALS_STATS_START_INDEX,
     get_season_urls,
 )
 from usports.base.exceptions import DataFetchError
 from usports.base.types import LeagueType, SeasonType
 from usports.utils import (
+    HTMLTable,
     clean_text,
     convert_types,
-    fetch_page_html,
+    fetch_page_tables,
+    instrumented,
+    memoize_frame,
     normalize_gender_arg,
-    setup_logging,
+    run_sync,
+    select_columns,
+    shaped_output,
     split_made_attempted,
+    tables_for_columns,
     validate_season_option,
 )
 
-from .constants import PLAYER_SORT_CATEGORIES, PLAYER_STATS_COLUMNS_TYPE_MAPPING
+from .constants import PLAYER_SORT_CATEGORIES, PLAYER_SORT_CATEGORY_TABLES, PLAYER_STATS_COLUMNS_TYPE_MAPPING
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
+
+_BASE_COLUMNS = ["lastname_initials", "first_name", "school", "games_played", "games_started"]
+
+# '_attempted' columns split off each 'made-attempted' stat
+_DERIVED_COLUMNS = {
+    column.replace("made", "attempted"): column
+    for mapping in PLAYER_STATS_COLUMNS_TYPE_MAPPING
+    for column in mapping
+    if column.endswith("_made")
+}
 
 
 def _get_sport_identifier(gender: str) -> str:
@@ -41,24 +56,24 @@ def _get_sport_identifier(gender: str) -> str:
     raise ValueError("Argument must be 'men' or 'women'")
 
 
-def _parse_player_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dict[str, Any]]:
-    """Parse player stats data from an HTML table."""
+@instrumented("parse")
+def _parse_player_stats_table(table: HTMLTable, columns: list[str], limit: int | None = None) -> list[dict[str, Any]]:
+    """Parse player stats data from an HTML table, stopping after `limit` players when given."""
     table_data: list[dict[str, Any]] = []
-    rows: list[Tag] = soup.find_all("tr")  # type: ignore
 
-    for row in rows:
-        cols: list[Tag] = row.find_all("td")  # type: ignore
+    for row in table.rows:
+        cols = row.cells
         if len(cols) > 1:
             row_data = {}
-            row_data["player_name"] = clean_text(cols[1].get_text())
-            row_data["school"] = clean_text(cols[2].get_text())
-            row_data["games_played"] = clean_text(cols[3].get_text())
-            row_data["games_started"] = clean_text(cols[4].get_text())
+            row_data["player_name"] = clean_text(cols[1])
+            row_data["school"] = clean_text(cols[2])
+            row_data["games_played"] = clean_text(cols[3])
+            row_data["games_started"] = clean_text(cols[4])
 
             # Parse the rest of the columns
             for i, col_name in enumerate(columns):
                 if i + BASKETBALL_PLAYER_STATS_OFFSET < len(cols):
-                    value = clean_text(cols[i + BASKETBALL_PLAYER_STATS_OFFSET].get_text())
+                    value = clean_text(cols[i + BASKETBALL_PLAYER_STATS_OFFSET])
 
                     if col_name.endswith("_made"):
                         made, attempted = split_made_attempted(value)
@@ -68,10 +83,13 @@ def _parse_player_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[d
                         row_data[col_name] = value
 
             table_data.append(row_data)
+            if limit is not None and len(table_data) >= limit:
+                break
 
     return table_data
 
 
+@instrumented("merge")
 def _merge_player_data(existing_data: list[dict[str, Any]], new_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Merge existing and new player data by (name, school, games_played)."""
 
@@ -91,14 +109,19 @@ def _merge_player_data(existing_data: list[dict[str, Any]], new_data: list[dict[
     return list(data_dict.values())
 
 
-async def _fetching_player_stats(url: str) -> list[dict[str, Any]]:
+async def _fetching_player_stats(
+    url: str, indices: list[int] | None = None, limit: int | None = None
+) -> list[dict[str, Any]]:
     try:
-        tables_html = await fetch_page_html(url)
+        tables = await fetch_page_tables(url)
 
         all_data = []
         for i, column_mapping in enumerate(PLAYER_STATS_COLUMNS_TYPE_MAPPING):
-            soup = BeautifulSoup(tables_html[i + PLAYER_SEASON_TOTALS_STATS_START_INDEX], BS4_PARSER)
-            table_data = _parse_player_stats_table(soup, columns=list(column_mapping.keys()))
+            if indices is not None and i not in indices:
+                continue
+            table_data = _parse_player_stats_table(
+                tables[i + PLAYER_SEASON_TOTALS_STATS_START_INDEX], columns=list(column_mapping.keys()), limit=limit
+            )
             all_data = _merge_player_data(all_data, table_data)
 
         return all_data
@@ -110,11 +133,13 @@ async def _fetching_player_stats(url: str) -> list[dict[str, Any]]:
 # -------------------------------------------------------------------
 # DataFrame Assembly
 # -------------------------------------------------------------------
-async def _get_players_stats_df(stats_url: str) -> pd.DataFrame:
+async def _get_players_stats_df(
+    stats_url: str, indices: list[int] | None = None, limit: int | None = None
+) -> pd.DataFrame:
     """Fetch player stats from a page and return a cleaned DataFrame."""
     logger.debug(f"Fetching player stats on category: {stats_url[-5:]}")
 
-    player_stats = await _fetching_player_stats(stats_url)
+    player_stats = await _fetching_player_stats(stats_url, indices, limit)
 
     combined_type_mapping = {
         "player_name": str,
@@ -144,18 +169,18 @@ async def _get_players_stats_df(stats_url: str) -> pd.DataFrame:
     return df
 
 
-def _construct_player_urls(gender: str, season_option: str) -> list[str]:
+def _construct_player_urls(gender: str, season_option: str, season: str | None = None) -> list[str]:
     sport = _get_sport_identifier(gender)
-    season_urls = get_season_urls(BASKETBALL)  # Changed from SEASON_URLS
+    season_urls = get_season_urls(BASKETBALL, season)  # Changed from SEASON_URLS
     season = validate_season_option(season_option, season_urls)
     player_stats_url_template = f"{BASE_URL}/{sport}/{season}/players?pos=sh&r=0&sort={{sort_category}}"
     urls = [player_stats_url_template.format(sort_category=category) for category in PLAYER_SORT_CATEGORIES]
     return urls
 
 
-async def _fetch_and_merge_player_stats(urls: list[str]) -> pd.DataFrame:
+async def _fetch_and_merge_player_stats(urls: list[str], indices: list[int] | None = None) -> pd.DataFrame:
     all_df: list[pd.DataFrame] = []
-    tasks = [_get_players_stats_df(url) for url in urls]
+    tasks = [_get_players_stats_df(url, indices) for url in urls]
     results = await asyncio.gather(*tasks)
     all_df.extend(results)
 
@@ -169,9 +194,36 @@ async def _fetch_and_merge_player_stats(urls: list[str]) -> pd.DataFrame:
     return merged_df
 
 
+@shaped_output
+@memoize_frame
+async def ausports_bball_players(
+    league: LeagueType,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_bball_players, for use inside a running event loop."""
+
+    gender = normalize_gender_arg(league)
+    season_option = season_option.lower()  # type: ignore
+
+    indices = None
+    if columns is not None:
+        indices = tables_for_columns(columns, PLAYER_STATS_COLUMNS_TYPE_MAPPING, _BASE_COLUMNS, _DERIVED_COLUMNS)
+
+    urls = _construct_player_urls(gender, season_option, season)
+
+    # Actually fetch the DataFrame
+    df = await _fetch_and_merge_player_stats(urls, indices)
+
+    return df if columns is None else select_columns(df, columns)
+
+
 def usports_bball_players(
     league: LeagueType,
     season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame:
     """
     Fetch and process player statistics data from the USports website.
@@ -182,17 +234,63 @@ def usports_bball_players(
             - 'regular': Regular season statistics (default).
             - 'playoffs': Playoff season statistics.
             - 'championship': Championship season statistics.
+        season (str, optional): Season to fetch, e.g. '2019-20'. Defaults to the current season.
+        columns (list, optional): Only return these stat columns (plus the player's name and school).
+            Every page is still fetched, but only the stat tables that carry them are parsed.
 
     Returns:
         DataFrame: DataFrame containing processed player statistics.
     """
+    return run_sync(ausports_bball_players(league, season_option, season, columns))
+
+
+@shaped_output
+@memoize_frame
+async def ausports_bball_leaders(
+    league: LeagueType,
+    category: str,
+    n: int = 10,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_bball_leaders, for use inside a running event loop."""
+    if category not in PLAYER_SORT_CATEGORY_TABLES:
+        raise ValueError(f"Invalid category: {category}. Must be one of {', '.join(PLAYER_SORT_CATEGORIES)}")
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
 
     gender = normalize_gender_arg(league)
     season_option = season_option.lower()  # type: ignore
 
-    urls = _construct_player_urls(gender, season_option)
+    urls = _construct_player_urls(gender, season_option, season)
+    url = urls[PLAYER_SORT_CATEGORIES.index(category)]
 
-    # Actually fetch the DataFrame
-    df = asyncio.run(_fetch_and_merge_player_stats(urls))
+    # The page is already sorted by the category, so its first n rows are the leaders
+    df = await _get_players_stats_df(url, [PLAYER_SORT_CATEGORY_TABLES[category]], limit=n)
 
-    return df
+    return df.head(n).reset_index(drop=True)
+
+
+def usports_bball_leaders(
+    league: LeagueType,
+    category: str,
+    n: int = 10,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+) -> pd.DataFrame:
+    """
+    Fetch the top players in one stat category from the single page sorted by it.
+
+    Args:
+        league (str): Gender of the players. Accepts 'm', or 'w' (case insensitive).
+        category (str): Sort category, one of PLAYER_SORT_CATEGORIES (e.g. 'pts', 'treb', 'ast').
+        n (int): Number of players to return (default 10).
+        season_option (str): 'regular' (default), 'playoffs' or 'championship'.
+        season (str, optional): Season to fetch, e.g. '2019-20'. Defaults to the current season.
+
+    Returns:
+        DataFrame: The top `n` players in leaderboard order, with the stats of the table the category ranks.
+
+    >>> top_scorers = usports_bball_leaders('m', 'pts', n=10)
+    """
+    return run_sync(ausports_bball_leaders(league, category, n, season_option, season))
@@ -1,52 +1,49 @@
 """Basketball standings"""
 
-import asyncio
+import logging
 from typing import Any
 
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
 
-from usports.base.constants import BASE_URL, BASKETBALL, BS4_PARSER, get_current_season
+from usports.base.constants import BASE_URL, BASKETBALL, resolve_season
 from usports.base.exceptions import DataFetchError
 from usports.base.types import LeagueType
 from usports.utils import (
+    HTMLTable,
     clean_text,
     convert_types,
-    fetch_page_html,
+    fetch_page_tables,
+    instrumented,
+    memoize_frame,
     normalize_gender_arg,
-    setup_logging,
+    run_sync,
+    shaped_output,
 )
 from usports.utils.helpers import get_conference_mapping_for_league
 
 from .constants import BBALL_STANDINGS_COLUMNS_TYPE_MAPPING
 from .player_stats import _get_sport_identifier
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 
-def _parse_standings_table(soup: BeautifulSoup, columns: list[str]) -> list[dict[str, Any]]:
+@instrumented("parse")
+def _parse_standings_table(table: HTMLTable, columns: list[str]) -> list[dict[str, Any]]:
     """Parse standings data from an HTML table"""
     table_data: list[dict[str, Any]] = []
 
-    # Find all rows in the table
-    rows: list[Tag] = soup.find_all("tr")  # type: ignore
-
-    for row in rows:
+    for row in table.rows:
         row_data = {}
 
         # Extract the team name from the <th> element
-        team_name_th = row.find("th", class_="team-name")
-        if team_name_th:
-            team_name_tag = team_name_th.find("a")  # type: ignore
-            if team_name_tag:
-                team_name = clean_text(team_name_tag.get_text())  # type: ignore
-                row_data["team_name"] = team_name
+        if row.team_name is not None:
+            row_data["team_name"] = clean_text(row.team_name)
 
         # Extract the column data from <td> elements
-        cols: list[Tag] = row.find_all("td")  # type: ignore
+        cols = row.cells
         if cols:
             for col, column_name in zip(cols, columns):
-                row_data[column_name] = clean_text(col.get_text())
+                row_data[column_name] = clean_text(col)
 
             table_data.append(row_data)
 
@@ -58,13 +55,12 @@ async def _fetching_standings(url: str) -> list[dict[str, Any]]:
     Fetch standings data from a given URL.
     """
     try:
-        tables_html = await fetch_page_html(url)
+        tables = await fetch_page_tables(url)
 
         all_data = []
-        for table_html in tables_html:
-            soup = BeautifulSoup(table_html, BS4_PARSER)
+        for table in tables:
             column_names = list(BBALL_STANDINGS_COLUMNS_TYPE_MAPPING.keys())[1:]
-            standings_data = _parse_standings_table(soup, column_names)
+            standings_data = _parse_standings_table(table, column_names)
             all_data.extend(standings_data)
 
         return all_data
@@ -95,10 +91,10 @@ async def _get_standings_df(standings_url: str) -> pd.DataFrame:
     return standings_df
 
 
-async def _fetch_standings(league: LeagueType) -> pd.DataFrame:
+async def _fetch_standings(league: LeagueType, season: str | None = None) -> pd.DataFrame:
     """Fetch ONLY standings data - no team stats."""
     sport = _get_sport_identifier(normalize_gender_arg(league))
-    season = get_current_season(BASKETBALL)
+    season = resolve_season(BASKETBALL, season)
     standings_url = f"{BASE_URL}/{sport}/{season}/standings"
 
     logger.debug(f"FETCHING {league.upper()} BASKETBALL STANDINGS")
@@ -106,15 +102,23 @@ async def _fetch_standings(league: LeagueType) -> pd.DataFrame:
     return await _get_standings_df(standings_url)
 
 
-def usports_bball_standings(league: LeagueType) -> pd.DataFrame:
+@shaped_output
+@memoize_frame
+async def ausports_bball_standings(league: LeagueType, season: str | None = None) -> pd.DataFrame:
+    """Async counterpart of usports_bball_standings, for use inside a running event loop."""
+    return await _fetch_standings(league, season)
+
+
+def usports_bball_standings(league: LeagueType, season: str | None = None) -> pd.DataFrame:
     """
     Get basketball standings (regular season only).
 
     Args:
         league: 'm' or 'w'
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
 
     Returns:
         DataFrame with columns: team_name, games_played, total_wins, total_losses,
         win_percentage, total_points, total_points_against, conference
     """
-    return asyncio.run(_fetch_standings(league))
+    return run_sync(ausports_bball_standings(league, season))
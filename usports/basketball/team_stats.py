@@ -1,22 +1,27 @@
 """Basketball team performance stats (no W/L)."""
 
-import asyncio
+import logging
 from typing import Any
 
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
 
-from usports.base.constants import BASE_URL, BASKETBALL, BS4_PARSER, get_season_urls
+from usports.base.constants import BASE_URL, BASKETBALL, get_season_urls
 from usports.base.exceptions import DataFetchError
 from usports.base.types import LeagueType, SeasonType
 from usports.utils import (
+    HTMLTable,
     _merge_team_data,
     clean_text,
     convert_types,
-    fetch_page_html,
+    fetch_page_tables,
+    instrumented,
+    memoize_frame,
     normalize_gender_arg,
-    setup_logging,
+    run_sync,
+    select_columns,
+    shaped_output,
     split_made_attempted,
+    tables_for_columns,
     validate_season_option,
 )
 from usports.utils.helpers import get_conference_mapping_for_league
@@ -24,33 +29,41 @@ from usports.utils.helpers import get_conference_mapping_for_league
 from .constants import BBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING
 from .player_stats import _get_sport_identifier
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
+# Columns holding 'made-attempted' pairs, split into two columns
+_SPLIT_COLUMNS = [
+    "field_goal_made",
+    "three_pointers_made",
+    "free_throws_made",
+    "field_goal_made_against",
+    "three_pointers_made_against",
+]
 
-def _parse_team_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dict[str, Any]]:
+_BASE_COLUMNS = ["team_name", "games_played", "conference"]
+
+# '_attempted' columns split off each 'made-attempted' stat
+_DERIVED_COLUMNS = {column.replace("made", "attempted"): column for column in _SPLIT_COLUMNS}
+
+
+@instrumented("parse")
+def _parse_team_stats_table(table: HTMLTable, columns: list[str]) -> list[dict[str, Any]]:
     """Parse team stats data from an HTML table"""
     table_data: list[dict[str, Any]] = []
-    rows: list[Tag] = soup.find_all("tr")[1:]  # type: ignore
 
-    for row in rows:
-        cols: list[Tag] = row.find_all("td")  # type: ignore
+    for row in table.rows[1:]:
+        cols = row.cells
         if len(cols) > 1:
             row_data = {}
-            team_name = clean_text(cols[1].get_text())
-            games_played = clean_text(cols[2].get_text())
+            team_name = clean_text(cols[1])
+            games_played = clean_text(cols[2])
             row_data["team_name"] = team_name
             row_data["games_played"] = games_played
 
             for j, col in enumerate(columns):
                 if j < len(cols) - 1:
-                    value = cols[j + 3].get_text().strip()
-                    if col in [
-                        "field_goal_made",
-                        "three_pointers_made",
-                        "free_throws_made",
-                        "field_goal_made_against",
-                        "three_pointers_made_against",
-                    ]:
+                    value = cols[j + 3].strip()
+                    if col in _SPLIT_COLUMNS:
                         made, attempted = split_made_attempted(value)
                         row_data[col] = made
                         row_data[col.replace("made", "attempted")] = attempted
@@ -61,17 +74,19 @@ def _parse_team_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dic
     return table_data
 
 
-async def _fetching_team_stats(url: str) -> list[dict[str, Any]]:
+async def _fetching_team_stats(url: str, indices: list[int] | None = None) -> list[dict[str, Any]]:
     """
     Fetch team stats data from a given URL.
+    Only the stat tables in `indices` are parsed, when given.
     """
     try:
-        tables_html = await fetch_page_html(url)
+        tables = await fetch_page_tables(url)
 
         all_data = []
         for i, column_mapping in enumerate(BBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING):
-            soup = BeautifulSoup(tables_html[i], BS4_PARSER)
-            table_data = _parse_team_stats_table(soup, list(column_mapping.keys()))
+            if indices is not None and i not in indices:
+                continue
+            table_data = _parse_team_stats_table(tables[i], list(column_mapping.keys()))
             all_data = _merge_team_data(all_data, table_data)
 
         return all_data
@@ -83,9 +98,9 @@ async def _fetching_team_stats(url: str) -> list[dict[str, Any]]:
 # -------------------------------------------------------------------
 # DataFrame Assembly
 # -------------------------------------------------------------------
-async def _get_team_stats_df(stats_url: str) -> pd.DataFrame:
+async def _get_team_stats_df(stats_url: str, indices: list[int] | None = None) -> pd.DataFrame:
     """Function to handle teams stats to a pandas DataFrame"""
-    team_stats = await _fetching_team_stats(stats_url)
+    team_stats = await _fetching_team_stats(stats_url, indices)
     df = pd.DataFrame(team_stats)
 
     combined_type_mapping: dict[str, type] = {"team_name": str, "games_played": int}
@@ -109,22 +124,46 @@ async def _get_team_stats_df(stats_url: str) -> pd.DataFrame:
     return df
 
 
-async def _fetch_team_stats(league: LeagueType, season: SeasonType) -> pd.DataFrame:
+async def _fetch_team_stats(
+    league: LeagueType,
+    season_option: SeasonType,
+    season: str | None = None,
+    indices: list[int] | None = None,
+) -> pd.DataFrame:
     """Fetch team performance stats."""
     gender = normalize_gender_arg(league)
     sport = _get_sport_identifier(gender)
-    season_urls = get_season_urls(BASKETBALL)
-    season_url = validate_season_option(season, season_urls)
+    season_urls = get_season_urls(BASKETBALL, season)
+    season_url = validate_season_option(season_option, season_urls)
     team_stats_url = f"{BASE_URL}/{sport}/{season_url}/teams"
 
-    logger.debug(f"FETCHING {gender.upper()} BASKETBALL {season.upper()} TEAM STATISTICS")
+    logger.debug(f"FETCHING {gender.upper()} BASKETBALL {season_option.upper()} TEAM STATISTICS")
 
-    return await _get_team_stats_df(team_stats_url)
+    return await _get_team_stats_df(team_stats_url, indices)
+
+
+@shaped_output
+@memoize_frame
+async def ausports_bball_teams(
+    league: LeagueType,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_bball_teams, for use inside a running event loop."""
+    season_option = season_option.lower()  # type: ignore
+    if columns is None:
+        return await _fetch_team_stats(league, season_option, season)
+
+    indices = tables_for_columns(columns, BBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING, _BASE_COLUMNS, _DERIVED_COLUMNS)
+    return select_columns(await _fetch_team_stats(league, season_option, season, indices), columns)
 
 
 def usports_bball_teams(
     league: LeagueType,
     season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame:
     """
     Get basketball team stats.
@@ -132,9 +171,10 @@ def usports_bball_teams(
     Args:
         league: 'm' or 'w'
         season_option: 'regular', 'playoffs', or 'championship'
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
+        columns: Only return these stat columns (plus team_name), parsing only the tables that carry them.
 
     Returns:
         DataFrame with team stats
     """
-    season_option = season_option.lower()  # type: ignore
-    return asyncio.run(_fetch_team_stats(league, season_option))
+    return run_sync(ausports_bball_teams(league, season_option, season, columns))
@@ -0,0 +1,319 @@
+"""Batch fetch of many sports, leagues and tables in one pipelined pass, and multi-season backfill."""
+
+import asyncio
+import dataclasses
+import importlib
+import json
+import logging
+import os
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+from typing import Literal, TypeAlias
+
+import pandas as pd
+
+from usports.base.constants import (
+    BASKETBALL,
+    DEFAULT_BACKFILL_SEASONS,
+    FOOTBALL,
+    ICE_HOCKEY,
+    SOCCER,
+    VOLLEYBALL,
+    validate_season,
+)
+from usports.base.types import LeagueType, SeasonType
+from usports.utils import get_session, request_limits, run_sync, shared_pages
+from usports.utils.limits import get_limits_override
+
+logger = logging.getLogger(__name__)
+
+KindType: TypeAlias = Literal["players", "teams", "standings"]
+
+# (sport, league, kind, season): league is None for football, season is None for standings
+BatchKey: TypeAlias = tuple[str, LeagueType | None, KindType, SeasonType | None]
+
+# (sport, league, kind, season option, season), e.g. ("basketball", "m", "players", "regular", "2019-20")
+BackfillKey: TypeAlias = tuple[str, LeagueType | None, KindType, SeasonType | None, str]
+
+SPORTS = [BASKETBALL, FOOTBALL, ICE_HOCKEY, SOCCER, VOLLEYBALL]
+KINDS: list[KindType] = ["players", "teams", "standings"]
+
+# Async function of each table, looked up in usports.<sport> only when a batch needs it
+_FUNCTIONS: dict[tuple[str, str], str] = {
+    (BASKETBALL, "players"): "ausports_bball_players",
+    (BASKETBALL, "teams"): "ausports_bball_teams",
+    (BASKETBALL, "standings"): "ausports_bball_standings",
+    (FOOTBALL, "players"): "ausports_fball_players",
+    (FOOTBALL, "teams"): "ausports_fball_teams",
+    (FOOTBALL, "standings"): "ausports_fball_standings",
+    (ICE_HOCKEY, "players"): "ausports_ice_hockey_players",
+    (ICE_HOCKEY, "teams"): "ausports_ice_hockey_teams",
+    (ICE_HOCKEY, "standings"): "ausports_ice_hockey_standings",
+    (SOCCER, "players"): "ausports_soccer_players",
+    (SOCCER, "teams"): "ausports_soccer_teams",
+    (SOCCER, "standings"): "ausports_soccer_standings",
+    (VOLLEYBALL, "players"): "ausports_vball_players",
+    (VOLLEYBALL, "teams"): "ausports_vball_teams",
+    (VOLLEYBALL, "standings"): "ausports_vball_standings",
+}
+
+
+def plan_batch(
+    sports: Iterable[str] | None = None,
+    leagues: Iterable[LeagueType] = ("m", "w"),
+    kinds: Iterable[KindType] | None = None,
+    seasons: Iterable[SeasonType] = ("regular",),
+) -> list[BatchKey]:
+    """
+    Expand a batch request into the distinct tables to fetch, in a stable order.
+    Football ignores `leagues` and standings ignore `seasons`, so they are planned only once.
+    """
+    sports = list(SPORTS if sports is None else sports)
+    kinds = list(KINDS if kinds is None else kinds)
+    leagues, seasons = list(leagues), list(seasons)
+
+    for sport in sports:
+        if sport not in SPORTS:
+            raise ValueError(f"Invalid sport: {sport}. Must be one of {', '.join(SPORTS)}")
+    for kind in kinds:
+        if kind not in KINDS:
+            raise ValueError(f"Invalid kind: {kind}. Must be one of {', '.join(KINDS)}")
+
+    plan: dict[BatchKey, None] = {}
+    for sport in sports:
+        for league in leagues if sport != FOOTBALL else [None]:
+            for kind in kinds:
+                for season in seasons if kind != "standings" else [None]:
+                    plan[(sport, league, kind, season)] = None  # type: ignore
+
+    return list(plan)
+
+
+def plan_backfill(
+    seasons: Iterable[str],
+    sports: Iterable[str] | None = None,
+    leagues: Iterable[LeagueType] = ("m", "w"),
+    kinds: Iterable[KindType] | None = None,
+    season_options: Iterable[SeasonType] = ("regular",),
+) -> list[BackfillKey]:
+    """Expand a backfill request into the distinct tables to fetch, season by season."""
+    plan = plan_batch(sports, leagues, kinds, season_options)
+    return [(*key, validate_season(season)) for season in dict.fromkeys(seasons) for key in plan]
+
+
+async def _run_job(key: BatchKey, season: str | None = None) -> pd.DataFrame:
+    sport, league, kind, season_option = key
+    args = [arg for arg in (league, season_option) if arg is not None]
+    func = getattr(importlib.import_module(f"usports.{sport}"), _FUNCTIONS[(sport, kind)])
+    return await func(*args, season=season)
+
+
+async def _gather_jobs(jobs: Iterable[Awaitable], skip_errors: bool) -> list:
+    """
+    Run `jobs` concurrently like asyncio.gather. Without `skip_errors`, the first failure cancels
+    the jobs still running before it is raised, so none outlives the batch that scheduled it.
+    """
+    tasks = [asyncio.ensure_future(job) for job in jobs]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=skip_errors)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def afetch_all(
+    sports: Iterable[str] | None = None,
+    leagues: Iterable[LeagueType] = ("m", "w"),
+    kinds: Iterable[KindType] | None = None,
+    seasons: Iterable[SeasonType] = ("regular",),
+    max_concurrency: int | None = None,
+    skip_errors: bool = False,
+) -> dict[BatchKey, pd.DataFrame]:
+    """Async counterpart of fetch_all, for use inside a running event loop."""
+    plan = plan_batch(sports, leagues, kinds, seasons)
+    logger.debug(f"Fetching {len(plan)} tables in one batch")
+
+    limits = get_limits_override() or get_session().request_limits
+    if max_concurrency is not None:
+        limits = dataclasses.replace(limits, max_concurrency=max_concurrency)
+
+    with request_limits(limits.max_concurrency, limits.rate_limit, limits.burst), shared_pages():
+        results = await _gather_jobs((_run_job(key) for key in plan), skip_errors)
+
+    frames: dict[BatchKey, pd.DataFrame] = {}
+    for key, result in zip(plan, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Skipping {key}: {result}")
+            continue
+        frames[key] = result
+
+    return frames
+
+
+def fetch_all(
+    sports: Iterable[str] | None = None,
+    leagues: Iterable[LeagueType] = ("m", "w"),
+    kinds: Iterable[KindType] | None = None,
+    seasons: Iterable[SeasonType] = ("regular",),
+    max_concurrency: int | None = None,
+    skip_errors: bool = False,
+) -> dict[BatchKey, pd.DataFrame]:
+    """
+    Fetch many tables in one pipelined pass and return them keyed by (sport, league, kind, season).
+
+    Every requested table is scheduled at once on a single event loop, bounded by the session's
+    request limits (or `max_concurrency`), and each page is downloaded and parsed at most once.
+
+    Args:
+        sports: Sports to fetch, e.g. ['basketball', 'ice_hockey']. Defaults to all of them.
+        leagues: Leagues to fetch, 'm' and/or 'w'. Football has a single league (key league is None).
+        kinds: Tables to fetch: 'players', 'teams' and/or 'standings'. Defaults to all of them.
+        seasons: Season options for players and teams. Standings are current season only (key season is None).
+        max_concurrency: Override the maximum number of page requests in flight.
+        skip_errors: Log and leave out tables that fail instead of raising.
+
+    Returns:
+        dict: DataFrames keyed by (sport, league, kind, season).
+
+    >>> frames = fetch_all(sports=["basketball"], kinds=["standings"])
+    >>> frames[("basketball", "m", "standings", None)]
+    """
+    return run_sync(afetch_all(sports, leagues, kinds, seasons, max_concurrency, skip_errors))
+
+
+class BackfillProgress:
+    """
+    The tables a backfill has completed, saved to a JSON file after each one, so an interrupted
+    backfill run again with the same file skips them and fetches only what is left.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path).expanduser()
+        self.completed: set[BackfillKey] = set()
+
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                self.completed = {tuple(key) for key in json.load(f)["completed"]}  # type: ignore
+
+    def __contains__(self, key: BackfillKey) -> bool:
+        return key in self.completed
+
+    def mark(self, key: BackfillKey) -> None:
+        """Record `key` as completed and save the file (atomically, so a crash never leaves it half-written)."""
+        self.completed.add(key)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"completed": sorted(self.completed, key=str)}, f, indent=1)
+        os.replace(tmp, self.path)
+
+
+async def abackfill(
+    seasons: Iterable[str],
+    sports: Iterable[str] | None = None,
+    leagues: Iterable[LeagueType] = ("m", "w"),
+    kinds: Iterable[KindType] | None = None,
+    season_options: Iterable[SeasonType] = ("regular",),
+    progress: str | os.PathLike[str] | None = None,
+    sink: Callable[[BackfillKey, pd.DataFrame], None] | None = None,
+    max_concurrency: int | None = None,
+    skip_errors: bool = False,
+    max_seasons: int = DEFAULT_BACKFILL_SEASONS,
+) -> dict[BackfillKey, pd.DataFrame]:
+    """Async counterpart of backfill, for use inside a running event loop."""
+    if max_seasons < 1:
+        raise ValueError(f"max_seasons must be at least 1, got {max_seasons}")
+
+    plan = plan_backfill(seasons, sports, leagues, kinds, season_options)
+    completed = BackfillProgress(progress) if progress is not None else None
+    pending = [key for key in plan if completed is None or key not in completed]
+    logger.debug(f"Backfilling {len(pending)} of {len(plan)} tables")
+
+    limits = get_limits_override() or get_session().request_limits
+    if max_concurrency is not None:
+        limits = dataclasses.replace(limits, max_concurrency=max_concurrency)
+
+    frames: dict[BackfillKey, pd.DataFrame] = {}
+
+    async def run_job(key: BackfillKey) -> None:
+        df = await _run_job(key[:4], key[4])  # type: ignore
+        if sink is not None:
+            sink(key, df)
+        else:
+            frames[key] = df
+        if completed is not None:
+            completed.mark(key)
+
+    # Pages are shared within a season and dropped when it is done, with at most max_seasons seasons in flight
+    seasons_in_flight = asyncio.Semaphore(max_seasons)
+
+    async def run_season(keys: list[BackfillKey]) -> list:
+        async with seasons_in_flight:
+            with shared_pages():
+                return await _gather_jobs((run_job(key) for key in keys), skip_errors)
+
+    by_season: dict[str, list[BackfillKey]] = {}
+    for key in pending:
+        by_season.setdefault(key[4], []).append(key)
+
+    with request_limits(limits.max_concurrency, limits.rate_limit, limits.burst):
+        results = await _gather_jobs((run_season(keys) for keys in by_season.values()), skip_errors=False)
+
+    for keys, season_results in zip(by_season.values(), results):
+        for key, result in zip(keys, season_results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Skipping {key}: {result}")
+
+    return frames
+
+
+def backfill(
+    seasons: Iterable[str],
+    sports: Iterable[str] | None = None,
+    leagues: Iterable[LeagueType] = ("m", "w"),
+    kinds: Iterable[KindType] | None = None,
+    season_options: Iterable[SeasonType] = ("regular",),
+    progress: str | os.PathLike[str] | None = None,
+    sink: Callable[[BackfillKey, pd.DataFrame], None] | None = None,
+    max_concurrency: int | None = None,
+    skip_errors: bool = False,
+    max_seasons: int = DEFAULT_BACKFILL_SEASONS,
+) -> dict[BackfillKey, pd.DataFrame]:
+    """
+    Fetch every table of a range of past seasons in one bounded pass, resumably.
+
+    Up to `max_seasons` seasons are fetched at once on a single event loop, bounded by the session's
+    request limits (or `max_concurrency`). Within a season each page is downloaded and parsed at most
+    once, and its pages are released when the season is done, so memory grows with `max_seasons`
+    (and with the returned tables, unless `sink` is given), not with the number of seasons.
+
+    Args:
+        seasons: Seasons to fetch, e.g. season_range('2015-16', '2024-25').
+        sports: Sports to fetch. Defaults to all of them.
+        leagues: Leagues to fetch, 'm' and/or 'w'. Football has a single league (key league is None).
+        kinds: Tables to fetch: 'players', 'teams' and/or 'standings'. Defaults to all of them.
+        season_options: 'regular', 'playoffs' and/or 'championship' for players and teams
+            (key season option is None for standings).
+        progress: JSON file recording the completed tables. Tables already recorded there are
+            skipped, so an interrupted backfill resumes where it stopped.
+        sink: Called with (key, DataFrame) as soon as each table is fetched, e.g. to write it to a
+            warehouse. Tables handed to the sink are not kept in the returned dict.
+        max_concurrency: Override the maximum number of page requests in flight.
+        skip_errors: Log and leave out tables that fail instead of raising. They are not recorded
+            as completed, so the next run retries them.
+        max_seasons: Maximum number of seasons in flight at once.
+
+    Returns:
+        dict: DataFrames keyed by (sport, league, kind, season option, season), unless `sink` is given.
+
+    >>> backfill(season_range("2015-16", "2024-25"), sports=["basketball"], progress="backfill.json",
+    ...          sink=lambda key, df: df.to_parquet("warehouse/" + "_".join(map(str, key)) + ".parquet"))
+    """
+    return run_sync(
+        abackfill(
+            seasons, sports, leagues, kinds, season_options, progress, sink, max_concurrency, skip_errors, max_seasons
+        )
+    )
@@ -1,9 +1,11 @@
 """Functions:
 - usports_fball_teams: Fetch team statistics.
 - usports_fball_players: Fetch player statistics.
+- usports_fball_leaders: Fetch the top players in one stat category.
 - usports_fball_standings: Fetch team standings.
 
 These functions return pandas DataFrames with the requested statistics.
+Each has an async counterpart prefixed with 'a' (e.g. ausports_fball_players) for use inside a running event loop.
 
 Examples:
 >>> from usports.football import usports_fball_teams, usports_fball_players, usports_fball_standings
@@ -18,6 +20,8 @@ Examples:
 
 >>> standings = usports_fball_standings()
 
+>>> passing_leaders = usports_fball_leaders('pyd', n=10)
+
 Author:
     OJ Adeyemi
 
@@ -25,8 +29,41 @@ Date Created:
     March 2025
 """
 
-from .player_stats import usports_fball_players
-from .standings import usports_fball_standings
-from .team_stats import usports_fball_teams
+from typing import TYPE_CHECKING
+
+from usports.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .player_stats import (
+        ausports_fball_leaders,
+        ausports_fball_players,
+        usports_fball_leaders,
+        usports_fball_players,
+    )
+    from .standings import ausports_fball_standings, usports_fball_standings
+    from .team_stats import ausports_fball_teams, usports_fball_teams
+
+__all__ = [
+    "usports_fball_teams",
+    "ausports_fball_teams",
+    "usports_fball_players",
+    "ausports_fball_players",
+    "usports_fball_leaders",
+    "ausports_fball_leaders",
+    "usports_fball_standings",
+    "ausports_fball_standings",
+]
 
-__all__ = ["usports_fball_teams", "usports_fball_players", "usports_fball_standings"]
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".player_stats": [
+            "ausports_fball_leaders",
+            "ausports_fball_players",
+            "usports_fball_leaders",
+            "usports_fball_players",
+        ],
+        ".standings": ["ausports_fball_standings", "usports_fball_standings"],
+        ".team_stats": ["ausports_fball_teams", "usports_fball_teams"],
+    },
+)
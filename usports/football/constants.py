@@ -267,3 +267,15 @@ PLAYER_SORT_CATEGORIES = [
     ("d", "di"),
     ("d", "dblk"),
 ]
+
+# Player stats table (index in FBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING) ranked by each position's pages
+PLAYER_POSITION_TABLES = {
+    "qb": 0,
+    "rb": 1,
+    "wr": 2,
+    "k": 3,
+    "p": 4,
+    "kr": 5,
+    "pts": 7,
+    "d": 8,
+}
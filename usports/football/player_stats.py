@@ -1,52 +1,63 @@
 """Football player stats"""
 
 import asyncio
+import logging
 from typing import Any
 
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
 from pandas.errors import EmptyDataError
 
-from usports.base.constants import BASE_URL, BS4_PARSER, FOOTBALL, FOOTBALL_PLAYER_STATS_OFFSET, get_season_urls
+from usports.base.constants import BASE_URL, FOOTBALL, FOOTBALL_PLAYER_STATS_OFFSET, get_season_urls
 from usports.base.exceptions import DataFetchError
 from usports.base.types import SeasonType
 from usports.utils import (
+    HTMLTable,
     clean_text,
     convert_types,
-    fetch_page_html,
-    setup_logging,
+    fetch_page_tables,
+    instrumented,
+    memoize_frame,
+    run_sync,
+    select_columns,
+    shaped_output,
+    tables_for_columns,
     validate_season_option,
 )
 
-from .constants import FBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING, PLAYER_SORT_CATEGORIES
+from .constants import FBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING, PLAYER_POSITION_TABLES, PLAYER_SORT_CATEGORIES
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
+_BASE_COLUMNS = ["lastname_initials", "first_name", "school", "games_played"]
 
-def _parse_player_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dict[str, Any]]:
-    """Parse player stats data from an HTML table for football."""
+
+@instrumented("parse")
+def _parse_player_stats_table(table: HTMLTable, columns: list[str], limit: int | None = None) -> list[dict[str, Any]]:
+    """Parse player stats data from an HTML table for football, stopping after `limit` players when given."""
     table_data: list[dict[str, Any]] = []
-    rows: list[Tag] = soup.find_all("tr")  # type: ignore
 
-    for row in rows:
-        cols: list[Tag] = row.find_all("td")  # type: ignore
+    for row in table.rows:
+        cols = row.cells
         if len(cols) > 1:
             row_data = {
-                "player_name": clean_text(cols[1].get_text()),
-                "school": clean_text(cols[2].get_text()),
+                "player_name": clean_text(cols[1]),
+                "school": clean_text(cols[2]),
             }
 
             for i, col_name in enumerate(columns):
                 col_index = i + FOOTBALL_PLAYER_STATS_OFFSET
                 if col_index < len(cols):
-                    value = clean_text(cols[col_index].get_text())
+                    value = clean_text(cols[col_index])
                     row_data[col_name] = value
 
             table_data.append(row_data)
+            if limit is not None and len(table_data) >= limit:
+                break
 
     return table_data
 
 
+@instrumented("merge")
 def _merge_player_data(existing_data: list[dict[str, Any]], new_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Merge existing and new player data by (name, school)."""
 
@@ -66,15 +77,18 @@ def _merge_player_data(existing_data: list[dict[str, Any]], new_data: list[dict[
     return list(data_dict.values())
 
 
-async def _fetching_player_stats(url: str) -> list[dict[str, Any]]:
-    """Fetch and parse football player stats from a URL."""
+async def _fetching_player_stats(
+    url: str, indices: list[int] | None = None, limit: int | None = None
+) -> list[dict[str, Any]]:
+    """Fetch and parse football player stats from a URL (only the stat tables in `indices`, when given)."""
     try:
-        tables_html = await fetch_page_html(url)
+        tables = await fetch_page_tables(url)
 
         all_data = []
         for i, column_mapping in enumerate(FBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING):
-            soup = BeautifulSoup(tables_html[i], BS4_PARSER)
-            table_data = _parse_player_stats_table(soup, columns=list(column_mapping.keys()))
+            if indices is not None and i not in indices:
+                continue
+            table_data = _parse_player_stats_table(tables[i], columns=list(column_mapping.keys()), limit=limit)
             all_data = _merge_player_data(all_data, table_data)
 
         return all_data
@@ -86,11 +100,13 @@ async def _fetching_player_stats(url: str) -> list[dict[str, Any]]:
 # -------------------------------------------------------------------
 # DataFrame Assembly
 # -------------------------------------------------------------------
-async def _get_players_stats_df(stats_url: str) -> pd.DataFrame:
+async def _get_players_stats_df(
+    stats_url: str, indices: list[int] | None = None, limit: int | None = None
+) -> pd.DataFrame:
     """Fetch football player stats from a page and return a cleaned DataFrame."""
     logger.debug(f"Fetching football player stats from: {stats_url[-5:]}")
 
-    player_stats = await _fetching_player_stats(stats_url)
+    player_stats = await _fetching_player_stats(stats_url, indices, limit)
 
     # Define type mappings for football stats
     combined_type_mapping = {
@@ -120,9 +136,9 @@ async def _get_players_stats_df(stats_url: str) -> pd.DataFrame:
     return df
 
 
-def _construct_player_urls(season: SeasonType) -> list[str]:
-    season_urls = get_season_urls(FOOTBALL)
-    season_url = validate_season_option(season, season_urls)
+def _construct_player_urls(season_option: SeasonType, season: str | None = None) -> list[str]:
+    season_urls = get_season_urls(FOOTBALL, season)
+    season_url = validate_season_option(season_option, season_urls)
     player_stats_url_template = f"{BASE_URL}/fball/{season_url}/players?pos={{sort_position}}&sort={{sort_category}}"
 
     urls = [
@@ -133,9 +149,9 @@ def _construct_player_urls(season: SeasonType) -> list[str]:
     return urls
 
 
-async def _fetch_and_merge_player_stats(urls: list[str]) -> pd.DataFrame:
+async def _fetch_and_merge_player_stats(urls: list[str], indices: list[int] | None = None) -> pd.DataFrame:
     all_df: list[pd.DataFrame] = []
-    tasks = [_get_players_stats_df(url) for url in urls]
+    tasks = [_get_players_stats_df(url, indices) for url in urls]
     results = await asyncio.gather(*tasks)
     all_df.extend(results)
 
@@ -149,17 +165,86 @@ async def _fetch_and_merge_player_stats(urls: list[str]) -> pd.DataFrame:
     return merged_df
 
 
-def usports_fball_players(season_option: SeasonType = "regular") -> pd.DataFrame:
+@shaped_output
+@memoize_frame
+async def ausports_fball_players(
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_fball_players, for use inside a running event loop."""
+    season_option = season_option.lower()  # type: ignore
+    indices = None
+    if columns is not None:
+        indices = tables_for_columns(columns, FBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING, _BASE_COLUMNS)
+    urls = _construct_player_urls(season_option, season)
+    df = await _fetch_and_merge_player_stats(urls, indices)
+    return df if columns is None else select_columns(df, columns)
+
+
+def usports_fball_players(
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
     """
     Get football player stats for a given season.
 
     Args:
         season_option: 'regular', 'playoffs', or 'championship'
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
+        columns: Only return these stat columns (plus the player's name and school). Every page is
+            still fetched, but only the stat tables that carry them are parsed.
 
     Returns:
         DataFrame containing player stats
     """
+    return run_sync(ausports_fball_players(season_option, season, columns))
+
+
+@shaped_output
+@memoize_frame
+async def ausports_fball_leaders(
+    category: str,
+    n: int = 10,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_fball_leaders, for use inside a running event loop."""
+    sort_categories = [sort for _, sort in PLAYER_SORT_CATEGORIES]
+    if category not in sort_categories:
+        raise ValueError(f"Invalid category: {category}. Must be one of {', '.join(sort_categories)}")
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
+
     season_option = season_option.lower()  # type: ignore
-    urls = _construct_player_urls(season_option)
-    df = asyncio.run(_fetch_and_merge_player_stats(urls))
-    return df
+    page = sort_categories.index(category)
+    position, _ = PLAYER_SORT_CATEGORIES[page]
+
+    url = _construct_player_urls(season_option, season)[page]
+
+    # The page is already sorted by the category, so the first n rows of its position's table are the leaders
+    df = await _get_players_stats_df(url, [PLAYER_POSITION_TABLES[position]], limit=n)
+
+    return df.head(n).reset_index(drop=True)
+
+
+def usports_fball_leaders(
+    category: str,
+    n: int = 10,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+) -> pd.DataFrame:
+    """
+    Get the top football players in one stat category from the single page sorted by it.
+
+    Args:
+        category: Sort category, e.g. 'pyd' (passing yards), 'ryd' (rushing yards) or 'dtt' (tackles).
+        n: Number of players to return (default 10).
+        season_option: 'regular', 'playoffs', or 'championship'
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
+
+    Returns:
+        DataFrame with the top `n` players in leaderboard order and the stats of their position's table
+    """
+    return run_sync(ausports_fball_leaders(category, n, season_option, season))
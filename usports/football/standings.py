@@ -1,49 +1,46 @@
 """Football standings"""
 
-import asyncio
+import logging
 from typing import Any
 
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
 
-from usports.base.constants import BASE_URL, BS4_PARSER, FOOTBALL, get_current_season
+from usports.base.constants import BASE_URL, FOOTBALL, resolve_season
 from usports.base.exceptions import DataFetchError
 from usports.utils import (
+    HTMLTable,
     clean_text,
     convert_types,
-    fetch_page_html,
-    setup_logging,
+    fetch_page_tables,
+    instrumented,
+    memoize_frame,
+    run_sync,
+    shaped_output,
 )
 from usports.utils.helpers import get_conference_mapping_for_league
 
 from .constants import FBALL_STANDINGS_COLUMNS_TYPE_MAPPING
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
 
-def _parse_standings_table(soup: BeautifulSoup, columns: list[str]) -> list[dict[str, Any]]:
+@instrumented("parse")
+def _parse_standings_table(table: HTMLTable, columns: list[str]) -> list[dict[str, Any]]:
     """Parse standings data from an HTML table"""
     table_data: list[dict[str, Any]] = []
 
-    # Find all rows in the table
-    rows: list[Tag] = soup.find_all("tr")  # type: ignore
-
-    for row in rows:
+    for row in table.rows:
         row_data = {}
 
         # Extract the team name from the <th> element
-        team_name_th = row.find("th", class_="team-name")
-        if team_name_th:
-            team_name_tag = team_name_th.find("a")  # type: ignore
-            if team_name_tag:
-                team_name = clean_text(team_name_tag.get_text())  # type: ignore
-                row_data["team_name"] = team_name
+        if row.team_name is not None:
+            row_data["team_name"] = clean_text(row.team_name)
 
         # Extract the column data from <td> elements
-        cols: list[Tag] = row.find_all("td")  # type: ignore
+        cols = row.cells
         if cols:
             for col, column_name in zip(cols, columns):
-                row_data[column_name] = clean_text(col.get_text())
+                row_data[column_name] = clean_text(col)
 
             table_data.append(row_data)
 
@@ -55,13 +52,12 @@ async def _fetching_standings(url: str) -> list[dict[str, Any]]:
     Fetch standings data from a given URL.
     """
     try:
-        tables_html = await fetch_page_html(url)
+        tables = await fetch_page_tables(url)
 
         all_data = []
-        for table_html in tables_html:
-            soup = BeautifulSoup(table_html, BS4_PARSER)
+        for table in tables:
             column_names = list(FBALL_STANDINGS_COLUMNS_TYPE_MAPPING.keys())[1:]
-            standings_data = _parse_standings_table(soup, column_names)
+            standings_data = _parse_standings_table(table, column_names)
             all_data.extend(standings_data)
 
         return all_data
@@ -93,20 +89,30 @@ async def _get_standings_df(standings_url: str) -> pd.DataFrame:
     return standings_df
 
 
-async def _fetch_standings() -> pd.DataFrame:
-    season = get_current_season(FOOTBALL)
+async def _fetch_standings(season: str | None = None) -> pd.DataFrame:
+    season = resolve_season(FOOTBALL, season)
     standings_url = f"{BASE_URL}/fball/{season}/standings"
     logger.debug("FETCHING FOOTBALL STANDINGS")
 
     return await _get_standings_df(standings_url)
 
 
-def usports_fball_standings() -> pd.DataFrame:
+@shaped_output
+@memoize_frame
+async def ausports_fball_standings(season: str | None = None) -> pd.DataFrame:
+    """Async counterpart of usports_fball_standings, for use inside a running event loop."""
+    return await _fetch_standings(season)
+
+
+def usports_fball_standings(season: str | None = None) -> pd.DataFrame:
     """
     Get football standings (regular season only).
 
+    Args:
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
+
     Returns:
         DataFrame with columns: team_name, games_played, total_wins, total_losses,
         win_percentage, total_points, total_points_against, conference
     """
-    return asyncio.run(_fetch_standings())
+    return run_sync(ausports_fball_standings(season))
@@ -1,51 +1,66 @@
 """Football team performance stats (no W/L)."""
 
-import asyncio
+import logging
 from typing import Any
 
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
 
-from usports.base.constants import BASE_URL, BS4_PARSER, FOOTBALL, get_season_urls
+from usports.base.constants import BASE_URL, FOOTBALL, get_season_urls
 from usports.base.exceptions import DataFetchError
 from usports.base.types import SeasonType
 from usports.utils import (
+    HTMLTable,
     _merge_team_data,
     clean_text,
     convert_types,
-    fetch_page_html,
-    setup_logging,
+    fetch_page_tables,
+    instrumented,
+    memoize_frame,
+    run_sync,
+    select_columns,
+    shaped_output,
     split_made_attempted,
+    tables_for_columns,
     validate_season_option,
 )
 from usports.utils.helpers import get_conference_mapping_for_league
 
 from .constants import FBALL_BBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING
 
-logger = setup_logging()
-
-
-def _process_column_data(row_data: dict[str, Any], cols: list[Tag], columns: list[str]) -> None:
+logger = logging.getLogger(__name__)
+
+# Columns holding dash-separated pairs, and the column their second value goes to
+_DASH_SPLIT_COLUMNS = {
+    "field_goal_made": "field_goal_attempt",
+    "extra_point_made": "extra_point_attempt",
+    "third_down_conversions_made": "third_down_attempts",
+    "fourth_down_conversions_made": "fourth_down_attempts",
+    "kick_return_count": "kick_return_yards",
+    "punt_return_count": "punt_return_yards",
+    "punt_count": "punt_yards",
+    "kickoff_count": "kickoff_yards",
+    "scores_made": "scores_attempt",
+    "touchdowns_made": "touchdowns_attempt",
+    "fumbles": "fumbles_lost",
+}
+
+_BASE_COLUMNS = ["team_name", "games_played", "conference"]
+
+# Columns split off another column while parsing, and the column they come from
+_DERIVED_COLUMNS = {
+    **{second: first for first, second in _DASH_SPLIT_COLUMNS.items()},
+    "pass_attempts": "pass_completions",
+    "pass_interceptions": "pass_completions",
+}
+
+
+def _process_column_data(row_data: dict[str, Any], cols: list[str], columns: list[str]) -> None:
     """Process all column data and add to row_data."""
-    dash_split_mapping = {
-        "field_goal_made": "field_goal_attempt",
-        "extra_point_made": "extra_point_attempt",
-        "third_down_conversions_made": "third_down_attempts",
-        "fourth_down_conversions_made": "fourth_down_attempts",
-        "kick_return_count": "kick_return_yards",
-        "punt_return_count": "punt_return_yards",
-        "punt_count": "punt_yards",
-        "kickoff_count": "kickoff_yards",
-        "scores_made": "scores_attempt",
-        "touchdowns_made": "touchdowns_attempt",
-        "fumbles": "fumbles_lost",
-    }
-
     for j, col in enumerate(columns):
         col_index = j + 3
         if col_index < len(cols):
-            raw_value = cols[col_index].get_text().strip()
-            processed_value = _process_single_column(col, raw_value, dash_split_mapping, row_data)
+            raw_value = cols[col_index].strip()
+            processed_value = _process_single_column(col, raw_value, _DASH_SPLIT_COLUMNS, row_data)
             if processed_value is not None:
                 row_data[col] = processed_value
 
@@ -119,17 +134,17 @@ def _process_time_of_possession(raw_value: str) -> Any:
         return raw_value
 
 
-def _parse_football_team_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dict[str, Any]]:
+@instrumented("parse")
+def _parse_football_team_stats_table(table: HTMLTable, columns: list[str]) -> list[dict[str, Any]]:
     """Parse football team stats data from an HTML table without casting."""
     table_data: list[dict[str, Any]] = []
-    rows: list[Tag] = soup.find_all("tr")[1:]  # type: ignore
 
-    for row in rows:
-        cols: list[Tag] = row.find_all("td")  # type: ignore
+    for row in table.rows[1:]:
+        cols = row.cells
         if len(cols) > 1:
             row_data = {}
-            team_name = clean_text(cols[1].get_text())
-            games_played = clean_text(cols[2].get_text())
+            team_name = clean_text(cols[1])
+            games_played = clean_text(cols[2])
             row_data["team_name"] = team_name
             row_data["games_played"] = games_played
             _process_column_data(row_data, cols, columns)
@@ -138,17 +153,19 @@ def _parse_football_team_stats_table(soup: BeautifulSoup, columns: list[str]) ->
     return table_data
 
 
-async def _fetching_team_stats(url: str) -> list[dict[str, Any]]:
+async def _fetching_team_stats(url: str, indices: list[int] | None = None) -> list[dict[str, Any]]:
     """
     Fetch and merge football team stats data from the given URL.
+    Only the stat tables in `indices` are parsed, when given.
     """
     try:
-        tables_html = await fetch_page_html(url)
+        tables = await fetch_page_tables(url)
 
         all_data = []
         for i, column_mapping in enumerate(FBALL_BBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING):
-            soup = BeautifulSoup(tables_html[i], BS4_PARSER)
-            table_data = _parse_football_team_stats_table(soup, list(column_mapping.keys()))
+            if indices is not None and i not in indices:
+                continue
+            table_data = _parse_football_team_stats_table(tables[i], list(column_mapping.keys()))
             all_data = _merge_team_data(all_data, table_data)
 
         return all_data
@@ -159,9 +176,9 @@ async def _fetching_team_stats(url: str) -> list[dict[str, Any]]:
 # -------------------------------------------------------------------
 # DataFrame Assembly
 # -------------------------------------------------------------------
-async def _get_team_stats_df(stats_url: str) -> pd.DataFrame:
+async def _get_team_stats_df(stats_url: str, indices: list[int] | None = None) -> pd.DataFrame:
     """Function to handle football teams stats to a pandas DataFrame"""
-    team_stats = await _fetching_team_stats(stats_url)
+    team_stats = await _fetching_team_stats(stats_url, indices)
     df = pd.DataFrame(team_stats)
     combined_type_mapping: dict[str, type] = {"team_name": str, "games_played": int}
 
@@ -184,25 +201,48 @@ async def _get_team_stats_df(stats_url: str) -> pd.DataFrame:
     return df
 
 
-async def _fetch_team_stats(season: SeasonType) -> pd.DataFrame:
-    season_urls = get_season_urls(FOOTBALL)
-    season_url = validate_season_option(season, season_urls)
+async def _fetch_team_stats(
+    season_option: SeasonType, season: str | None = None, indices: list[int] | None = None
+) -> pd.DataFrame:
+    season_urls = get_season_urls(FOOTBALL, season)
+    season_url = validate_season_option(season_option, season_urls)
     team_stats_url = f"{BASE_URL}/fball/{season_url}/teams"
 
-    logger.debug(f"FETCHING FOOTBALL {season.upper()} TEAM STATISTICS")
+    logger.debug(f"FETCHING FOOTBALL {season_option.upper()} TEAM STATISTICS")
+
+    return await _get_team_stats_df(team_stats_url, indices)
 
-    return await _get_team_stats_df(team_stats_url)
 
+@shaped_output
+@memoize_frame
+async def ausports_fball_teams(
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_fball_teams, for use inside a running event loop."""
+    season_option = season_option.lower()  # type: ignore
+    if columns is None:
+        return await _fetch_team_stats(season_option, season)
+
+    indices = tables_for_columns(columns, FBALL_BBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING, _BASE_COLUMNS, _DERIVED_COLUMNS)
+    return select_columns(await _fetch_team_stats(season_option, season, indices), columns)
 
-def usports_fball_teams(season_option: SeasonType = "regular") -> pd.DataFrame:
+
+def usports_fball_teams(
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
     """
     Get football team stats.
 
     Args:
         season_option: 'regular', 'playoffs', or 'championship'
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
+        columns: Only return these stat columns (plus team_name), parsing only the tables that carry them.
 
     Returns:
         DataFrame with team stats
     """
-    season_option = season_option.lower()  # type: ignore
-    return asyncio.run(_fetch_team_stats(season_option))
+    return run_sync(ausports_fball_teams(season_option, season, columns))
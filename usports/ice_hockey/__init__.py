@@ -1,9 +1,11 @@
 """Functions:
 - usports_ice_hockey_teams: Fetch team statistics.
 - usports_ice_hockey_players: Fetch player statistics.
+- usports_ice_hockey_leaders: Fetch the top players in one stat category.
 - usports_ice_hockey_standings: Fetch team standings.
 
 These functions return pandas DataFrames with the requested statistics.
+Each has an async counterpart prefixed with 'a' (e.g. ausports_ice_hockey_players) for use inside a running event loop.
 
 Examples:
 >>> from usports.ice_hockey import usports_ice_hockey_teams, usports_ice_hockey_players, usports_ice_hockey_standings
@@ -15,6 +17,8 @@ Examples:
 >>> men_player_stats = usports_ice_hockey_players('m')
 >>> women_standings = usports_ice_hockey_standings('w')
 
+>>> men_points_leaders = usports_ice_hockey_leaders('m', 'p', n=10)
+
 Author:
     OJ Adeyemi
 
@@ -22,8 +26,41 @@ Date Created:
     August 2025
 """
 
-from .player_stats import usports_ice_hockey_players
-from .standings import usports_ice_hockey_standings
-from .team_stats import usports_ice_hockey_teams
+from typing import TYPE_CHECKING
+
+from usports.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .player_stats import (
+        ausports_ice_hockey_leaders,
+        ausports_ice_hockey_players,
+        usports_ice_hockey_leaders,
+        usports_ice_hockey_players,
+    )
+    from .standings import ausports_ice_hockey_standings, usports_ice_hockey_standings
+    from .team_stats import ausports_ice_hockey_teams, usports_ice_hockey_teams
+
+__all__ = [
+    "usports_ice_hockey_standings",
+    "ausports_ice_hockey_standings",
+    "usports_ice_hockey_teams",
+    "ausports_ice_hockey_teams",
+    "usports_ice_hockey_players",
+    "ausports_ice_hockey_players",
+    "usports_ice_hockey_leaders",
+    "ausports_ice_hockey_leaders",
+]
 
-__all__ = ["usports_ice_hockey_standings", "usports_ice_hockey_teams", "usports_ice_hockey_players"]
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".player_stats": [
+            "ausports_ice_hockey_leaders",
+            "ausports_ice_hockey_players",
+            "usports_ice_hockey_leaders",
+            "usports_ice_hockey_players",
+        ],
+        ".standings": ["ausports_ice_hockey_standings", "usports_ice_hockey_standings"],
+        ".team_stats": ["ausports_ice_hockey_teams", "usports_ice_hockey_teams"],
+    },
+)
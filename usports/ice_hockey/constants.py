@@ -65,3 +65,9 @@ ICE_HOCKEY_FBALL_STANDINGS_COLUMNS_TYPE_MAPPING: dict[str, type] = {
 
 SKATERS_SORT_CATEGORIES = ["g", "a", "p", "pim", "plusminus", "ppg"]
 GOALIES_SORT_CATEGORIES = ["ggs", "gm", "sv", "svpt", "gow"]
+
+# Player stats table (0: skaters, 1: goalies) ranked by each position's pages
+PLAYER_POSITION_TABLES = {
+    "sk": 0,
+    "g": 1,
+}
@@ -1,13 +1,12 @@
 import asyncio
+import logging
 from typing import Any
 
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
 from pandas.errors import EmptyDataError
 
 from usports.base.constants import (
     BASE_URL,
-    BS4_PARSER,
     ICE_HOCKEY,
     PLAYER_SEASON_TOTALS_STATS_START_INDEX,
     get_season_urls,
@@ -15,11 +14,17 @@ from usports.base.constants import (
 from usports.base.exceptions import DataFetchError
 from usports.base.types import LeagueType, SeasonType
 from usports.utils import (
+    HTMLTable,
     clean_text,
     convert_types,
-    fetch_page_html,
+    fetch_page_tables,
+    instrumented,
+    memoize_frame,
     normalize_gender_arg,
-    setup_logging,
+    run_sync,
+    select_columns,
+    shaped_output,
+    tables_for_columns,
     validate_season_option,
 )
 
@@ -27,10 +32,16 @@ from .constants import (
     GOALIES_SORT_CATEGORIES,
     ICE_HOCKEY_GOALIE_STATS_COLUMNS_TYPE_MAPPING,
     ICE_HOCKEY_PLAYER_STATS_COLUMNS_TYPE_MAPPING,
+    PLAYER_POSITION_TABLES,
     SKATERS_SORT_CATEGORIES,
 )
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
+
+_BASE_COLUMNS = ["lastname_initials", "first_name", "school", "role"]
+
+# Stats of the skater (0) and goalie (1) tables on every players page
+_TABLE_MAPPINGS = [ICE_HOCKEY_PLAYER_STATS_COLUMNS_TYPE_MAPPING, ICE_HOCKEY_GOALIE_STATS_COLUMNS_TYPE_MAPPING]
 
 
 def _get_sport_identifier(league: str) -> str:
@@ -41,22 +52,23 @@ def _get_sport_identifier(league: str) -> str:
     raise ValueError(f"Invalid league: {league}. Must be one of 'men' or 'women'")
 
 
-def _parse_player_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dict[str, Any]]:
+@instrumented("parse")
+def _parse_player_stats_table(table: HTMLTable, columns: list[str], limit: int | None = None) -> list[dict[str, Any]]:
     table_data: list[dict[str, Any]] = []
-    rows: list[Tag] = soup.find_all("tr")  # type: ignore
+    named = 0
 
-    for row in rows:
-        cols: list[Tag] = row.find_all("td")  # type: ignore
+    for row in table.rows:
+        cols = row.cells
 
         if len(cols) > 1:
             row_data = {}
-            row_data["player_name"] = clean_text(cols[1].get_text())
-            row_data["school"] = clean_text(cols[2].get_text())
+            row_data["player_name"] = clean_text(cols[1])
+            row_data["school"] = clean_text(cols[2])
 
             for i, col_name in enumerate(columns):
                 col_index = i + PLAYER_SEASON_TOTALS_STATS_START_INDEX
                 if col_index < len(cols):
-                    value = clean_text(cols[col_index].get_text())
+                    value = clean_text(cols[col_index])
                     if col_name == "goalie_minutes_played" and ":" in value:
                         minutes, seconds = value.split(":")
                         row_data[col_name] = float(minutes) + float(seconds) / 60
@@ -64,37 +76,36 @@ def _parse_player_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[d
                         row_data[col_name] = value
 
             table_data.append(row_data)
+            # Rows without both a last and first name (e.g. a header row of <td> cells) are dropped
+            # when the frame is cleaned, so they don't count towards the limit
+            if len(row_data["player_name"].split(" ", 1)) > 1:
+                named += 1
+            if limit is not None and named >= limit:
+                break
 
     return table_data
 
 
-async def _fetching_player_stats(url: str) -> list[dict[str, Any]]:
-    try:
-        tables_html = await fetch_page_html(url)
-        soup = BeautifulSoup(tables_html[0], BS4_PARSER)
-
-        return _parse_player_stats_table(soup, list(ICE_HOCKEY_PLAYER_STATS_COLUMNS_TYPE_MAPPING.keys()))
-
-    except Exception as e:
-        raise DataFetchError(f"Error fetching player stats: {e}") from e
-
+async def _fetching_page_stats(url: str, index: int, limit: int | None = None) -> list[dict[str, Any]]:
+    """
+    Fetch a players page and parse the table it was requested for: skaters (table 0) on skater
+    pages, goalies (table 1) on goalie pages. With `limit`, only its first players are parsed.
+    """
+    logger.debug(f"Fetching player stats on category: {url[-10:]}")
 
-async def _fetching_goalie_stats(url: str) -> list[dict[str, Any]]:
     try:
-        tables_html = await fetch_page_html(url)
-        soup = BeautifulSoup(tables_html[1], BS4_PARSER)
+        tables = await fetch_page_tables(url)
+        if index >= len(tables):
+            raise IndexError(f"expected at least {index + 1} tables, found {len(tables)}")
 
-        return _parse_player_stats_table(soup, list(ICE_HOCKEY_GOALIE_STATS_COLUMNS_TYPE_MAPPING.keys()))
+        return _parse_player_stats_table(tables[index], list(_TABLE_MAPPINGS[index].keys()), limit)
 
     except Exception as e:
-        raise RuntimeError(f"Error fetching goalie stats: {e}") from e
-
+        raise DataFetchError(f"Error fetching player stats: {e}") from e
 
-async def _get_player_stats_df(players_stats_url: str) -> pd.DataFrame:
-    """Fetch player stats from a page and return cleaned Dataframe"""
-    logger.debug(f"Fetching player stats on category: {players_stats_url[-10:]}")
 
-    player_stats = await _fetching_player_stats(players_stats_url)
+def _get_player_stats_df(player_stats: list[dict[str, Any]]) -> pd.DataFrame:
+    """Return a cleaned Dataframe of skater stats"""
     df_players = pd.DataFrame(player_stats)
 
     player_type_mapping = {"player_name": str, "school": str, "role": str}
@@ -106,7 +117,8 @@ async def _get_player_stats_df(players_stats_url: str) -> pd.DataFrame:
     else:
         df_players = pd.DataFrame(columns=list(player_type_mapping.keys()))
 
-    if "player_name" in df_players.columns:
+    # An empty table has no names to split
+    if "player_name" in df_players.columns and not df_players.empty:
         df_players[["lastname_initials", "first_name"]] = df_players["player_name"].str.split(" ", n=1, expand=True)
 
     df_players = df_players.drop(columns=["player_name"], errors="ignore")
@@ -114,11 +126,8 @@ async def _get_player_stats_df(players_stats_url: str) -> pd.DataFrame:
     return df_players
 
 
-async def _get_goalie_stats_df(goalies_stats_url: str) -> pd.DataFrame:
-    """Fetch goalie stats from a page and return cleaned Dataframe"""
-    logger.debug(f"Fetching goalie stats on category: {goalies_stats_url[-10:]}")
-
-    goalie_stats = await _fetching_goalie_stats(goalies_stats_url)
+def _get_goalie_stats_df(goalie_stats: list[dict[str, Any]]) -> pd.DataFrame:
+    """Return a cleaned Dataframe of goalie stats"""
     df_goalies = pd.DataFrame(goalie_stats)
 
     goalie_type_mapping = {"player_name": str, "school": str, "role": str}
@@ -148,9 +157,9 @@ async def _get_goalie_stats_df(goalies_stats_url: str) -> pd.DataFrame:
     return df_goalies
 
 
-def _construct_urls(gender: str, season_option: str) -> tuple[list[str], list[str]]:
+def _construct_urls(gender: str, season_option: str, season: str | None = None) -> tuple[list[str], list[str]]:
     sport = _get_sport_identifier(gender)
-    season_urls = get_season_urls(ICE_HOCKEY)
+    season_urls = get_season_urls(ICE_HOCKEY, season)
     season = validate_season_option(season_option, season_urls)
 
     player_stats_url_template = f"{BASE_URL}/{sport}/{season}/players?sort={{sort_category}}&pos=sk"
@@ -162,22 +171,30 @@ def _construct_urls(gender: str, season_option: str) -> tuple[list[str], list[st
     return player_stats_urls, goalie_stats_urls
 
 
-async def _fetch_and_merge_player_stats(player_stats_urls: list[str], goalie_stats_urls: list[str]) -> pd.DataFrame:
-    player_task = [_get_player_stats_df(url) for url in player_stats_urls]
-    goalie_task = [_get_goalie_stats_df(url) for url in goalie_stats_urls]
-
-    player_results = await asyncio.gather(*player_task)
-    goalie_results = await asyncio.gather(*goalie_task)
+async def _fetch_and_merge_player_stats(
+    player_stats_urls: list[str], goalie_stats_urls: list[str], limit: int | None = None
+) -> pd.DataFrame:
+    # One concurrent wave for the skater and goalie pages
+    tasks = [_fetching_page_stats(url, PLAYER_POSITION_TABLES["sk"], limit) for url in player_stats_urls]
+    tasks += [_fetching_page_stats(url, PLAYER_POSITION_TABLES["g"], limit) for url in goalie_stats_urls]
+    tables = await asyncio.gather(*tasks)
 
-    all_df = player_results + goalie_results
+    all_df = [_get_player_stats_df(players) for players in tables[: len(player_stats_urls)]]
+    all_df += [_get_goalie_stats_df(goalies) for goalies in tables[len(player_stats_urls) :]]
 
     if not all_df:
         raise EmptyDataError("No data fetched from the URLs.")
 
     cleaned_dfs = [df.dropna(how="all", axis=0).dropna(how="all", axis=1) for df in all_df]
 
-    final_df = pd.concat(cleaned_dfs, ignore_index=True).drop_duplicates(
-        subset=["lastname_initials", "first_name", "school", "games_played", "role"]
+    final_df = pd.concat(cleaned_dfs, ignore_index=True)
+    # games_played only comes with the skater table, which goalie leaderboards skip
+    final_df = final_df.drop_duplicates(
+        subset=[
+            column
+            for column in ["lastname_initials", "first_name", "school", "games_played", "role"]
+            if column in final_df
+        ]
     )
     # Ensure that player names are not empty or NaN
     final_df = final_df[
@@ -192,9 +209,36 @@ async def _fetch_and_merge_player_stats(player_stats_urls: list[str], goalie_sta
     return final_df
 
 
+@shaped_output
+@memoize_frame
+async def ausports_ice_hockey_players(
+    league: LeagueType,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_ice_hockey_players, for use inside a running event loop."""
+    g = normalize_gender_arg(league)
+    season_option = season_option.lower()  # type: ignore
+
+    # Each page has a single table to parse, so the columns are only checked and selected
+    if columns is not None:
+        tables_for_columns(columns, _TABLE_MAPPINGS, _BASE_COLUMNS)
+
+    player_urls, goalie_urls = _construct_urls(g, season_option, season)
+
+    logger.debug(f"Fetching league:{league}, season:{season_option} ice hockey players\n")
+
+    df = await _fetch_and_merge_player_stats(player_urls, goalie_urls)
+
+    return df if columns is None else select_columns(df, columns)
+
+
 def usports_ice_hockey_players(
     league: LeagueType,
     season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame:
     """
     Fetch and process ice hockey players statistics data from the USPORTS website.
@@ -205,17 +249,69 @@ def usports_ice_hockey_players(
             - 'regular': Regular season statistics (default).
             - 'playoffs': Playoff season statistics.
             - 'championship': Championship season statistics.
+        season (str, optional): Season to fetch, e.g. '2019-20'. Defaults to the current season.
+        columns (list, optional): Only return these stat columns (plus the player's name, school and role).
+            Unknown columns raise ValueError.
 
     Returns:
         DataFrame: DataFrame containing processed player statistics.
     """
+    return run_sync(ausports_ice_hockey_players(league, season_option, season, columns))
+
+
+@shaped_output
+@memoize_frame
+async def ausports_ice_hockey_leaders(
+    league: LeagueType,
+    category: str,
+    n: int = 10,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_ice_hockey_leaders, for use inside a running event loop."""
+    if category not in SKATERS_SORT_CATEGORIES and category not in GOALIES_SORT_CATEGORIES:
+        categories = ", ".join(SKATERS_SORT_CATEGORIES + GOALIES_SORT_CATEGORIES)
+        raise ValueError(f"Invalid category: {category}. Must be one of {categories}")
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
+
     g = normalize_gender_arg(league)
     season_option = season_option.lower()  # type: ignore
 
-    player_urls, goalie_urls = _construct_urls(g, season_option)
+    player_urls, goalie_urls = _construct_urls(g, season_option, season)
 
-    logger.debug(f"Fetching league:{league}, season:{season_option} ice hockey players\n")
+    logger.debug(f"Fetching league:{league}, season:{season_option} ice hockey top {n} players by {category}\n")
+
+    # The page is already sorted by the category, so the first n rows of its role's table are the leaders
+    if category in SKATERS_SORT_CATEGORIES:
+        url = player_urls[SKATERS_SORT_CATEGORIES.index(category)]
+        df = await _fetch_and_merge_player_stats([url], [], limit=n)
+    else:
+        url = goalie_urls[GOALIES_SORT_CATEGORIES.index(category)]
+        df = await _fetch_and_merge_player_stats([], [url], limit=n)
+
+    return df.head(n).reset_index(drop=True)
+
+
+def usports_ice_hockey_leaders(
+    league: LeagueType,
+    category: str,
+    n: int = 10,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+) -> pd.DataFrame:
+    """
+    Fetch the top ice hockey players in one stat category from the single page sorted by it.
 
-    df = asyncio.run(_fetch_and_merge_player_stats(player_urls, goalie_urls))
+    Args:
+        league (str): Gender of the players. Accepts 'm', or 'w' (case insensitive).
+        category (str): Sort category. Skaters: 'g', 'a', 'p', 'pim', 'plusminus', 'ppg'.
+            Goalies: 'ggs', 'gm', 'sv', 'svpt', 'gow'.
+        n (int): Number of players to return (default 10).
+        season_option (str): 'regular' (default), 'playoffs' or 'championship'.
+        season (str, optional): Season to fetch, e.g. '2019-20'. Defaults to the current season.
 
-    return df
+    Returns:
+        DataFrame: The top `n` skaters or goalies in leaderboard order.
+    """
+    return run_sync(ausports_ice_hockey_leaders(league, category, n, season_option, season))
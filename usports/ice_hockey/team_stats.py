@@ -1,21 +1,26 @@
 """Ice Hockey team performance stats (no W/L)."""
 
-import asyncio
+import logging
 from typing import Any
 
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
 
-from usports.base.constants import BASE_URL, BS4_PARSER, ICE_HOCKEY, get_season_urls
+from usports.base.constants import BASE_URL, ICE_HOCKEY, get_season_urls
 from usports.base.exceptions import DataFetchError
 from usports.base.types import LeagueType, SeasonType
 from usports.utils import (
+    HTMLTable,
     _merge_team_data,
     clean_text,
     convert_types,
-    fetch_page_html,
+    fetch_page_tables,
+    instrumented,
+    memoize_frame,
     normalize_gender_arg,
-    setup_logging,
+    run_sync,
+    select_columns,
+    shaped_output,
+    tables_for_columns,
     validate_season_option,
 )
 from usports.utils.helpers import get_conference_mapping_for_league
@@ -23,26 +28,27 @@ from usports.utils.helpers import get_conference_mapping_for_league
 from .constants import ICE_HOCKEY_BBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING
 from .player_stats import _get_sport_identifier
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
+_BASE_COLUMNS = ["team_name", "games_played", "conference"]
 
-def _parse_team_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dict[str, Any]]:
-    table_data: list[dict[str, Any]] = []
 
-    rows: list[Tag] = soup.find_all("tr")[1:]  # type: ignore
+@instrumented("parse")
+def _parse_team_stats_table(table: HTMLTable, columns: list[str]) -> list[dict[str, Any]]:
+    table_data: list[dict[str, Any]] = []
 
-    for row in rows:
-        cols: list[Tag] = row.find_all("td")  # type: ignore
+    for row in table.rows[1:]:
+        cols = row.cells
         if cols:
             row_data = {}
-            team_name = clean_text(cols[1].get_text())
-            games_played = clean_text(cols[2].get_text())
+            team_name = clean_text(cols[1])
+            games_played = clean_text(cols[2])
             row_data["team_name"] = team_name
             row_data["games_played"] = games_played
 
             for j, col in enumerate(columns):
                 if j < len(cols) - 1:
-                    value = cols[j + 3].get_text().strip()
+                    value = cols[j + 3].strip()
                     row_data[col] = value
 
             table_data.append(row_data)
@@ -55,11 +61,10 @@ async def _fetching_team_stats(url: str) -> list[dict[str, Any]]:
     Fetch team stats data from a given URL.
     """
     try:
-        tables_html = await fetch_page_html(url)
+        tables = await fetch_page_tables(url)
 
         all_data = []
-        soup = BeautifulSoup(tables_html[0], BS4_PARSER)
-        table_data = _parse_team_stats_table(soup, list(ICE_HOCKEY_BBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING.keys()))
+        table_data = _parse_team_stats_table(tables[0], list(ICE_HOCKEY_BBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING.keys()))
         all_data = _merge_team_data(all_data, table_data)
 
         return all_data
@@ -96,19 +101,39 @@ async def _get_team_stats_df(stats_url: str) -> pd.DataFrame:
     return df
 
 
-async def _fetch_team_stats(league: LeagueType, season: SeasonType) -> pd.DataFrame:
+async def _fetch_team_stats(league: LeagueType, season_option: SeasonType, season: str | None = None) -> pd.DataFrame:
     gender = normalize_gender_arg(league)
     sport = _get_sport_identifier(gender)
-    season_urls = get_season_urls(ICE_HOCKEY)  
-    season_url = validate_season_option(season, season_urls)
+    season_urls = get_season_urls(ICE_HOCKEY, season)  
+    season_url = validate_season_option(season_option, season_urls)
     team_stats_url = f"{BASE_URL}/{sport}/{season_url}/teams"
-    logger.debug(f"FETCHING {gender.upper()} ICE HOCKEY {season.upper()} TEAM STATISTICS")
+    logger.debug(f"FETCHING {gender.upper()} ICE HOCKEY {season_option.upper()} TEAM STATISTICS")
     return await _get_team_stats_df(team_stats_url)
 
 
+@shaped_output
+@memoize_frame
+async def ausports_ice_hockey_teams(
+    league: LeagueType,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_ice_hockey_teams, for use inside a running event loop."""
+    season_option = season_option.lower()  # type: ignore
+    if columns is None:
+        return await _fetch_team_stats(league, season_option, season)
+
+    # Every team stat is in one table, so there is nothing to skip but the columns are still checked
+    tables_for_columns(columns, [ICE_HOCKEY_BBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING], _BASE_COLUMNS)
+    return select_columns(await _fetch_team_stats(league, season_option, season), columns)
+
+
 def usports_ice_hockey_teams(
     league: LeagueType,
     season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame:
     """
     Get ice hockey team stats.
@@ -116,9 +141,10 @@ def usports_ice_hockey_teams(
     Args:
         league: 'm' or 'w'
         season_option: 'regular', 'playoffs', or 'championship'
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
+        columns: Only return these stat columns (plus team_name).
 
     Returns:
         DataFrame with team stats
     """
-    season_option = season_option.lower()  # type: ignore
-    return asyncio.run(_fetch_team_stats(league, season_option))
+    return run_sync(ausports_ice_hockey_teams(league, season_option, season, columns))
@@ -1,9 +1,11 @@
 """Functions:
 - usports_soccer_teams: Fetch team statistics.
 - usports_soccer_players: Fetch player statistics.
+- usports_soccer_leaders: Fetch the top players in one stat category.
 - usports_soccer_standings: Fetch team standings.
 
 These functions return pandas DataFrames with the requested statistics.
+Each has an async counterpart prefixed with 'a' (e.g. ausports_soccer_players) for use inside a running event loop.
 
 Examples:
 >>> from usports.soccer import usports_soccer_teams, usports_soccer_players, usports_soccer_standings
@@ -15,6 +17,8 @@ Examples:
 >>> women_players = usports_soccer_players('w')
 >>> men_standings = usports_soccer_standings('m')
 
+>>> women_top_scorers = usports_soccer_leaders('w', 'g', n=10)
+
 Author:
     OJ Adeyemi
 
@@ -22,8 +26,41 @@ Date Created:
     August 2025
 """
 
-from .player_stats import usports_soccer_players
-from .standings import usports_soccer_standings
-from .team_stats import usports_soccer_teams
+from typing import TYPE_CHECKING
+
+from usports.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .player_stats import (
+        ausports_soccer_leaders,
+        ausports_soccer_players,
+        usports_soccer_leaders,
+        usports_soccer_players,
+    )
+    from .standings import ausports_soccer_standings, usports_soccer_standings
+    from .team_stats import ausports_soccer_teams, usports_soccer_teams
+
+__all__ = [
+    "usports_soccer_teams",
+    "ausports_soccer_teams",
+    "usports_soccer_players",
+    "ausports_soccer_players",
+    "usports_soccer_leaders",
+    "ausports_soccer_leaders",
+    "usports_soccer_standings",
+    "ausports_soccer_standings",
+]
 
-__all__ = ["usports_soccer_teams", "usports_soccer_players", "usports_soccer_standings"]
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".player_stats": [
+            "ausports_soccer_leaders",
+            "ausports_soccer_players",
+            "usports_soccer_leaders",
+            "usports_soccer_players",
+        ],
+        ".standings": ["ausports_soccer_standings", "usports_soccer_standings"],
+        ".team_stats": ["ausports_soccer_teams", "usports_soccer_teams"],
+    },
+)
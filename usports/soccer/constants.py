@@ -94,3 +94,12 @@ GOALIE_SORT_CATEGORIES = [
     ("gext", "gow"),  # wins
     ("gext", "gm"),  # minutes
 ]
+
+# Player stats table (index in SOCCER_PLAYER_STATS_COLUMNS_TYPE_MAPPING) ranked by each position's pages
+PLAYER_POSITION_TABLES = {
+    "sc": 0,
+    "sh": 1,
+    "ms": 2,
+    "g": 3,
+    "gext": 4,
+}
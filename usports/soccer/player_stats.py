@@ -1,53 +1,65 @@
 """Soccer player stats"""
 
 import asyncio
+import logging
 from typing import Any
 
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
 from pandas.errors import EmptyDataError
 
-from usports.base.constants import BASE_URL, BS4_PARSER, SOCCER, get_season_urls
+from usports.base.constants import BASE_URL, SOCCER, get_season_urls
 from usports.base.exceptions import DataFetchError
 from usports.base.types import LeagueType, SeasonType
 from usports.utils import (
+    HTMLTable,
     clean_text,
     convert_types,
-    fetch_page_html,
+    fetch_page_tables,
+    instrumented,
+    memoize_frame,
     normalize_gender_arg,
-    setup_logging,
+    run_sync,
+    select_columns,
+    shaped_output,
+    tables_for_columns,
     validate_season_option,
 )
 
 from .constants import (
     FIELD_PLAYER_SORT_CATEGORIES,
     GOALIE_SORT_CATEGORIES,
+    PLAYER_POSITION_TABLES,
     SOCCER_PLAYER_STATS_COLUMNS_TYPE_MAPPING,
 )
 from .standings import _get_sport_identifier
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
+_BASE_COLUMNS = ["lastname_initials", "first_name", "school", "games_played", "position"]
 
-def _parse_player_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dict[str, Any]]:
-    """Parse player stats data from an HTML table"""
+# Goalie and field player pages always parse the first table of their position, which lists their players
+_ROW_TABLES = [PLAYER_POSITION_TABLES["sc"], PLAYER_POSITION_TABLES["g"]]
+
+
+@instrumented("parse")
+def _parse_player_stats_table(table: HTMLTable, columns: list[str], limit: int | None = None) -> list[dict[str, Any]]:
+    """Parse player stats data from an HTML table, stopping after `limit` players when given."""
     table_data: list[dict[str, Any]] = []
-    rows: list[Tag] = soup.find_all("tr")  # type: ignore
 
-    for row in rows:
-        cols: list[Tag] = row.find_all("td")  # type: ignore
+    for row in table.rows:
+        cols = row.cells
 
         if len(cols) > 1:
             row_data = {}
-            row_data["player_name"] = clean_text(cols[1].get_text())
-            row_data["school"] = clean_text(cols[2].get_text())
-            row_data["games_played"] = clean_text(cols[3].get_text())
+            row_data["player_name"] = clean_text(cols[1])
+            row_data["school"] = clean_text(cols[2])
+            row_data["games_played"] = clean_text(cols[3])
 
             start_index = 4  # Start after name, school, games_played
             for i, col_name in enumerate(columns):
                 col_index = i + start_index
                 if col_index < len(cols):
-                    value = clean_text(cols[col_index].get_text())
+                    value = clean_text(cols[col_index])
 
                     # Handle minutes format MM:SS
                     if col_name == "goalie_minutes_played" and ":" in value:
@@ -61,27 +73,32 @@ def _parse_player_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[d
                     row_data[col_name] = value
 
             table_data.append(row_data)
+            if limit is not None and len(table_data) >= limit:
+                break
 
     return table_data
 
 
-async def _fetch_goalie_stats(url: str) -> list[dict[str, Any]]:
-    """Fetch only goalie tables (last 2 tables)"""
+async def _fetch_goalie_stats(
+    url: str, indices: list[int] | None = None, limit: int | None = None
+) -> list[dict[str, Any]]:
+    """Fetch only goalie tables (last 2 tables), or only those in `indices` when given"""
     try:
-        tables_html = await fetch_page_html(url)
+        tables = await fetch_page_tables(url)
 
         # Only get the last 2 tables (goalie tables)
-        goalie_tables = tables_html[-2:]
+        goalie_tables = tables[-2:]
 
         all_data = []
 
         # Process goalie tables (indices 3 and 4 in SOCCER_PLAYER_STATS_COLUMNS_TYPE_MAPPING)
-        for i, table_html in enumerate(goalie_tables):
+        for i, table in enumerate(goalie_tables):
             mapping_index = i + 3  # Maps to indices 3 and 4 in the mapping
-            if mapping_index < len(SOCCER_PLAYER_STATS_COLUMNS_TYPE_MAPPING):
-                soup = BeautifulSoup(table_html, BS4_PARSER)
+            if mapping_index < len(SOCCER_PLAYER_STATS_COLUMNS_TYPE_MAPPING) and (
+                indices is None or mapping_index in indices
+            ):
                 column_mapping = SOCCER_PLAYER_STATS_COLUMNS_TYPE_MAPPING[mapping_index]
-                table_data = _parse_player_stats_table(soup, list(column_mapping.keys()))
+                table_data = _parse_player_stats_table(table, list(column_mapping.keys()), limit)
                 all_data.extend(table_data)
 
         return all_data
@@ -90,22 +107,24 @@ async def _fetch_goalie_stats(url: str) -> list[dict[str, Any]]:
         raise DataFetchError(f"Error fetching goalie stats: {e}") from e
 
 
-async def _fetch_field_player_stats(url: str) -> list[dict[str, Any]]:
-    """Fetch only field player tables (tables -5, -4, -3)"""
+async def _fetch_field_player_stats(
+    url: str, indices: list[int] | None = None, limit: int | None = None
+) -> list[dict[str, Any]]:
+    """Fetch only field player tables (tables -5, -4, -3), or only those in `indices` when given"""
     try:
-        tables_html = await fetch_page_html(url)
+        tables = await fetch_page_tables(url)
 
         # Get tables -5, -4, -3 (the three field player tables)
-        field_tables = tables_html[-5:-2]
+        field_tables = tables[-5:-2]
 
         all_data = []
 
         # Process field player tables (indices 0, 1, 2 in SOCCER_PLAYER_STATS_COLUMNS_TYPE_MAPPING)
-        for i, table_html in enumerate(field_tables):
-            if i < 3:  # Only process first 3 mappings (field player stats)
-                soup = BeautifulSoup(table_html, BS4_PARSER)
+        for i, table in enumerate(field_tables):
+            # Only process first 3 mappings (field player stats)
+            if i < 3 and (indices is None or i in indices):
                 column_mapping = SOCCER_PLAYER_STATS_COLUMNS_TYPE_MAPPING[i]
-                table_data = _parse_player_stats_table(soup, list(column_mapping.keys()))
+                table_data = _parse_player_stats_table(table, list(column_mapping.keys()), limit)
                 all_data.extend(table_data)
 
         return all_data
@@ -114,6 +133,7 @@ async def _fetch_field_player_stats(url: str) -> list[dict[str, Any]]:
         raise DataFetchError(f"Error fetching field player stats: {e}") from e
 
 
+@instrumented("merge")
 def _merge_player_data(existing_data: list[dict[str, Any]], new_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Merge existing and new player data by (player_name, school, games_played)."""
 
@@ -136,23 +156,24 @@ def _merge_player_data(existing_data: list[dict[str, Any]], new_data: list[dict[
     return list(data_dict.values())
 
 
-async def _get_goalie_stats_df(goalie_urls: list[str]) -> tuple[pd.DataFrame, set[str]]:
-    """Fetch goalie stats and return DataFrame and set of goalie identifiers."""
+def _get_goalie_stats_df(
+    goalie_urls: list[str], results: list[list[dict[str, Any]] | BaseException]
+) -> tuple[pd.DataFrame, set[str]]:
+    """Build the goalie stats DataFrame and set of goalie identifiers from fetched pages."""
     all_goalie_data: list[dict[str, Any]] = []
     goalie_names: set[str] = set()
 
-    for url in goalie_urls:
-        try:
-            goalie_data = await _fetch_goalie_stats(url)
-            for player in goalie_data:
-                player["position"] = "goalie"
-                key = f"{player['player_name']}_{player['school']}"
-                goalie_names.add(key)
-            all_goalie_data = _merge_player_data(all_goalie_data, goalie_data)
-        except Exception as e:
-            logger.debug(f"Error fetching goalie stats from {url}: {e}")
+    for url, goalie_data in zip(goalie_urls, results):
+        if isinstance(goalie_data, Exception):
+            logger.debug(f"Error fetching goalie stats from {url}: {goalie_data}")
             continue
 
+        for player in goalie_data:
+            player["position"] = "goalie"
+            key = f"{player['player_name']}_{player['school']}"
+            goalie_names.add(key)
+        all_goalie_data = _merge_player_data(all_goalie_data, goalie_data)
+
     if all_goalie_data:
         df = pd.DataFrame(all_goalie_data)
     else:
@@ -161,25 +182,26 @@ async def _get_goalie_stats_df(goalie_urls: list[str]) -> tuple[pd.DataFrame, se
     return df, goalie_names
 
 
-async def _get_field_players_stats_df(field_urls: list[str], goalie_names: set[str]) -> pd.DataFrame:
-    """Fetch field player stats."""
+def _get_field_players_stats_df(
+    field_urls: list[str], results: list[list[dict[str, Any]] | BaseException], goalie_names: set[str]
+) -> pd.DataFrame:
+    """Build the field player stats DataFrame from fetched pages."""
     all_field_data: list[dict[str, Any]] = []
 
-    for url in field_urls:
-        try:
-            player_data = await _fetch_field_player_stats(url)
-            for player in player_data:
-                key = f"{player['player_name']}_{player['school']}"
-                # Mark position based on whether they're in goalie set (handles edge cases)
-                if key in goalie_names:
-                    player["position"] = "goalie"
-                else:
-                    player["position"] = "field"
-            all_field_data = _merge_player_data(all_field_data, player_data)
-        except Exception as e:
-            logger.debug(f"Error fetching field player stats from {url}: {e}")
+    for url, player_data in zip(field_urls, results):
+        if isinstance(player_data, Exception):
+            logger.debug(f"Error fetching field player stats from {url}: {player_data}")
             continue
 
+        for player in player_data:
+            key = f"{player['player_name']}_{player['school']}"
+            # Mark position based on whether they're in goalie set (handles edge cases)
+            if key in goalie_names:
+                player["position"] = "goalie"
+            else:
+                player["position"] = "field"
+        all_field_data = _merge_player_data(all_field_data, player_data)
+
     if all_field_data:
         df = pd.DataFrame(all_field_data)
     else:
@@ -188,10 +210,10 @@ async def _get_field_players_stats_df(field_urls: list[str], goalie_names: set[s
     return df
 
 
-def _construct_urls(gender: str, season_option: str) -> tuple[list[str], list[str]]:
+def _construct_urls(gender: str, season_option: str, season: str | None = None) -> tuple[list[str], list[str]]:
     """Construct separate URLs for goalies and field players."""
     sport = _get_sport_identifier(gender)
-    season_urls = get_season_urls(SOCCER)
+    season_urls = get_season_urls(SOCCER, season)
     season = validate_season_option(season_option, season_urls)
 
     player_stats_url_template = f"{BASE_URL}/{sport}/{season}/players?pos={{position}}&sort={{sort_category}}"
@@ -209,14 +231,26 @@ def _construct_urls(gender: str, season_option: str) -> tuple[list[str], list[st
     return goalie_urls, field_urls
 
 
-async def _fetch_and_merge_player_stats(goalie_urls: list[str], field_urls: list[str]) -> pd.DataFrame:
-    """Fetch and merge player stats, processing goalies first."""
+async def _fetch_and_merge_player_stats(
+    goalie_urls: list[str], field_urls: list[str], indices: list[int] | None = None, limit: int | None = None
+) -> pd.DataFrame:
+    """Fetch every goalie and field player page concurrently, then merge them with goalies first."""
 
-    # First, fetch goalie stats and identify all goalies
-    goalie_df, goalie_names = await _get_goalie_stats_df(goalie_urls)
+    # One concurrent wave for all pages; a failed page is skipped rather than aborting the rest
+    results = await asyncio.gather(
+        *(_fetch_goalie_stats(url, indices, limit) for url in goalie_urls),
+        *(_fetch_field_player_stats(url, indices, limit) for url in field_urls),
+        return_exceptions=True,
+    )
+    # Only page errors are skipped, as the sequential loop did; cancellation still propagates
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            raise result
+    goalie_results, field_results = results[: len(goalie_urls)], results[len(goalie_urls) :]
 
-    # Then fetch field player stats
-    field_df = await _get_field_players_stats_df(field_urls, goalie_names)
+    # Identify all goalies first, then mark field players against that set
+    goalie_df, goalie_names = _get_goalie_stats_df(goalie_urls, goalie_results)
+    field_df = _get_field_players_stats_df(field_urls, field_results, goalie_names)
 
     # Combine dataframes
     all_dfs = []
@@ -242,10 +276,12 @@ async def _fetch_and_merge_player_stats(goalie_urls: list[str], field_urls: list
     return merged_df
 
 
-async def _get_players_stats_df_final(goalie_urls: list[str], field_urls: list[str]) -> pd.DataFrame:
+async def _get_players_stats_df_final(
+    goalie_urls: list[str], field_urls: list[str], indices: list[int] | None = None, limit: int | None = None
+) -> pd.DataFrame:
     """Final processing of player stats DataFrame."""
 
-    df = await _fetch_and_merge_player_stats(goalie_urls, field_urls)
+    df = await _fetch_and_merge_player_stats(goalie_urls, field_urls, indices, limit)
 
     if df.empty:
         return pd.DataFrame()
@@ -284,9 +320,37 @@ async def _get_players_stats_df_final(goalie_urls: list[str], field_urls: list[s
     return df
 
 
+@shaped_output
+@memoize_frame
+async def ausports_soccer_players(
+    league: LeagueType,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_soccer_players, for use inside a running event loop."""
+    gender = normalize_gender_arg(league)
+    season_option = season_option.lower()  # type: ignore
+
+    indices = None
+    if columns is not None:
+        indices = tables_for_columns(columns, SOCCER_PLAYER_STATS_COLUMNS_TYPE_MAPPING, _BASE_COLUMNS)
+        indices = sorted({*indices, *_ROW_TABLES})
+
+    goalie_urls, field_urls = _construct_urls(gender, season_option, season)
+
+    logger.debug(f"Fetching {league} soccer {season_option} player stats")
+
+    df = await _get_players_stats_df_final(goalie_urls, field_urls, indices)
+
+    return df if columns is None else select_columns(df, columns)
+
+
 def usports_soccer_players(
     league: LeagueType,
     season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame:
     """
     Fetch and process soccer player statistics data from the USports website.
@@ -297,19 +361,76 @@ def usports_soccer_players(
             - 'regular': Regular season statistics (default).
             - 'playoffs': Playoff season statistics.
             - 'championship': Championship season statistics.
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
+        columns: Only return these stat columns (plus the player's name and school). Every page is
+            still fetched, but only the stat tables that carry them are parsed.
 
     Returns:
         DataFrame: DataFrame containing processed player statistics with scoring,
                   shooting, misc, and goalkeeper stats. Players are marked as either
                   'goalie' or 'field' in the position column.
     """
+    return run_sync(ausports_soccer_players(league, season_option, season, columns))
+
+
+@shaped_output
+@memoize_frame
+async def ausports_soccer_leaders(
+    league: LeagueType,
+    category: str,
+    n: int = 10,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_soccer_leaders, for use inside a running event loop."""
+    categories = GOALIE_SORT_CATEGORIES + FIELD_PLAYER_SORT_CATEGORIES
+    sort_categories = [sort for _, sort in categories]
+    if category not in sort_categories:
+        raise ValueError(f"Invalid category: {category}. Must be one of {', '.join(sort_categories)}")
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
+
     gender = normalize_gender_arg(league)
     season_option = season_option.lower()  # type: ignore
+    page = sort_categories.index(category)
+    position, _ = categories[page]
+    indices = [PLAYER_POSITION_TABLES[position]]
 
-    goalie_urls, field_urls = _construct_urls(gender, season_option)
+    goalie_urls, field_urls = _construct_urls(gender, season_option, season)
 
-    logger.debug(f"Fetching {league} soccer {season_option} player stats")
+    logger.debug(f"Fetching {league} soccer {season_option} top {n} players by {category}")
 
-    df = asyncio.run(_get_players_stats_df_final(goalie_urls, field_urls))
+    # The page is already sorted by the category, so the first n rows of its position's table are the leaders
+    if page < len(GOALIE_SORT_CATEGORIES):
+        df = await _get_players_stats_df_final([goalie_urls[page]], [], indices, limit=n)
+    else:
+        df = await _get_players_stats_df_final([], [field_urls[page - len(GOALIE_SORT_CATEGORIES)]], indices, limit=n)
+        # Without the goalie pages, goalies on a field leaderboard cannot be told apart
+        df = df.drop(columns=["position"], errors="ignore")
 
-    return df
+    return df.head(n).reset_index(drop=True)
+
+
+def usports_soccer_leaders(
+    league: LeagueType,
+    category: str,
+    n: int = 10,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+) -> pd.DataFrame:
+    """
+    Fetch the top soccer players in one stat category from the single page sorted by it.
+
+    Args:
+        league: Gender of the players. Accepts 'm' or 'w' (case insensitive).
+        category: Sort category. Field players: 'p' (points), 'g' (goals), 'a' (assists), 'sh' (shots),
+            'sog' (shots on goal), 'yc' (yellow cards), 'gw' (game winning goals). Goalies: 'sv' (saves),
+            'ga' (goals against), 'gow' (wins), 'gm' (minutes).
+        n: Number of players to return (default 10).
+        season_option: 'regular' (default), 'playoffs' or 'championship'.
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
+
+    Returns:
+        DataFrame: The top `n` players in leaderboard order, with the stats of the table the category ranks.
+    """
+    return run_sync(ausports_soccer_leaders(league, category, n, season_option, season))
@@ -1,28 +1,157 @@
 """Utilities package for the USports library.
 
 This package provides utility functions for processing player and team statistics data.
+Exports are imported on first access, so importing the package alone stays cheap.
 """
 
-from .headers import get_random_header
-from .helpers import (
-    _merge_team_data,
-    clean_text,
-    convert_types,
-    fetch_page_html,
-    normalize_gender_arg,
-    split_made_attempted,
-    validate_season_option,
-)
-from .logger import setup_logging
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .cache import CachedResponse, ResponseCache
+    from .fixtures import FixtureStore
+    from .headers import get_random_header
+    from .helpers import (
+        _merge_team_data,
+        clean_text,
+        convert_types,
+        fetch_page_html,
+        fetch_page_tables,
+        normalize_gender_arg,
+        recorded_pages,
+        select_columns,
+        shared_pages,
+        split_made_attempted,
+        tables_for_columns,
+        validate_season_option,
+    )
+    from .limits import RequestLimits, TokenBucket, request_limits
+    from .logger import setup_logging
+    from .memo import (
+        ResultCache,
+        disable_result_cache,
+        enable_result_cache,
+        fresh_results,
+        get_result_cache,
+        memoize_frame,
+    )
+    from .metrics import Metrics, MetricsRecorder, get_metrics, instrumented, set_metrics
+    from .output import (
+        OutputOptions,
+        apply_output_options,
+        arrow_frame,
+        compact_frame,
+        get_output_options,
+        output_options,
+        set_output_options,
+        shaped_output,
+        to_arrow_table,
+    )
+    from .retry import RetryPolicy
+    from .session import USportsSession, get_session, run_sync, set_default_session
+    from .snapshots import SnapshotDiff, SnapshotStore
+    from .tables import HTMLTable, TableRow, extract_tables, resolve_parser
 
 __all__ = [
+    "CachedResponse",
+    "FixtureStore",
+    "HTMLTable",
+    "Metrics",
+    "MetricsRecorder",
+    "OutputOptions",
+    "RequestLimits",
+    "ResponseCache",
+    "ResultCache",
+    "RetryPolicy",
+    "SnapshotDiff",
+    "SnapshotStore",
+    "TableRow",
+    "TokenBucket",
+    "USportsSession",
     "_merge_team_data",
+    "apply_output_options",
+    "arrow_frame",
     "clean_text",
+    "compact_frame",
     "convert_types",
+    "disable_result_cache",
+    "enable_result_cache",
+    "extract_tables",
     "fetch_page_html",
+    "fetch_page_tables",
+    "fresh_results",
+    "instrumented",
+    "memoize_frame",
+    "get_metrics",
+    "get_output_options",
     "get_random_header",
+    "get_result_cache",
+    "get_session",
+    "output_options",
+    "recorded_pages",
+    "request_limits",
+    "resolve_parser",
+    "run_sync",
+    "select_columns",
+    "set_default_session",
+    "set_metrics",
+    "set_output_options",
+    "shaped_output",
+    "shared_pages",
     "setup_logging",
     "split_made_attempted",
+    "tables_for_columns",
+    "to_arrow_table",
     "normalize_gender_arg",
     "validate_season_option",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".cache": ["CachedResponse", "ResponseCache"],
+        ".fixtures": ["FixtureStore"],
+        ".headers": ["get_random_header"],
+        ".helpers": [
+            "_merge_team_data",
+            "clean_text",
+            "convert_types",
+            "fetch_page_html",
+            "fetch_page_tables",
+            "normalize_gender_arg",
+            "recorded_pages",
+            "select_columns",
+            "shared_pages",
+            "split_made_attempted",
+            "tables_for_columns",
+            "validate_season_option",
+        ],
+        ".limits": ["RequestLimits", "TokenBucket", "request_limits"],
+        ".logger": ["setup_logging"],
+        ".memo": [
+            "ResultCache",
+            "disable_result_cache",
+            "enable_result_cache",
+            "fresh_results",
+            "get_result_cache",
+            "memoize_frame",
+        ],
+        ".metrics": ["Metrics", "MetricsRecorder", "get_metrics", "instrumented", "set_metrics"],
+        ".output": [
+            "OutputOptions",
+            "apply_output_options",
+            "arrow_frame",
+            "compact_frame",
+            "get_output_options",
+            "output_options",
+            "set_output_options",
+            "shaped_output",
+            "to_arrow_table",
+        ],
+        ".retry": ["RetryPolicy"],
+        ".session": ["USportsSession", "get_session", "run_sync", "set_default_session"],
+        ".snapshots": ["SnapshotDiff", "SnapshotStore"],
+        ".tables": ["HTMLTable", "TableRow", "extract_tables", "resolve_parser"],
+    },
+)
@@ -0,0 +1,114 @@
+"""Persistent on-disk cache for fetched stats pages."""
+
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from usports.base.constants import DEFAULT_CACHE_PATH, DEFAULT_CACHE_TTL
+
+
+@dataclass(slots=True)
+class CachedResponse:
+    """A cached page body with the validators needed to revalidate it."""
+
+    url: str
+    body: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    def is_fresh(self, ttl: float | None) -> bool:
+        """Whether the entry can be served without asking the server."""
+        return ttl is None or time.time() - self.fetched_at < ttl
+
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating the entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    SQLite-backed HTTP response cache keyed by URL.
+
+    Fresh entries (younger than `ttl` seconds, or any age when `ttl` is None) are served from
+    disk. Stale entries are revalidated with ETag/Last-Modified, so an unchanged page costs a
+    304 instead of a full download. With `cache_only=True` the network is never used and a
+    missing page raises DataFetchError.
+    """
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_CACHE_PATH,
+        ttl: float | None = DEFAULT_CACHE_TTL,
+        cache_only: bool = False,
+    ):
+        self.path = Path(path).expanduser()
+        self.ttl = ttl
+        self.cache_only = cache_only
+
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    url TEXT PRIMARY KEY,
+                    body BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL
+                )
+                """
+            )
+        return self._conn
+
+    def get(self, url: str) -> CachedResponse | None:
+        """Return the cached entry for `url`, if any."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT body, etag, last_modified, fetched_at FROM responses WHERE url = ?", (url,))
+                .fetchone()
+            )
+
+        if row is None:
+            return None
+
+        body, etag, last_modified, fetched_at = row
+        return CachedResponse(url, zlib.decompress(body).decode("utf-8"), etag, last_modified, fetched_at)
+
+    def set(self, url: str, body: str, etag: str | None = None, last_modified: str | None = None) -> None:
+        """Store a freshly downloaded page."""
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (url, body, etag, last_modified, fetched_at) VALUES (?, ?, ?, ?, ?)",
+                (url, zlib.compress(body.encode("utf-8")), etag, last_modified, time.time()),
+            )
+
+    def touch(self, url: str) -> None:
+        """Mark an entry as fresh again after a 304 Not Modified."""
+        with self._lock, self._connect() as conn:
+            conn.execute("UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url))
+
+    def clear(self) -> None:
+        """Remove every cached page."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,64 @@
+"""Record/replay store of raw HTML pages for offline, deterministic runs."""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Literal
+
+from usports.base.constants import FIXTURE_RECORD, FIXTURE_REPLAY
+from usports.base.exceptions import DataFetchError
+
+FixtureMode = Literal["record", "replay"]
+
+
+class FixtureStore:
+    """
+    Directory of recorded pages keyed by URL.
+
+    In 'record' mode every page fetched by the session is also written to `directory`.
+    In 'replay' mode pages are served from `directory` only: the network is never used and a
+    page that was not recorded raises DataFetchError. An ``index.json`` maps each URL to its file.
+    """
+
+    def __init__(self, directory: str | Path, mode: FixtureMode = FIXTURE_REPLAY):
+        if mode not in (FIXTURE_RECORD, FIXTURE_REPLAY):
+            raise ValueError(f"Invalid fixture mode: {mode}. Must be one of {FIXTURE_RECORD}, {FIXTURE_REPLAY}")
+
+        self.directory = Path(directory).expanduser()
+        self.mode = mode
+        self._lock = threading.Lock()
+
+    @property
+    def replay(self) -> bool:
+        return self.mode == FIXTURE_REPLAY
+
+    @staticmethod
+    def filename(url: str) -> str:
+        return f"{hashlib.sha256(url.encode('utf-8')).hexdigest()[:20]}.html"
+
+    def load(self, url: str) -> str:
+        """Return the recorded body for `url`."""
+        path = self.directory / self.filename(url)
+        try:
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError as e:
+            raise DataFetchError(f"No recorded fixture for {url} in {self.directory}") from e
+
+    def save(self, url: str, body: str) -> None:
+        """Record the body fetched for `url`."""
+        filename = self.filename(url)
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            (self.directory / filename).write_text(body, encoding="utf-8")
+
+            index = self.urls()
+            index[url] = filename
+            (self.directory / "index.json").write_text(json.dumps(index, indent=2, sort_keys=True), encoding="utf-8")
+
+    def urls(self) -> dict[str, str]:
+        """Recorded URLs mapped to their fixture files."""
+        try:
+            return json.loads((self.directory / "index.json").read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
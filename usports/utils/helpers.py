@@ -1,29 +1,101 @@
+import asyncio
+import functools
 import re
 import unicodedata
+from collections.abc import Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import Any, Literal
 
-import httpx
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
 from pandas import DataFrame
 
-from usports.base.constants import BS4_PARSER, DEFAULT_SCHOOL_CONFERENCES, LEAGUE_CONFERENCE_OVERRIDES, TIMEOUT
+from usports.base.constants import (
+    BS4_PARSER,
+    DEFAULT_SCHOOL_CONFERENCES,
+    IDENTITY_COLUMNS,
+    LEAGUE_CONFERENCE_OVERRIDES,
+)
 from usports.base.exceptions import DataFetchError, ParsingError
 
 from .headers import get_random_header
+from .metrics import get_metrics, instrumented
+from .session import USportsSession, get_session
+from .tables import HTMLTable, extract_tables, resolve_parser
+
+
+async def _fetch_page_text(url: str, revalidate: bool = False) -> str:
+    """
+    Download a page through the shared pooled session and return its body.
+    Pages are served from the session's response cache when possible, and recorded to or
+    replayed from the session's fixtures when set.
+    With `revalidate`, fresh cache entries are revalidated with the server instead of served as is.
+    """
+    log = _page_log.get()
+    if log is not None and url in log.bodies:
+        return log.bodies[url]
+
+    session = get_session()
+    fixtures = session.fixtures
+
+    if fixtures is not None and fixtures.replay:
+        body = fixtures.load(url)
+        get_metrics().increment("usports_pages_total", source="fixture")
+    else:
+        body = await _download_page_text(session, url, revalidate)
+
+        if fixtures is not None:
+            fixtures.save(url, body)
+
+    if log is not None:
+        log.bodies[url] = body
+
+    return body
+
+
+async def _download_page_text(session: USportsSession, url: str, revalidate: bool = False) -> str:
+    cache = session.cache
+    headers = get_random_header()
+    metrics = get_metrics()
+
+    cached = cache.get(url) if cache is not None else None
+    if cache is not None:
+        if cached is not None and (cache.cache_only or (not revalidate and cached.is_fresh(cache.ttl))):
+            metrics.increment("usports_pages_total", source="cache")
+            return cached.body
+        if cache.cache_only:
+            raise DataFetchError(f"No cached response for {url} (cache-only mode)")
+        if cached is not None:
+            headers.update(cached.validators())
+
+    response = await session.get(url, headers=headers)
+
+    if cache is not None and cached is not None and response.status_code == 304:
+        cache.touch(url)
+        metrics.increment("usports_pages_total", source="revalidated")
+        return cached.body
+
+    response.raise_for_status()
+    metrics.increment("usports_pages_total", source="network")
+    metrics.increment("usports_response_bytes_total", len(response.content))
+
+    if cache is not None:
+        cache.set(url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+    return response.text
 
 
 async def fetch_page_html(url: str) -> list[str]:
     """
-    Fetch the HTML of all  tables from a page using HTTPX.
+    Fetch the HTML of all  tables from a page using the shared pooled session.
     Returns a list of cleaned HTML strings for each table.
     """
-    headers = get_random_header()
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, timeout=TIMEOUT)
-        response.raise_for_status()
+    from bs4 import BeautifulSoup  # pylint: disable=import-outside-toplevel
 
-    soup = BeautifulSoup(response.text, BS4_PARSER)
+    _log_page(url)
+    soup = BeautifulSoup(await _fetch_page_text(url), BS4_PARSER)
     tables = soup.find_all("table")
 
     if not tables:
@@ -32,6 +104,90 @@ async def fetch_page_html(url: str) -> list[str]:
     return [str(table).replace("\n", "").replace("\t", "") for table in tables]
 
 
+async def _fetch_and_extract(url: str, parser: str) -> list[HTMLTable]:
+    tables = extract_tables(await _fetch_page_text(url), parser)
+
+    if not tables:
+        raise DataFetchError(f"No <table> elements found at {url}")
+
+    return tables
+
+
+async def fetch_page_tables(url: str, parser: str | None = None) -> list[HTMLTable]:
+    """
+    Fetch all tables from a page, parsing the HTML exactly once.
+    Returns a list of HTMLTable objects ready for the sport table parsers.
+
+    Concurrent calls for the same URL share a single request and parse, so the returned
+    tables must be treated as read-only.
+    `parser` overrides the backend of the active session ('html.parser', 'lxml' or 'selectolax').
+    """
+    _log_page(url)
+    session = get_session()
+    backend = resolve_parser(parser or session.parser)
+    key = (url, backend)
+    fetch = functools.partial(_fetch_and_extract, url, backend)
+
+    pages = _shared_pages.get()
+    if pages is None:
+        return await session.single_flight(key, fetch)
+
+    future = pages.get(key)
+    if future is None:
+        future = pages[key] = asyncio.ensure_future(session.single_flight(key, fetch))
+    return await asyncio.shield(future)
+
+
+_shared_pages: ContextVar[dict[Hashable, asyncio.Future] | None] = ContextVar("usports_shared_pages", default=None)
+
+
+@contextmanager
+def shared_pages() -> Iterator[None]:
+    """
+    Fetch and parse each page at most once for the calls made inside the block,
+    even when they are not in flight at the same time (used by batch fetches).
+    Fetches still pending when the block exits (e.g. after a failure) are cancelled.
+    """
+    pages: dict[Hashable, asyncio.Future] = {}
+    token = _shared_pages.set(pages)
+    try:
+        yield
+    finally:
+        _shared_pages.reset(token)
+        for future in pages.values():
+            future.cancel()
+
+
+@dataclass(slots=True)
+class _PageLog:
+    bodies: dict[str, str]
+    urls: set[str] = field(default_factory=set)
+
+
+_page_log: ContextVar[_PageLog | None] = ContextVar("usports_page_log", default=None)
+
+
+def _log_page(url: str) -> None:
+    log = _page_log.get()
+    if log is not None:
+        log.urls.add(url)
+
+
+@contextmanager
+def recorded_pages(bodies: dict[str, str]) -> Iterator[set[str]]:
+    """
+    Serve the pages already in `bodies` (url -> body) without downloading them, and add to it
+    every page downloaded inside the block. Yields the set of URLs the block fetched, so a
+    watcher knows which pages a table depends on (`bodies` can be shared between blocks).
+    """
+    log = _PageLog(bodies)
+    token = _page_log.set(log)
+    try:
+        yield log.urls
+    finally:
+        _page_log.reset(token)
+
+
 def split_made_attempted(value: str) -> tuple[int, int]:
     """
     Split a string of the form 'made-attempted' into a tuple of two integers.
@@ -47,6 +203,46 @@ def split_made_attempted(value: str) -> tuple[int, int]:
         raise ParsingError(f"Error splitting made and attempted values from '{value}': {e}") from e
 
 
+def tables_for_columns(
+    columns: Iterable[str],
+    mappings: list[dict[str, type]],
+    base_columns: Iterable[str] = (),
+    derived: dict[str, str] | None = None,
+) -> list[int]:
+    """
+    Indices of the stat tables in `mappings` needed to build the requested `columns`.
+    `base_columns` (team or player name, games played, ...) come with every table, and `derived`
+    maps a column split off another one (e.g. 'field_goal_attempted') to the column it comes from.
+    Raises ValueError for columns no table provides.
+    """
+    base_columns = set(base_columns)
+    derived = derived or {}
+
+    indices: set[int] = set()
+    unknown = []
+    for column in columns:
+        if column in base_columns:
+            continue
+        source = derived.get(column, column)
+        carriers = [i for i, mapping in enumerate(mappings) if source in mapping]
+        if not carriers:
+            unknown.append(column)
+        indices.update(carriers)
+
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+    # Base columns alone still need one table to list the rows
+    return sorted(indices) or [0]
+
+
+def select_columns(df: DataFrame, columns: Iterable[str]) -> DataFrame:
+    """Keep the identity columns (team, player, school) and the requested `columns` present in `df`."""
+    selected = [column for column in IDENTITY_COLUMNS if column in df]
+    selected += [column for column in columns if column in df and column not in selected]
+    return df[selected]
+
+
 def clean_text(text: str) -> str:
     """Remove non-ASCII characters and extra spaces from text."""
     # Normalize Unicode characters to a standard form
@@ -62,16 +258,36 @@ def clean_text(text: str) -> str:
     return cleaned_text.strip()
 
 
-def convert_types(df: DataFrame, type_mapping: dict[str, type]) -> DataFrame:
-    """Convert DataFrame columns to specified types, handling missing values correctly."""
-    for column, dtype in type_mapping.items():
-        if column in df.columns:
-            if dtype in [int, float]:
-                df[column] = df[column].astype(str).replace(["-", "nan", ""], "0")
+@instrumented("convert_types")
+def convert_types(df: DataFrame, type_mapping: dict[str, type], na_value: float | None = 0) -> DataFrame:
+    """
+    Convert DataFrame columns to specified types, handling missing values correctly.
+
+    All numeric columns are parsed together in one vectorized pass over the raw cell matrix.
+    Placeholders ('-', empty, 'nan') and unparsable cells become `na_value`; pass None to keep
+    them missing instead (NaN for floats, nullable Int64 for integers).
+    """
+    numeric_columns = [column for column, dtype in type_mapping.items() if dtype in (int, float) and column in df]
+
+    if numeric_columns:
+        # Column-major so each column is a contiguous slice of the parsed block
+        cells = df[numeric_columns].to_numpy(dtype=object).ravel(order="F")
+        parsed = pd.to_numeric(pd.Series(cells, dtype=object), errors="coerce").to_numpy(dtype=np.float64)
+        parsed = parsed.reshape(len(numeric_columns), len(df))
 
-                # Convert to numeric type, forcing errors to NaN before casting
-                df[column] = pd.to_numeric(df[column], errors="coerce").fillna(0)
+        if na_value is not None:
+            parsed[np.isnan(parsed)] = na_value
 
+        for column, values in zip(numeric_columns, parsed):
+            if type_mapping[column] is float:
+                df[column] = values
+            elif na_value is not None:
+                df[column] = values.astype(int)
+            else:
+                df[column] = pd.array(np.trunc(values), dtype="Int64")
+
+    for column, dtype in type_mapping.items():
+        if column in df and dtype not in (int, float):
             df[column] = df[column].astype(dtype)
 
     return df
@@ -100,6 +316,7 @@ def validate_season_option(season_option: str, available_options: dict) -> str:
     return available_options[season_option_lower]
 
 
+@instrumented("merge")
 def _merge_team_data(existing_data: list[dict[str, Any]], new_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Merge existing and new team data stats"""
 
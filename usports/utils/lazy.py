@@ -0,0 +1,35 @@
+"""Lazy package exports, so importing a package does not import pandas, httpx or bs4 up front."""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: dict[str, list[str]], submodules: tuple[str, ...] = ()
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build a package's module-level ``__getattr__`` and ``__dir__`` (PEP 562).
+
+    `exports` maps a relative submodule (e.g. '.player_stats') to the names it provides; each
+    submodule is imported on first access to one of its names, and the value is cached on the package.
+    `submodules` are subpackages also reachable as attributes (e.g. usports.basketball).
+    """
+    origins = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        if name in submodules:
+            value: Any = importlib.import_module(f".{name}", package)
+        elif name in origins:
+            value = getattr(importlib.import_module(origins[name], package), name)
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(origins) | set(submodules))
+
+    return __getattr__, __dir__
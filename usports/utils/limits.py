@@ -0,0 +1,103 @@
+"""Concurrency and rate limits applied to every page request."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from usports.base.constants import DEFAULT_MAX_CONCURRENCY
+
+
+@dataclass(frozen=True, slots=True)
+class RequestLimits:
+    """
+    Limits for page requests.
+
+    Args:
+        max_concurrency: Maximum number of requests in flight at once (None for no bound).
+        rate_limit: Maximum requests per second to each host (None for no limit).
+        burst: Number of requests a host may receive back-to-back before rate limiting applies.
+    """
+
+    max_concurrency: int | None = DEFAULT_MAX_CONCURRENCY
+    rate_limit: float | None = None
+    burst: int = 1
+
+
+class TokenBucket:
+    """Token-bucket rate limiter: `rate` tokens per second, holding at most `capacity`."""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class Limiter:
+    """Event-loop-bound semaphore plus per-host token buckets enforcing a RequestLimits."""
+
+    def __init__(self, limits: RequestLimits):
+        self.limits = limits
+        self._semaphore = asyncio.Semaphore(limits.max_concurrency) if limits.max_concurrency else None
+        self._buckets: dict[str, TokenBucket] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        """Hold a concurrency slot (and a rate-limit token for `host`) for one request."""
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+
+        try:
+            if self.limits.rate_limit:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    bucket = self._buckets[host] = TokenBucket(self.limits.rate_limit, self.limits.burst)
+                await bucket.acquire()
+
+            yield
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+
+_limits_override: ContextVar[RequestLimits | None] = ContextVar("usports_request_limits", default=None)
+
+
+def get_limits_override() -> RequestLimits | None:
+    return _limits_override.get()
+
+
+@contextmanager
+def request_limits(
+    max_concurrency: int | None = DEFAULT_MAX_CONCURRENCY, rate_limit: float | None = None, burst: int = 1
+) -> Iterator[RequestLimits]:
+    """
+    Override the session's request limits for the calls made inside the block.
+
+    >>> with request_limits(max_concurrency=4, rate_limit=2.0):
+    ...     df = usports_bball_players("m")
+    """
+    limits = RequestLimits(max_concurrency=max_concurrency, rate_limit=rate_limit, burst=burst)
+    token = _limits_override.set(limits)
+    try:
+        yield limits
+    finally:
+        _limits_override.reset(token)
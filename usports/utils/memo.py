@@ -0,0 +1,177 @@
+"""Opt-in in-memory cache for the DataFrames returned by the public functions."""
+
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, ParamSpec
+
+import pandas as pd
+
+P = ParamSpec("P")
+
+
+class ResultCache:
+    """
+    LRU cache of assembled DataFrames keyed by function and arguments.
+
+    Entries are evicted least-recently-used first once `max_entries` or `max_bytes` is
+    exceeded, and expire after `ttl` seconds (never when None). Hits return a copy of the
+    cached frame: a free shallow copy when pandas copy-on-write is enabled
+    (``pd.set_option("mode.copy_on_write", True)``), otherwise a deep copy, so callers can
+    never mutate the cached frame.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int = 256 * 1024 * 1024, ttl: float | None = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._entries: OrderedDict[Hashable, tuple[pd.DataFrame, int, float]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _copy(df: pd.DataFrame) -> pd.DataFrame:
+        return df.copy(deep=not pd.options.mode.copy_on_write)
+
+    def get(self, key: Hashable) -> pd.DataFrame | None:
+        """Return a copy of the cached frame for `key`, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            df, size, stored_at = entry
+            if self.ttl is not None and time.monotonic() - stored_at >= self.ttl:
+                del self._entries[key]
+                self._bytes -= size
+                return None
+
+            self._entries.move_to_end(key)
+
+        return self._copy(df)
+
+    def set(self, key: Hashable, df: pd.DataFrame) -> None:
+        """Store a private copy of `df` under `key`, evicting old entries as needed."""
+        size = int(df.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return
+
+        df = self._copy(df)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+            self._entries[key] = (df, size, time.monotonic())
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Total memory held by cached frames."""
+        return self._bytes
+
+
+_result_cache: ResultCache | None = None
+
+
+def enable_result_cache(
+    max_entries: int = 128, max_bytes: int = 256 * 1024 * 1024, ttl: float | None = None
+) -> ResultCache:
+    """Turn on memoization of the public ``usports_*`` functions and return the cache."""
+    global _result_cache  # pylint: disable=global-statement
+    _result_cache = ResultCache(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl)
+    return _result_cache
+
+
+def disable_result_cache() -> None:
+    """Turn off memoization and drop every cached frame."""
+    global _result_cache  # pylint: disable=global-statement
+    _result_cache = None
+
+
+def get_result_cache() -> ResultCache | None:
+    return _result_cache
+
+
+_fresh_results: ContextVar[bool] = ContextVar("usports_fresh_results", default=False)
+
+
+@contextmanager
+def fresh_results() -> Iterator[None]:
+    """Recompute the frames requested inside the block instead of serving them from the result cache."""
+    token = _fresh_results.set(True)
+    try:
+        yield
+    finally:
+        _fresh_results.reset(token)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Make list/dict arguments usable in a cache key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def memoize_frame(func: Callable[P, Any]) -> Callable[P, Any]:
+    """Serve a public function's DataFrame from the result cache when it is enabled (sync or async)."""
+    signature = inspect.signature(func)
+
+    def make_key(*args: Any, **kwargs: Any) -> Hashable:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return (func.__module__, func.__qualname__, _freeze(bound.arguments))
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> pd.DataFrame:
+            cache = _result_cache
+            if cache is None:
+                return await func(*args, **kwargs)
+
+            key = make_key(*args, **kwargs)
+            df = None if _fresh_results.get() else cache.get(key)
+            if df is None:
+                df = await func(*args, **kwargs)
+                cache.set(key, df)
+            return df
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> pd.DataFrame:
+        cache = _result_cache
+        if cache is None:
+            return func(*args, **kwargs)
+
+        key = make_key(*args, **kwargs)
+        df = None if _fresh_results.get() else cache.get(key)
+        if df is None:
+            df = func(*args, **kwargs)
+            cache.set(key, df)
+        return df
+
+    return wrapper
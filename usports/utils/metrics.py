@@ -0,0 +1,134 @@
+"""Pluggable instrumentation for the fetch, parse, merge and convert stages.
+
+The active Metrics object receives request latency, bytes, cache hits, retries, rows parsed and
+seconds per stage. The default is a no-op whose `enabled` flag short-circuits every hook.
+Install a MetricsRecorder to collect them in memory and export the Prometheus text format, or
+subclass Metrics (with ``enabled = True``) to forward them to another backend.
+"""
+
+import functools
+import threading
+import time
+from collections.abc import Callable, Sized
+from typing import ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+LabelSet = tuple[tuple[str, str], ...]
+
+
+class Metrics:
+    """No-op metrics sink; subclasses override the hooks and set ``enabled = True``."""
+
+    enabled = False
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """Add `value` to the counter `name`."""
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record one observation (e.g. seconds) of the summary `name`."""
+
+
+class MetricsRecorder(Metrics):
+    """Thread-safe in-memory counters and summaries, exportable in the Prometheus text format."""
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.counters: dict[str, dict[LabelSet, float]] = {}
+        self.summaries: dict[str, dict[LabelSet, list[float]]] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            count_sum = self.summaries.setdefault(name, {}).setdefault(key, [0, 0.0])
+            count_sum[0] += 1
+            count_sum[1] += value
+
+    def clear(self) -> None:
+        with self._lock:
+            self.counters.clear()
+            self.summaries.clear()
+
+    def to_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self.counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                lines.extend(f"{name}{_format_labels(key)} {_format_value(value)}" for key, value in series.items())
+
+            for name, series in sorted(self.summaries.items()):
+                lines.append(f"# TYPE {name} summary")
+                for key, (count, total) in series.items():
+                    lines.append(f"{name}_count{_format_labels(key)} {_format_value(count)}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {_format_value(total)}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _format_labels(labels: LabelSet) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+_metrics: Metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    return _metrics
+
+
+def set_metrics(metrics: Metrics | None) -> Metrics:
+    """Install the metrics sink used by every stage (None restores the no-op default)."""
+    global _metrics  # pylint: disable=global-statement
+    _metrics = metrics if metrics is not None else Metrics()
+    return _metrics
+
+
+def instrumented(stage: str) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Report the seconds spent in a stage function, and the rows it returned, to the active metrics.
+    Labels are the stage, the sport (from the module path) and the function name.
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        parts = func.__module__.split(".")
+        sport = parts[1] if len(parts) > 2 and parts[1] != "utils" else ""
+        labels = {"stage": stage, "sport": sport, "function": func.__name__}
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            metrics = _metrics
+            if not metrics.enabled:
+                return func(*args, **kwargs)
+
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            metrics.observe("usports_stage_seconds", time.perf_counter() - start, **labels)
+
+            if isinstance(result, Sized):
+                metrics.increment("usports_stage_rows_total", len(result), **labels)
+
+            return result
+
+        return wrapper
+
+    return decorator
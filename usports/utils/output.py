@@ -0,0 +1,160 @@
+"""Opt-in output options for the DataFrames returned by the public functions."""
+
+import dataclasses
+import functools
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Literal, ParamSpec, TypeAlias
+
+import numpy as np
+import pandas as pd
+
+from usports.base.constants import CATEGORY_COLUMNS
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+P = ParamSpec("P")
+
+DtypeBackend: TypeAlias = Literal["numpy", "pyarrow"]
+DTYPE_BACKENDS = ("numpy", "pyarrow")
+
+FrameLike: TypeAlias = "pd.DataFrame | pa.Table"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class OutputOptions:
+    """
+    How returned frames are typed.
+
+    compact: category for repeated strings (school, conference, team_name, role, position),
+    the smallest integer dtype that fits each integer column, and float32 where it is safe.
+    dtype_backend: 'pyarrow' returns pandas frames backed by pyarrow arrays (ArrowDtype).
+    arrow_table: return a pyarrow.Table instead of a DataFrame.
+    """
+
+    compact: bool = False
+    dtype_backend: DtypeBackend = "numpy"
+    arrow_table: bool = False
+
+    def __post_init__(self) -> None:
+        if self.dtype_backend not in DTYPE_BACKENDS:
+            raise ValueError(f"Invalid dtype_backend: {self.dtype_backend}. Must be one of {', '.join(DTYPE_BACKENDS)}")
+
+
+_output_options = OutputOptions()
+_output_override: ContextVar[OutputOptions | None] = ContextVar("usports_output_options", default=None)
+
+
+def get_output_options() -> OutputOptions:
+    return _output_override.get() or _output_options
+
+
+def set_output_options(
+    compact: bool = False, dtype_backend: DtypeBackend = "numpy", arrow_table: bool = False
+) -> OutputOptions:
+    """Set the output options used by every public function."""
+    global _output_options  # pylint: disable=global-statement
+    _output_options = OutputOptions(compact=compact, dtype_backend=dtype_backend, arrow_table=arrow_table)
+    return _output_options
+
+
+@contextmanager
+def output_options(
+    compact: bool = False, dtype_backend: DtypeBackend = "numpy", arrow_table: bool = False
+) -> Iterator[OutputOptions]:
+    """
+    Override the output options for the calls made inside the block.
+
+    >>> with output_options(compact=True, dtype_backend="pyarrow"):
+    ...     df = usports_bball_players("m")
+    """
+    options = OutputOptions(compact=compact, dtype_backend=dtype_backend, arrow_table=arrow_table)
+    token = _output_override.set(options)
+    try:
+        yield options
+    finally:
+        _output_override.reset(token)
+
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a copy of `df` with compact dtypes: category for the repeated string columns,
+    the smallest signed integer dtype that fits, and float32 when no value moves by more
+    than one part per million (stats are published with at most 3 decimals).
+    """
+    df = df.copy(deep=False)
+
+    for i, (column, series) in enumerate(df.items()):
+        if column in CATEGORY_COLUMNS and pd.api.types.is_string_dtype(series.dtype):
+            df.isetitem(i, series.astype("category"))
+        elif series.dtype.kind in "iu":
+            df.isetitem(i, pd.to_numeric(series, downcast="integer"))
+        elif series.dtype == np.float64 and _fits_float32(series.to_numpy()):
+            df.isetitem(i, series.astype(np.float32))
+
+    return df
+
+
+def _fits_float32(values: np.ndarray) -> bool:
+    with np.errstate(over="ignore"):
+        narrowed = values.astype(np.float32)
+    return bool(np.allclose(narrowed, values, rtol=1e-6, atol=0, equal_nan=True))
+
+
+# -------------------------------------------------------------------
+# Arrow output
+# -------------------------------------------------------------------
+def _arrow_columns(df: pd.DataFrame) -> list["pa.Array"]:
+    """
+    Convert each column straight to an Arrow array: numeric columns without nulls are wrapped
+    without copying, categories become dictionary arrays and object strings are encoded once.
+    """
+    try:
+        import pyarrow as pa  # pylint: disable=import-outside-toplevel
+    except ImportError as e:
+        raise ImportError("Arrow output requires pyarrow: pip install pyarrow") from e
+
+    return [pa.array(series, from_pandas=True) for _, series in df.items()]
+
+
+def to_arrow_table(df: pd.DataFrame) -> "pa.Table":
+    """Build a pyarrow.Table from `df` column by column (the index is dropped)."""
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+    arrays = _arrow_columns(df)
+    return pa.Table.from_arrays(arrays, names=[str(column) for column in df.columns])
+
+
+def arrow_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return `df` with every column backed by a pyarrow array (pandas ArrowDtype)."""
+    arrays = _arrow_columns(df)
+    frame = pd.DataFrame(
+        {i: pd.arrays.ArrowExtensionArray(array) for i, array in enumerate(arrays)},  # type: ignore[attr-defined]
+        index=df.index,
+    )
+    frame.columns = df.columns
+    return frame
+
+
+def apply_output_options(df: pd.DataFrame, options: OutputOptions | None = None) -> FrameLike:
+    """Convert a freshly assembled frame according to the active (or given) output options."""
+    options = options or get_output_options()
+    if options.compact:
+        df = compact_frame(df)
+    if options.arrow_table:
+        return to_arrow_table(df)
+    if options.dtype_backend == "pyarrow":
+        df = arrow_frame(df)
+    return df
+
+
+def shaped_output(func: Callable[P, Awaitable[pd.DataFrame]]) -> Callable[P, Awaitable[FrameLike]]:
+    """Apply the active output options to the frame returned by a public async function."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> FrameLike:
+        return apply_output_options(await func(*args, **kwargs))
+
+    return wrapper
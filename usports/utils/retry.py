@@ -0,0 +1,64 @@
+"""Retry policy for transient page fetch failures."""
+
+import random
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from usports.base.constants import DEFAULT_MAX_BACKOFF, DEFAULT_RETRY_ATTEMPTS, DEFAULT_RETRY_BACKOFF, RETRY_STATUSES
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for transient failures.
+
+    Args:
+        max_attempts: Total attempts per request, including the first one (1 disables retries).
+        backoff: Base delay in seconds; attempt n waits up to backoff * 2**(n-1).
+        max_backoff: Upper bound on the computed backoff delay.
+        jitter: Randomize each delay between 0 and the backoff (full jitter).
+        retry_statuses: HTTP status codes worth retrying.
+        max_retry_after: Longest Retry-After header (seconds) that is honoured.
+    """
+
+    max_attempts: int = DEFAULT_RETRY_ATTEMPTS
+    backoff: float = DEFAULT_RETRY_BACKOFF
+    max_backoff: float = DEFAULT_MAX_BACKOFF
+    jitter: bool = True
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    max_retry_after: float = 60.0
+
+    def should_retry(self, attempt: int, response: httpx.Response | None = None) -> bool:
+        """Whether another attempt is allowed after `attempt` (1-based) failed or returned `response`."""
+        if attempt >= self.max_attempts:
+            return False
+        return response is None or response.status_code in self.retry_statuses
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Seconds to wait before the attempt following `attempt`."""
+        retry_after = _parse_retry_after(response) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+
+        delay = min(self.backoff * 2 ** (attempt - 1), self.max_backoff)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+def _parse_retry_after(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
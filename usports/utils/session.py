@@ -0,0 +1,323 @@
+"""Shared HTTP session used by every sport module."""
+
+import asyncio
+import atexit
+import importlib.util
+import logging
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable, Hashable
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any, Coroutine, TypeVar
+
+import httpx
+
+from usports.base.constants import (
+    CACHE_PATH_ENV_VAR,
+    CACHE_TTL_ENV_VAR,
+    DEFAULT_CACHE_TTL,
+    FIXTURE_REPLAY,
+    FIXTURES_DIR_ENV_VAR,
+    FIXTURES_MODE_ENV_VAR,
+    TIMEOUT,
+)
+
+from .cache import ResponseCache
+from .fixtures import FixtureStore
+from .limits import Limiter, RequestLimits, get_limits_override
+from .metrics import get_metrics
+from .retry import RetryPolicy
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _LoopState:
+    """Per-event-loop resources: the pooled client, the limiters and the in-flight fetches bound to that loop."""
+
+    client: httpx.AsyncClient
+    limiters: dict[RequestLimits, Limiter] = field(default_factory=dict)
+    inflight: dict[Hashable, asyncio.Future] = field(default_factory=dict)
+    waiters: dict[Hashable, int] = field(default_factory=dict)
+
+    def limiter(self, limits: RequestLimits) -> Limiter:
+        limiter = self.limiters.get(limits)
+        if limiter is None:
+            limiter = self.limiters[limits] = Limiter(limits)
+        return limiter
+
+
+class USportsSession:
+    """
+    Pooled HTTP client shared by all sport modules.
+
+    One ``httpx.AsyncClient`` is kept per event loop, so every page fetched through the
+    session reuses keep-alive connections instead of paying a fresh TCP+TLS handshake per URL.
+    The synchronous ``usports_*`` functions run on a background event loop owned by the
+    session, so the pool survives from one call to the next.
+
+    Without an explicit session, a process-wide default one is used (with an on-disk response
+    cache when USPORTS_CACHE_PATH is set). Use a session as a context manager to scope the pool
+    (and its settings) to a block of calls:
+
+    >>> with USportsSession(max_connections=20, http2=True, parser="lxml"):
+    ...     men = usports_bball_players("m")
+    ...     women = usports_bball_players("w")
+
+    Requests are bounded by `request_limits`: a global concurrency cap plus an optional
+    per-host token-bucket rate limit. Use ``request_limits(...)`` to override them for a block.
+    Transient failures (timeouts, connection errors, 429/5xx) are retried following `retry`.
+    Pass a FixtureStore as `fixtures` to record every fetched page, or to replay recorded pages offline.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        timeout: float = TIMEOUT,
+        transport: httpx.AsyncBaseTransport | None = None,
+        parser: str | None = None,
+        cache: ResponseCache | None = None,
+        request_limits: RequestLimits | None = None,
+        retry: RetryPolicy | None = None,
+        fixtures: FixtureStore | None = None,
+    ):
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.debug("HTTP/2 requested but the 'h2' package is not installed, falling back to HTTP/1.1")
+            http2 = False
+
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.timeout = timeout
+        self.transport = transport
+        self.parser = parser
+        self.cache = cache
+        self.request_limits = request_limits or RequestLimits()
+        self.retry = retry or RetryPolicy()
+        self.fixtures = fixtures
+
+        self._states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState] = weakref.WeakKeyDictionary()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._tokens: list[Token] = []
+
+    # -------------------------------------------------------------------
+    # HTTP
+    # -------------------------------------------------------------------
+    def _get_state(self) -> _LoopState:
+        """Return the resources bound to the running event loop, creating them on first use."""
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+
+        if state is None or state.client.is_closed:
+            client = httpx.AsyncClient(
+                limits=self.limits, http2=self.http2, timeout=self.timeout, transport=self.transport
+            )
+            state = self._states[loop] = _LoopState(client)
+
+        return state
+
+    def _get_client(self) -> httpx.AsyncClient:
+        return self._get_state().client
+
+    async def get(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        """
+        Send a GET request through the pooled client, within the active request limits.
+        Transient failures are retried with backoff; the last response or error is returned/raised.
+        """
+        state = self._get_state()
+        limiter = state.limiter(get_limits_override() or self.request_limits)
+        host = httpx.URL(url).host
+        metrics = get_metrics()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            if attempt > 1:
+                metrics.increment("usports_retries_total", host=host)
+            try:
+                async with limiter.slot(host):
+                    start = time.perf_counter()
+                    response = await state.client.get(url, headers=headers)
+                    metrics.observe(
+                        "usports_request_seconds", time.perf_counter() - start, host=host, status=str(response.status_code)
+                    )
+            except httpx.TransportError as e:
+                metrics.increment("usports_request_errors_total", host=host, error=type(e).__name__)
+                if not self.retry.should_retry(attempt):
+                    raise
+                delay = self.retry.delay(attempt)
+                logger.debug(f"Retrying {url} in {delay:.2f}s after {e!r} (attempt {attempt})")
+            else:
+                if response.is_success or not self.retry.should_retry(attempt, response):
+                    return response
+                delay = self.retry.delay(attempt, response)
+                logger.debug(f"Retrying {url} in {delay:.2f}s after HTTP {response.status_code} (attempt {attempt})")
+
+            await asyncio.sleep(delay)
+
+    async def single_flight(self, key: Hashable, factory: Callable[[], Coroutine[Any, Any, T]]) -> T:
+        """
+        Await `factory()`, sharing one in-flight task among concurrent callers with the same `key`.
+        A caller being cancelled does not cancel the shared task for the others, but the last one
+        to give up does, so an abandoned request is not left running.
+        """
+        state = self._get_state()
+        inflight, waiters = state.inflight, state.waiters
+        future = inflight.get(key)
+
+        if future is None:
+            future = inflight[key] = asyncio.ensure_future(factory())
+            future.add_done_callback(lambda _: inflight.pop(key, None))
+
+        waiters[key] = waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if waiters[key] == 1:
+                future.cancel()
+            raise
+        finally:
+            waiters[key] -= 1
+            if not waiters[key]:
+                del waiters[key]
+
+    # -------------------------------------------------------------------
+    # Event loop
+    # -------------------------------------------------------------------
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="usports-session", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+
+            return self._loop
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the session's event loop and block until it finishes."""
+        loop = self._ensure_loop()
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            coro.close()
+            raise RuntimeError("USportsSession.run() cannot be called from inside its own event loop")
+
+        async def _bound() -> T:
+            _active_session.set(self)
+            return await coro
+
+        return asyncio.run_coroutine_threadsafe(_bound(), loop).result()
+
+    # -------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------
+    async def aclose(self) -> None:
+        """Close the client bound to the running event loop."""
+        state = self._states.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state.client.aclose()
+
+    def close(self) -> None:
+        """Close the background event loop, its pooled connections and the response cache."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            if thread is not None:
+                thread.join()
+            loop.close()
+
+        if self.cache is not None:
+            self.cache.close()
+
+    def __enter__(self) -> "USportsSession":
+        self._tokens.append(_active_session.set(self))
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _active_session.reset(self._tokens.pop())
+        self.close()
+
+    async def __aenter__(self) -> "USportsSession":
+        self._tokens.append(_active_session.set(self))
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        _active_session.reset(self._tokens.pop())
+        await self.aclose()
+        # Same teardown as __exit__; joining the background loop's thread must not block this loop
+        await asyncio.to_thread(self.close)
+
+
+_active_session: ContextVar[USportsSession | None] = ContextVar("usports_session", default=None)
+_default_session: USportsSession | None = None
+_default_lock = threading.Lock()
+
+
+def _session_from_env() -> USportsSession:
+    """Build the default session, enabling the response cache and fixtures from the environment."""
+    cache = None
+    cache_path = os.getenv(CACHE_PATH_ENV_VAR)
+    if cache_path:
+        cache = ResponseCache(cache_path, ttl=float(os.getenv(CACHE_TTL_ENV_VAR, str(DEFAULT_CACHE_TTL))))
+
+    fixtures = None
+    fixtures_dir = os.getenv(FIXTURES_DIR_ENV_VAR)
+    if fixtures_dir:
+        fixtures = FixtureStore(fixtures_dir, os.getenv(FIXTURES_MODE_ENV_VAR, FIXTURE_REPLAY))  # type: ignore
+
+    return USportsSession(cache=cache, fixtures=fixtures)
+
+
+def get_session() -> USportsSession:
+    """Return the active session, falling back to the process-wide default one."""
+    global _default_session  # pylint: disable=global-statement
+
+    session = _active_session.get()
+    if session is not None:
+        return session
+
+    with _default_lock:
+        if _default_session is None:
+            _default_session = _session_from_env()
+            atexit.register(_default_session.close)
+
+        return _default_session
+
+
+def set_default_session(session: USportsSession) -> None:
+    """Replace the process-wide default session, closing the previous one."""
+    global _default_session  # pylint: disable=global-statement
+
+    with _default_lock:
+        previous, _default_session = _default_session, session
+        atexit.register(session.close)
+
+    if previous is not None and previous is not session:
+        previous.close()
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion on the active session's event loop."""
+    return get_session().run(coro)
@@ -0,0 +1,186 @@
+"""Local snapshot store for detecting changed rows between refreshes."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pandas as pd
+
+from usports.base.constants import DEFAULT_SNAPSHOT_PATH, IDENTITY_COLUMNS, resolve_season
+
+# Separates the identity values inside a stored row key
+_KEY_SEPARATOR = "\x1f"
+
+
+@dataclass(slots=True)
+class SnapshotDiff:
+    """What changed in a table since its previous snapshot."""
+
+    snapshot_id: int
+    changed: pd.DataFrame
+    removed: list[str] = field(default_factory=list)
+    first: bool = False
+
+    @property
+    def unchanged(self) -> bool:
+        """Whether the table is identical to the previous snapshot."""
+        return not self.first and self.changed.empty and not self.removed
+
+
+def frame_hash(df: pd.DataFrame) -> str:
+    """Content hash of a whole DataFrame (columns and values, not the index)."""
+    digest = hashlib.sha256("\x1e".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def row_keys(df: pd.DataFrame, key: Iterable[str] | None = None) -> list[str]:
+    """
+    Identity of each row: the `key` columns, by default the IDENTITY_COLUMNS present in the
+    frame. Repeated identities are told apart by their occurrence, so every key is unique.
+    """
+    columns = [column for column in (IDENTITY_COLUMNS if key is None else key) if column in df]
+    if not columns:
+        return [str(position) for position in range(len(df))]
+
+    keys = df[columns].astype(str).agg(_KEY_SEPARATOR.join, axis=1)
+    occurrence = keys.groupby(keys).cumcount()
+    return [k if n == 0 else f"{k}{_KEY_SEPARATOR}#{n}" for k, n in zip(keys, occurrence)]
+
+
+class SnapshotStore:
+    """
+    SQLite-backed record of fetched tables keyed by (sport, league, season, kind).
+
+    Each `record` stores a content hash of the whole table and of every row, and returns the
+    rows that are new or changed since the previous snapshot of the same table, plus the keys of
+    rows that disappeared. An identical table is detected from its hash alone, so polling jobs
+    can skip downstream work when nothing changed.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_SNAPSHOT_PATH):
+        self.path = Path(path).expanduser()
+
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sport TEXT NOT NULL,
+                    league TEXT NOT NULL,
+                    season TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    taken_at REAL NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    row_count INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS snapshots_table ON snapshots (sport, league, season, kind, id);
+                CREATE TABLE IF NOT EXISTS snapshot_rows (
+                    sport TEXT NOT NULL,
+                    league TEXT NOT NULL,
+                    season TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    row_key TEXT NOT NULL,
+                    row_hash TEXT NOT NULL,
+                    snapshot_id INTEGER NOT NULL,
+                    PRIMARY KEY (sport, league, season, kind, row_key)
+                );
+                """
+            )
+        return self._conn
+
+    @staticmethod
+    def _table(sport: str, league: str | None, kind: str, season: str | None) -> tuple[str, str, str, str]:
+        # Football has no league; NULL would not compare equal inside the keys
+        return sport, league or "", resolve_season(sport, season), kind
+
+    def record(
+        self,
+        df: pd.DataFrame,
+        sport: str,
+        league: str | None,
+        kind: str,
+        season: str | None = None,
+        key: Iterable[str] | None = None,
+    ) -> SnapshotDiff:
+        """
+        Record a freshly fetched table and return what changed since its last snapshot.
+        `season` defaults to the sport's current season; `key` overrides the identity columns.
+        """
+        table = self._table(sport, league, kind, season)
+        content_hash = frame_hash(df)
+        keys = row_keys(df, key)
+        hashes = [f"{value:016x}" for value in pd.util.hash_pandas_object(df, index=False)]
+
+        with self._lock, self._connect() as conn:
+            previous = conn.execute(
+                "SELECT content_hash FROM snapshots WHERE sport = ? AND league = ? AND season = ? AND kind = ? "
+                "ORDER BY id DESC LIMIT 1",
+                table,
+            ).fetchone()
+            snapshot_id = conn.execute(
+                "INSERT INTO snapshots (sport, league, season, kind, taken_at, content_hash, row_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*table, time.time(), content_hash, len(df)),
+            ).lastrowid
+
+            if previous is not None and previous[0] == content_hash:
+                return SnapshotDiff(snapshot_id, df.iloc[0:0])  # type: ignore
+
+            stored = dict(
+                conn.execute(
+                    "SELECT row_key, row_hash FROM snapshot_rows WHERE sport = ? AND league = ? AND season = ? "
+                    "AND kind = ?",
+                    table,
+                ).fetchall()
+            )
+            changed = [position for position, (k, h) in enumerate(zip(keys, hashes)) if stored.get(k) != h]
+            removed = sorted(stored.keys() - set(keys))
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO snapshot_rows (sport, league, season, kind, row_key, row_hash, snapshot_id) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(*table, keys[position], hashes[position], snapshot_id) for position in changed],
+            )
+            conn.executemany(
+                "DELETE FROM snapshot_rows WHERE sport = ? AND league = ? AND season = ? AND kind = ? AND row_key = ?",
+                [(*table, row_key) for row_key in removed],
+            )
+
+        return SnapshotDiff(snapshot_id, df.iloc[changed], removed, first=previous is None)  # type: ignore
+
+    def last_hash(self, sport: str, league: str | None, kind: str, season: str | None = None) -> str | None:
+        """Content hash of the latest snapshot of a table, or None if it was never recorded."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT content_hash FROM snapshots WHERE sport = ? AND league = ? AND season = ? AND kind = ? "
+                    "ORDER BY id DESC LIMIT 1",
+                    self._table(sport, league, kind, season),
+                )
+                .fetchone()
+            )
+        return None if row is None else row[0]
+
+    def clear(self) -> None:
+        """Remove every snapshot."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM snapshots")
+            conn.execute("DELETE FROM snapshot_rows")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
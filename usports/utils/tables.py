@@ -0,0 +1,181 @@
+"""Lightweight table abstraction built from a single parse of a stats page.
+
+Three parser backends produce identical tables:
+- html.parser: BeautifulSoup with the pure-Python parser (always available).
+- lxml: lxml.html, a C parser (``pip install lxml``).
+- selectolax: selectolax's Lexbor engine, the fastest option (``pip install selectolax``).
+
+The backend is picked per call, by the active session, or with the USPORTS_PARSER
+environment variable, and falls back to html.parser when the dependency is missing.
+"""
+
+import importlib.util
+import logging
+import os
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from usports.base.constants import BS4_PARSER, LXML_PARSER, PARSER_ENV_VAR, SELECTOLAX_PARSER
+
+from .metrics import instrumented
+
+if TYPE_CHECKING:
+    from bs4 import Tag
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class TableRow:
+    """A single <tr>: the raw text of each <td> and the standings team name, if any."""
+
+    cells: list[str] = field(default_factory=list)
+    team_name: str | None = None
+
+
+@dataclass(slots=True)
+class HTMLTable:
+    """A parsed <table>, one entry per <tr> (header rows included, with no cells)."""
+
+    rows: list[TableRow] = field(default_factory=list)
+
+
+# Layout whitespace removed from cell text. Carriage returns are included because html.parser keeps
+# them while lxml and selectolax normalize them to newlines, as HTML5 parsers do.
+_LAYOUT_WHITESPACE = str.maketrans("", "", "\n\r\t\f\v")
+
+# Elements whose text is never cell content; html.parser's get_text skips them, the others do not
+_NON_CONTENT_TAGS = ("script", "style")
+
+
+def _strip_layout(text: str) -> str:
+    """Remove layout newlines, carriage returns and tabs from cell text."""
+    return text.translate(_LAYOUT_WHITESPACE)
+
+
+# -------------------------------------------------------------------
+# html.parser (BeautifulSoup)
+# -------------------------------------------------------------------
+def _bs4_row(row: "Tag") -> TableRow:
+    team_name = None
+    team_name_th = row.find("th", class_="team-name")
+    if team_name_th:
+        team_name_tag = team_name_th.find("a")  # type: ignore
+        if team_name_tag:
+            team_name = _strip_layout(team_name_tag.get_text())  # type: ignore
+
+    return TableRow(cells=[_strip_layout(col.get_text()) for col in row.find_all("td")], team_name=team_name)
+
+
+def _close_implicit_cells(soup: "Tag") -> None:
+    """
+    html.parser nests a cell or row that starts before the previous one is closed inside it.
+    Move each one out to where an HTML5 parser (lxml, selectolax) implicitly closes its parent.
+    """
+    for tag in soup.find_all(["tr", "td", "th"]):
+        while tag.parent is not None and (
+            tag.parent.name in ("td", "th") or (tag.name == "tr" and tag.parent.name == "tr")
+        ):
+            tag.parent.insert_after(tag.extract())
+
+
+def _extract_with_bs4(html: str) -> list[HTMLTable]:
+    from bs4 import BeautifulSoup  # pylint: disable=import-outside-toplevel
+
+    soup = BeautifulSoup(html, BS4_PARSER)
+    for tag in soup.find_all(_NON_CONTENT_TAGS):
+        tag.decompose()
+    _close_implicit_cells(soup)
+
+    return [HTMLTable(rows=[_bs4_row(row) for row in table.find_all("tr")]) for table in soup.find_all("table")]
+
+
+# -------------------------------------------------------------------
+# lxml
+# -------------------------------------------------------------------
+def _extract_with_lxml(html: str) -> list[HTMLTable]:
+    from lxml import html as lxml_html  # pylint: disable=import-outside-toplevel
+
+    if not html.strip():
+        return []
+
+    document = lxml_html.document_fromstring(html.encode("utf-8"), parser=lxml_html.HTMLParser(encoding="utf-8"))
+    for element in list(document.iter(*_NON_CONTENT_TAGS)):
+        element.drop_tree()
+
+    tables = []
+    for table in document.iter("table"):
+        rows = []
+        for row in table.iter("tr"):
+            team_name = None
+            for th in row.iter("th"):
+                if "team-name" in (th.get("class") or "").split():
+                    team_name_tag = next(th.iter("a"), None)
+                    if team_name_tag is not None:
+                        team_name = _strip_layout(team_name_tag.text_content())
+                    break
+
+            cells = [_strip_layout(col.text_content()) for col in row.iter("td")]
+            rows.append(TableRow(cells=cells, team_name=team_name))
+        tables.append(HTMLTable(rows=rows))
+
+    return tables
+
+
+# -------------------------------------------------------------------
+# selectolax
+# -------------------------------------------------------------------
+def _extract_with_selectolax(html: str) -> list[HTMLTable]:
+    from selectolax.lexbor import LexborHTMLParser  # pylint: disable=import-outside-toplevel,no-name-in-module
+
+    document = LexborHTMLParser(html)
+    document.strip_tags(list(_NON_CONTENT_TAGS))
+
+    tables = []
+    for table in document.css("table"):
+        rows = []
+        for row in table.css("tr"):
+            team_name = None
+            team_name_th = row.css_first("th.team-name")
+            if team_name_th is not None:
+                team_name_tag = team_name_th.css_first("a")
+                if team_name_tag is not None:
+                    team_name = _strip_layout(team_name_tag.text(deep=True))
+
+            cells = [_strip_layout(col.text(deep=True)) for col in row.css("td")]
+            rows.append(TableRow(cells=cells, team_name=team_name))
+        tables.append(HTMLTable(rows=rows))
+
+    return tables
+
+
+PARSER_BACKENDS: dict[str, Callable[[str], list[HTMLTable]]] = {
+    BS4_PARSER: _extract_with_bs4,
+    LXML_PARSER: _extract_with_lxml,
+    SELECTOLAX_PARSER: _extract_with_selectolax,
+}
+
+
+def resolve_parser(parser: str | None = None) -> str:
+    """
+    Resolve the parser backend to use.
+    Falls back to USPORTS_PARSER, then to html.parser when the backend's package is missing.
+    """
+    name = (parser or os.getenv(PARSER_ENV_VAR) or BS4_PARSER).lower()
+
+    if name not in PARSER_BACKENDS:
+        options = ", ".join(PARSER_BACKENDS)
+        raise ValueError(f"Invalid parser: {name}. Must be one of {options}")
+
+    if name != BS4_PARSER and importlib.util.find_spec(name) is None:
+        logger.debug(f"Parser '{name}' is not installed, falling back to {BS4_PARSER}")
+        return BS4_PARSER
+
+    return name
+
+
+@instrumented("tokenize")
+def extract_tables(html: str, parser: str | None = None) -> list[HTMLTable]:
+    """Tokenize a page once and return every <table> on it."""
+    return PARSER_BACKENDS[resolve_parser(parser)](html)
@@ -1,9 +1,11 @@
 """Functions:
 - usports_vball_teams: Fetch team statistics.
 - usports_vball_players: Fetch player statistics.
+- usports_vball_leaders: Fetch the top players in one stat category.
 - usports_vball_standings: Fetch team standings.
 
 These functions return pandas DataFrames with the requested statistics.
+Each has an async counterpart prefixed with 'a' (e.g. ausports_vball_players) for use inside a running event loop.
 
 Examples:
 >>> from usports.volleyball import usports_vball_teams, usports_vball_players, usports_vball_standings
@@ -16,6 +18,8 @@ Examples:
 >>> men_standings = usports_vball_standings('m')
 >>> women_standings = usports_vball_standings('w')
 
+>>> men_kill_leaders = usports_vball_leaders('m', 'k', n=10)
+
 Author:
     OJ Adeyemi
 
@@ -23,8 +27,41 @@ Date Created:
     August 2025
 """
 
-from .player_stats import usports_vball_players
-from .standings import usports_vball_standings
-from .team_stats import usports_vball_teams
+from typing import TYPE_CHECKING
+
+from usports.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .player_stats import (
+        ausports_vball_leaders,
+        ausports_vball_players,
+        usports_vball_leaders,
+        usports_vball_players,
+    )
+    from .standings import ausports_vball_standings, usports_vball_standings
+    from .team_stats import ausports_vball_teams, usports_vball_teams
+
+__all__ = [
+    "usports_vball_teams",
+    "ausports_vball_teams",
+    "usports_vball_players",
+    "ausports_vball_players",
+    "usports_vball_leaders",
+    "ausports_vball_leaders",
+    "usports_vball_standings",
+    "ausports_vball_standings",
+]
 
-__all__ = ["usports_vball_teams", "usports_vball_players", "usports_vball_standings"]
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".player_stats": [
+            "ausports_vball_leaders",
+            "ausports_vball_players",
+            "usports_vball_leaders",
+            "usports_vball_players",
+        ],
+        ".standings": ["ausports_vball_standings", "usports_vball_standings"],
+        ".team_stats": ["ausports_vball_teams", "usports_vball_teams"],
+    },
+)
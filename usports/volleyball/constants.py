@@ -87,3 +87,10 @@ PLAYER_SORT_CATEGORIES = [
     ("df", "bt"),  # total blocks
     ("sr", "sa"),  # service aces
 ]
+
+# Player stats table (index in VOLLEYBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING) ranked by each position's pages
+PLAYER_POSITION_TABLES = {
+    "of": 0,
+    "df": 1,
+    "sr": 2,
+}
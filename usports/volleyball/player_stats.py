@@ -1,50 +1,58 @@
 """Volleyball player stats"""
 
 import asyncio
+import logging
 from typing import Any
 
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
 from pandas.errors import EmptyDataError
 
-from usports.base.constants import BASE_URL, BS4_PARSER, VOLLEYBALL, get_season_urls
+from usports.base.constants import BASE_URL, VOLLEYBALL, get_season_urls
 from usports.base.exceptions import DataFetchError
 from usports.base.types import LeagueType, SeasonType
 from usports.utils import (
+    HTMLTable,
     clean_text,
     convert_types,
-    fetch_page_html,
+    fetch_page_tables,
+    instrumented,
+    memoize_frame,
     normalize_gender_arg,
-    setup_logging,
+    run_sync,
+    select_columns,
+    shaped_output,
+    tables_for_columns,
     validate_season_option,
 )
 
-from .constants import PLAYER_SORT_CATEGORIES, VOLLEYBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING
+from .constants import PLAYER_POSITION_TABLES, PLAYER_SORT_CATEGORIES, VOLLEYBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING
 from .standings import _get_sport_identifier
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
+_BASE_COLUMNS = ["lastname_initials", "first_name", "school", "matches_played", "sets_played"]
 
-def _parse_player_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dict[str, Any]]:
-    """Parse player stats data from an HTML table"""
+
+@instrumented("parse")
+def _parse_player_stats_table(table: HTMLTable, columns: list[str], limit: int | None = None) -> list[dict[str, Any]]:
+    """Parse player stats data from an HTML table, stopping after `limit` players when given."""
     table_data: list[dict[str, Any]] = []
-    rows: list[Tag] = soup.find_all("tr")  # type: ignore
 
-    for row in rows:
-        cols: list[Tag] = row.find_all("td")  # type: ignore
+    for row in table.rows:
+        cols = row.cells
 
         if len(cols) > 1:
             row_data = {}
-            row_data["player_name"] = clean_text(cols[1].get_text())
-            row_data["school"] = clean_text(cols[2].get_text())
-            row_data["matches_played"] = clean_text(cols[3].get_text())
-            row_data["sets_played"] = clean_text(cols[4].get_text())
+            row_data["player_name"] = clean_text(cols[1])
+            row_data["school"] = clean_text(cols[2])
+            row_data["matches_played"] = clean_text(cols[3])
+            row_data["sets_played"] = clean_text(cols[4])
 
             start_index = 5
             for i, col_name in enumerate(columns):
                 col_index = i + start_index
                 if col_index < len(cols):
-                    value = clean_text(cols[col_index].get_text())
+                    value = clean_text(cols[col_index])
 
                     if "percentage" in col_name or col_name == "hitting_percentage":
                         value = value.replace("%", "")
@@ -52,10 +60,13 @@ def _parse_player_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[d
                     row_data[col_name] = value
 
             table_data.append(row_data)
+            if limit is not None and len(table_data) >= limit:
+                break
 
     return table_data
 
 
+@instrumented("merge")
 def _merge_player_data(existing_data: list[dict[str, Any]], new_data: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Merge existing and new player data by (player_name, school, matches_played)."""
 
@@ -78,17 +89,21 @@ def _merge_player_data(existing_data: list[dict[str, Any]], new_data: list[dict[
     return list(data_dict.values())
 
 
-async def _fetching_player_stats(url: str) -> list[dict[str, Any]]:
-    """Fetch player stats from all three tables (offensive, defensive, serve/receive)"""
+async def _fetching_player_stats(
+    url: str, indices: list[int] | None = None, limit: int | None = None
+) -> list[dict[str, Any]]:
+    """
+    Fetch player stats from all three tables (offensive, defensive, serve/receive),
+    or only from those in `indices` when given.
+    """
     try:
-        tables_html = await fetch_page_html(url)
+        tables = await fetch_page_tables(url)
 
         all_data = []
 
         for i, column_mapping in enumerate(VOLLEYBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING):
-            if i < len(tables_html):
-                soup = BeautifulSoup(tables_html[i], BS4_PARSER)
-                table_data = _parse_player_stats_table(soup, list(column_mapping.keys()))
+            if i < len(tables) and (indices is None or i in indices):
+                table_data = _parse_player_stats_table(tables[i], list(column_mapping.keys()), limit)
                 all_data = _merge_player_data(all_data, table_data)
 
         return all_data
@@ -97,11 +112,13 @@ async def _fetching_player_stats(url: str) -> list[dict[str, Any]]:
         raise DataFetchError(f"Error fetching volleyball player stats: {e}") from e
 
 
-async def _get_players_stats_df(stats_url: str) -> pd.DataFrame:
+async def _get_players_stats_df(
+    stats_url: str, indices: list[int] | None = None, limit: int | None = None
+) -> pd.DataFrame:
     """Fetch player stats from a page and return a cleaned DataFrame."""
     logger.debug(f"Fetching player stats from: {stats_url[-15:]}")
 
-    player_stats = await _fetching_player_stats(stats_url)
+    player_stats = await _fetching_player_stats(stats_url, indices, limit)
 
     combined_type_mapping = {
         "player_name": str,
@@ -130,10 +147,10 @@ async def _get_players_stats_df(stats_url: str) -> pd.DataFrame:
     return df
 
 
-def _construct_player_urls(gender: str, season_option: str) -> list[str]:
+def _construct_player_urls(gender: str, season_option: str, season: str | None = None) -> list[str]:
     """Construct URLs for fetching volleyball player stats."""
     sport = _get_sport_identifier(gender)
-    season_urls = get_season_urls(VOLLEYBALL)
+    season_urls = get_season_urls(VOLLEYBALL, season)
     season = validate_season_option(season_option, season_urls)
 
     player_stats_url_template = f"{BASE_URL}/{sport}/{season}/players?pos={{position}}&sort={{sort_category}}"
@@ -146,10 +163,10 @@ def _construct_player_urls(gender: str, season_option: str) -> list[str]:
     return urls
 
 
-async def _fetch_and_merge_player_stats(urls: list[str]) -> pd.DataFrame:
+async def _fetch_and_merge_player_stats(urls: list[str], indices: list[int] | None = None) -> pd.DataFrame:
     """Fetch and merge player stats from multiple URLs."""
     all_df: list[pd.DataFrame] = []
-    tasks = [_get_players_stats_df(url) for url in urls]
+    tasks = [_get_players_stats_df(url, indices) for url in urls]
     results = await asyncio.gather(*tasks)
     all_df.extend(results)
 
@@ -169,9 +186,36 @@ async def _fetch_and_merge_player_stats(urls: list[str]) -> pd.DataFrame:
     return merged_df
 
 
+@shaped_output
+@memoize_frame
+async def ausports_vball_players(
+    league: LeagueType,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_vball_players, for use inside a running event loop."""
+    gender = normalize_gender_arg(league)
+    season_option = season_option.lower()  # type: ignore
+
+    indices = None
+    if columns is not None:
+        indices = tables_for_columns(columns, VOLLEYBALL_PLAYER_STATS_COLUMNS_TYPE_MAPPING, _BASE_COLUMNS)
+
+    urls = _construct_player_urls(gender, season_option, season)
+
+    logger.debug(f"Fetching {league} volleyball {season_option} player stats")
+
+    df = await _fetch_and_merge_player_stats(urls, indices)
+
+    return df if columns is None else select_columns(df, columns)
+
+
 def usports_vball_players(
     league: LeagueType,
     season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame:
     """
     Fetch and process volleyball player statistics data from the USports website.
@@ -182,18 +226,67 @@ def usports_vball_players(
             - 'regular': Regular season statistics (default).
             - 'playoffs': Playoff season statistics.
             - 'championship': Championship season statistics.
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
+        columns: Only return these stat columns (plus the player's name and school). Every page is
+            still fetched, but only the stat tables that carry them are parsed.
 
     Returns:
         DataFrame: DataFrame containing processed player statistics with offensive,
                   defensive, and serve/receive stats.
     """
+    return run_sync(ausports_vball_players(league, season_option, season, columns))
+
+
+@shaped_output
+@memoize_frame
+async def ausports_vball_leaders(
+    league: LeagueType,
+    category: str,
+    n: int = 10,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_vball_leaders, for use inside a running event loop."""
+    sort_categories = [sort for _, sort in PLAYER_SORT_CATEGORIES]
+    if category not in sort_categories:
+        raise ValueError(f"Invalid category: {category}. Must be one of {', '.join(sort_categories)}")
+    if n < 1:
+        raise ValueError(f"n must be at least 1, got {n}")
+
     gender = normalize_gender_arg(league)
     season_option = season_option.lower()  # type: ignore
+    page = sort_categories.index(category)
+    position, _ = PLAYER_SORT_CATEGORIES[page]
 
-    urls = _construct_player_urls(gender, season_option)
+    url = _construct_player_urls(gender, season_option, season)[page]
 
-    logger.debug(f"Fetching {league} volleyball {season_option} player stats")
+    logger.debug(f"Fetching {league} volleyball {season_option} top {n} players by {category}")
 
-    df = asyncio.run(_fetch_and_merge_player_stats(urls))
+    # The page is already sorted by the category, so the first n rows of its position's table are the leaders
+    df = await _get_players_stats_df(url, [PLAYER_POSITION_TABLES[position]], limit=n)
 
-    return df
+    return df.head(n).reset_index(drop=True)
+
+
+def usports_vball_leaders(
+    league: LeagueType,
+    category: str,
+    n: int = 10,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+) -> pd.DataFrame:
+    """
+    Fetch the top volleyball players in one stat category from the single page sorted by it.
+
+    Args:
+        league: Gender of the players. Accepts 'm' or 'w' (case insensitive).
+        category: Sort category: 'k' (kills), 'a' (assists), 'pts' (points), 'd' (digs),
+            'bt' (total blocks) or 'sa' (service aces).
+        n: Number of players to return (default 10).
+        season_option: 'regular' (default), 'playoffs' or 'championship'.
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
+
+    Returns:
+        DataFrame: The top `n` players in leaderboard order, with the stats of the table the category ranks.
+    """
+    return run_sync(ausports_vball_leaders(league, category, n, season_option, season))
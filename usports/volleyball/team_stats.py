@@ -1,21 +1,26 @@
 """Volleyball team performance stats (no W/L)."""
 
-import asyncio
+import logging
 from typing import Any
 
 import pandas as pd
-from bs4 import BeautifulSoup, Tag
 
-from usports.base.constants import BASE_URL, BS4_PARSER, VOLLEYBALL, get_season_urls
+from usports.base.constants import BASE_URL, VOLLEYBALL, get_season_urls
 from usports.base.exceptions import DataFetchError
 from usports.base.types import LeagueType, SeasonType
 from usports.utils import (
+    HTMLTable,
     _merge_team_data,
     clean_text,
     convert_types,
-    fetch_page_html,
+    fetch_page_tables,
+    instrumented,
+    memoize_frame,
     normalize_gender_arg,
-    setup_logging,
+    run_sync,
+    select_columns,
+    shaped_output,
+    tables_for_columns,
     validate_season_option,
 )
 from usports.utils.helpers import get_conference_mapping_for_league
@@ -23,21 +28,23 @@ from usports.utils.helpers import get_conference_mapping_for_league
 from .constants import VOLLEYBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING
 from .standings import _get_sport_identifier
 
-logger = setup_logging()
+logger = logging.getLogger(__name__)
 
+_BASE_COLUMNS = ["team_name", "matches_played", "sets_played", "conference"]
 
-def _parse_team_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dict[str, Any]]:
+
+@instrumented("parse")
+def _parse_team_stats_table(table: HTMLTable, columns: list[str]) -> list[dict[str, Any]]:
     """Parse team stats data from an HTML table"""
     table_data: list[dict[str, Any]] = []
-    rows: list[Tag] = soup.find_all("tr")[1:]  # type: ignore
 
-    for row in rows:
-        cols: list[Tag] = row.find_all("td")  # type: ignore
+    for row in table.rows[1:]:
+        cols = row.cells
         if len(cols) > 1:
             row_data = {}
-            team_name = clean_text(cols[1].get_text())
-            matches = clean_text(cols[2].get_text())
-            sets = clean_text(cols[3].get_text())
+            team_name = clean_text(cols[1])
+            matches = clean_text(cols[2])
+            sets = clean_text(cols[3])
 
             row_data["team_name"] = team_name
             row_data["matches_played"] = matches
@@ -46,7 +53,7 @@ def _parse_team_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dic
             for j, col in enumerate(columns):
                 col_index = j + 4
                 if col_index < len(cols):
-                    value = cols[col_index].get_text().strip()
+                    value = cols[col_index].strip()
 
                     if "percentage" in col or col == "hitting_percentage":
                         value = value.replace("%", "")
@@ -58,17 +65,16 @@ def _parse_team_stats_table(soup: BeautifulSoup, columns: list[str]) -> list[dic
     return table_data
 
 
-async def _fetching_team_stats(url: str) -> list[dict[str, Any]]:
-    """Fetch team stats data from a given URL."""
+async def _fetching_team_stats(url: str, indices: list[int] | None = None) -> list[dict[str, Any]]:
+    """Fetch team stats data from a given URL (only the stat tables in `indices`, when given)."""
     try:
-        tables_html = await fetch_page_html(url)
+        tables = await fetch_page_tables(url)
 
         all_data = []
 
         for i, column_mapping in enumerate(VOLLEYBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING):
-            if i < len(tables_html):
-                soup = BeautifulSoup(tables_html[i], BS4_PARSER)
-                table_data = _parse_team_stats_table(soup, list(column_mapping.keys()))
+            if i < len(tables) and (indices is None or i in indices):
+                table_data = _parse_team_stats_table(tables[i], list(column_mapping.keys()))
                 all_data = _merge_team_data(all_data, table_data)
 
         return all_data
@@ -77,9 +83,9 @@ async def _fetching_team_stats(url: str) -> list[dict[str, Any]]:
         raise DataFetchError(f"Error fetching volleyball team stats: {e}") from e
 
 
-async def _get_team_stats_df(stats_url: str) -> pd.DataFrame:
+async def _get_team_stats_df(stats_url: str, indices: list[int] | None = None) -> pd.DataFrame:
     """Process team stats into a pandas DataFrame"""
-    team_stats = await _fetching_team_stats(stats_url)
+    team_stats = await _fetching_team_stats(stats_url, indices)
     df = pd.DataFrame(team_stats)
 
     combined_type_mapping: dict[str, type] = {
@@ -110,22 +116,46 @@ async def _get_team_stats_df(stats_url: str) -> pd.DataFrame:
     return df
 
 
-async def _fetch_team_stats(league: LeagueType, season: SeasonType) -> pd.DataFrame:
+async def _fetch_team_stats(
+    league: LeagueType,
+    season_option: SeasonType,
+    season: str | None = None,
+    indices: list[int] | None = None,
+) -> pd.DataFrame:
     """Fetch team performance stats."""
     gender = normalize_gender_arg(league)
     sport = _get_sport_identifier(gender)
-    season_urls = get_season_urls(VOLLEYBALL)
-    season_url = validate_season_option(season, season_urls)
+    season_urls = get_season_urls(VOLLEYBALL, season)
+    season_url = validate_season_option(season_option, season_urls)
     team_stats_url = f"{BASE_URL}/{sport}/{season_url}/teams"
 
-    logger.debug(f"FETCHING {gender.upper()} VOLLEYBALL {season.upper()} TEAM STATISTICS")
+    logger.debug(f"FETCHING {gender.upper()} VOLLEYBALL {season_option.upper()} TEAM STATISTICS")
 
-    return await _get_team_stats_df(team_stats_url)
+    return await _get_team_stats_df(team_stats_url, indices)
+
+
+@shaped_output
+@memoize_frame
+async def ausports_vball_teams(
+    league: LeagueType,
+    season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Async counterpart of usports_vball_teams, for use inside a running event loop."""
+    season_option = season_option.lower()  # type: ignore
+    if columns is None:
+        return await _fetch_team_stats(league, season_option, season)
+
+    indices = tables_for_columns(columns, VOLLEYBALL_TEAM_STATS_COLUMNS_TYPE_MAPPING, _BASE_COLUMNS)
+    return select_columns(await _fetch_team_stats(league, season_option, season, indices), columns)
 
 
 def usports_vball_teams(
     league: LeagueType,
     season_option: SeasonType = "regular",
+    season: str | None = None,
+    columns: list[str] | None = None,
 ) -> pd.DataFrame:
     """
     Get volleyball team stats.
@@ -133,9 +163,10 @@ def usports_vball_teams(
     Args:
         league: 'm' or 'w'
         season_option: 'regular', 'playoffs', or 'championship'
+        season: Season to fetch, e.g. '2019-20'. Defaults to the current season.
+        columns: Only return these stat columns (plus team_name), parsing only the tables that carry them.
 
     Returns:
         DataFrame with team stats including offensive, defensive, and serve/receive statistics
     """
-    season_option = season_option.lower()  # type: ignore
-    return asyncio.run(_fetch_team_stats(league, season_option))
+    return run_sync(ausports_vball_teams(league, season_option, season, columns))
@@ -0,0 +1,197 @@
+"""Watch mode: re-poll tables on an interval and report only what changed."""
+
+import asyncio
+import dataclasses
+import hashlib
+import logging
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+from usports.base.constants import DEFAULT_WATCH_INTERVAL
+from usports.base.types import LeagueType, SeasonType
+from usports.batch import BatchKey, KindType, _run_job, plan_batch
+from usports.utils import (
+    SnapshotStore,
+    fresh_results,
+    get_session,
+    recorded_pages,
+    request_limits,
+    run_sync,
+    shared_pages,
+)
+from usports.utils.helpers import _fetch_page_text
+from usports.utils.limits import get_limits_override
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ChangeEvent:
+    """A watched table that changed: the whole current table and the rows that are new or updated."""
+
+    key: BatchKey
+    frame: pd.DataFrame
+    changed: pd.DataFrame
+    removed: list[str] = field(default_factory=list)
+
+
+def _body_hash(body: str) -> str:
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+def _snapshot_kind(key: BatchKey) -> str:
+    _, _, kind, season_option = key
+    return kind if season_option is None else f"{kind}:{season_option}"
+
+
+class _WatchState:
+    """The pages each watched table was built from, and the hash of each page body."""
+
+    def __init__(self, plan: list[BatchKey], store: SnapshotStore) -> None:
+        self.plan = plan
+        self.store = store
+        self.pages: dict[BatchKey, set[str]] = {}
+        self.hashes: dict[str, str] = {}
+
+    async def _probe(self) -> tuple[dict[str, str], set[str]]:
+        """Re-download every known page (conditionally, when a response cache is set) and find the changed ones."""
+        urls = sorted(set().union(*self.pages.values()))
+        probes = (_fetch_page_text(url, revalidate=True) for url in urls)
+        results = await asyncio.gather(*probes, return_exceptions=True)
+
+        bodies: dict[str, str] = {}
+        changed: set[str] = set()
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Could not poll {url}: {result}")
+                continue
+            bodies[url] = result
+            if _body_hash(result) != self.hashes.get(url):
+                changed.add(url)
+
+        return bodies, changed
+
+    async def _refresh(self, key: BatchKey, bodies: dict[str, str]) -> ChangeEvent | None:
+        with recorded_pages(bodies) as urls:
+            df = await _run_job(key)
+
+        self.pages[key] = urls
+        sport, league, _, _ = key
+        diff = self.store.record(df, sport, league, _snapshot_kind(key))
+        if diff.unchanged:
+            return None
+        return ChangeEvent(key, df, diff.changed, diff.removed)
+
+    async def poll(self, skip_errors: bool) -> list[ChangeEvent]:
+        """
+        One polling pass. Tables whose pages all hash the same as last time are skipped without
+        parsing; the others are rebuilt from the bodies just downloaded and diffed with their snapshot.
+        """
+        bodies, changed = await self._probe() if self.pages else ({}, set())
+        stale = [key for key in self.plan if key not in self.pages or self.pages[key] & changed]
+        logger.debug(f"{len(stale)} of {len(self.plan)} watched tables changed")
+
+        with fresh_results(), shared_pages():
+            refreshes = (self._refresh(key, bodies) for key in stale)
+            results = await asyncio.gather(*refreshes, return_exceptions=skip_errors)
+
+        events = []
+        for key, result in zip(stale, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Skipping {key}: {result}")
+                # Rebuilt on the next pass even if its pages then hash the same as the ones probed now
+                self.pages.pop(key, None)
+                continue
+            # Only pages a table was rebuilt from are marked as seen; one that failed counts as changed next time
+            for url in self.pages[key]:
+                if url in bodies:
+                    self.hashes[url] = _body_hash(bodies[url])
+                else:
+                    self.hashes.pop(url, None)
+            if result is not None:
+                events.append(result)
+
+        return events
+
+
+async def awatch(
+    sports: Iterable[str] | None = None,
+    leagues: Iterable[LeagueType] = ("m", "w"),
+    kinds: Iterable[KindType] | None = None,
+    seasons: Iterable[SeasonType] = ("regular",),
+    interval: float = DEFAULT_WATCH_INTERVAL,
+    store: SnapshotStore | None = None,
+    max_polls: int | None = None,
+    max_concurrency: int | None = None,
+    skip_errors: bool = True,
+) -> AsyncIterator[ChangeEvent]:
+    """Async counterpart of watch: an async iterator of change events."""
+    state = _WatchState(plan_batch(sports, leagues, kinds, seasons), store or SnapshotStore(":memory:"))
+
+    limits = get_limits_override() or get_session().request_limits
+    if max_concurrency is not None:
+        limits = dataclasses.replace(limits, max_concurrency=max_concurrency)
+
+    polls = 0
+    while max_polls is None or polls < max_polls:
+        if polls:
+            await asyncio.sleep(interval)
+        polls += 1
+
+        with request_limits(limits.max_concurrency, limits.rate_limit, limits.burst):
+            events = await state.poll(skip_errors)
+
+        for event in events:
+            yield event
+
+
+def watch(
+    callback: Callable[[ChangeEvent], None],
+    sports: Iterable[str] | None = None,
+    leagues: Iterable[LeagueType] = ("m", "w"),
+    kinds: Iterable[KindType] | None = None,
+    seasons: Iterable[SeasonType] = ("regular",),
+    interval: float = DEFAULT_WATCH_INTERVAL,
+    store: SnapshotStore | None = None,
+    max_polls: int | None = None,
+    max_concurrency: int | None = None,
+    skip_errors: bool = True,
+) -> None:
+    """
+    Re-poll tables every `interval` seconds and call `callback` for each table that changed.
+
+    Each pass re-downloads only the pages the tables were built from, conditionally when the
+    session has a response cache, and hashes their bodies: tables whose pages did not change are
+    not parsed again. Rebuilt tables are diffed with their last snapshot and reported only when
+    rows changed. The first pass reports every table in full (with a persistent `store`, only what
+    changed since the previous run).
+
+    The callback runs on the calling thread between polling passes, so it may call the other
+    usports functions. The next pass starts `interval` seconds after the last callback returns.
+
+    Args:
+        callback: Called with a ChangeEvent (key, frame, changed rows, removed row keys) per changed table.
+        sports, leagues, kinds, seasons: The tables to watch, as in fetch_all.
+        interval: Seconds to wait between polling passes.
+        store: SnapshotStore that keeps the snapshots across runs. Defaults to an in-memory store.
+        max_polls: Stop after this many passes. Defaults to polling forever.
+        max_concurrency: Override the maximum number of page requests in flight.
+        skip_errors: Log and keep watching when a table fails (the default) instead of raising.
+
+    >>> watch(lambda event: print(event.key, len(event.changed)), sports=["basketball"], kinds=["standings"])
+    """
+
+    events = awatch(sports, leagues, kinds, seasons, interval, store, max_polls, max_concurrency, skip_errors)
+
+    async def next_event() -> ChangeEvent | None:
+        return await anext(events, None)
+
+    # Events are pulled one at a time so the callback runs on the calling thread while the
+    # session's event loop is idle: it can call the sync usports_* functions
+    try:
+        while (event := run_sync(next_event())) is not None:
+            callback(event)
+    finally:
+        run_sync(events.aclose())